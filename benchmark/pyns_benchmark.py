@@ -0,0 +1,220 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+benchmark suite of the hot paths of the package.
+All the data are produced by seeded random generators, so that two runs with the same seed
+measure exactly the same workload, and the timings are written to a JSON file.
+
+usage:  python benchmark/pyns_benchmark.py [--seed S] [--repeat R] [--scale K] [--output FILE] [--compare FILE]
+"""
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import subprocess
+from statistics import median
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))   # cartella principale del repository
+sys.path.insert(0, ROOT)
+
+from pyns.ns_universe import NSuniverse
+from pyns.ns_set import NSset
+from pyns.ns_family import NSfamily
+from pyns.ns_mapping import NSmapping
+
+
+#------------------ generatori di dati casuali
+
+# genera un universo di n elementi
+def random_universe(n, prefix="u"):
+    return NSuniverse([f"{prefix}{i}" for i in range(n)])
+
+
+# genera una lista di n triple di gradi arrotondati a due cifre decimali
+def random_triples(rng, n):
+    return [(round(rng.random(), 2), round(rng.random(), 2), round(rng.random(), 2)) for i in range(n)]
+
+
+# converte una lista di triple nella stringa accettata dal costruttore di NSset
+def triples_to_string(triples):
+    return ", ".join(f"({mu},{sigma},{omega})" for (mu, sigma, omega) in triples)
+
+
+# genera un insieme neutrosofico casuale su un universo
+def random_set(rng, universe):
+    return NSset(universe, random_triples(rng, universe.cardinality()))
+
+
+# genera una lista di k insiemi neutrosofici casuali di cui circa una frazione duplicate è ripetuta
+def random_sets(rng, universe, k, duplicates=0.0):
+    sets = [random_set(rng, universe) for i in range(k)]
+    for i in range(int(k * duplicates)):
+        sets[rng.randrange(k)] = NSset(sets[rng.randrange(k)])
+    return sets
+
+
+# genera una funzione casuale tra due universi
+def random_mapping(rng, domain, codomain):
+    values = codomain.get()
+    return NSmapping(domain, codomain, [rng.choice(values) for u in domain.get()])
+
+
+#------------------ misura dei tempi
+
+# esegue repeat volte una funzione e restituisce le statistiche dei tempi in secondi
+def measure(function, repeat):
+    times = list()
+    for r in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": median(times), "mean": sum(times) / len(times), "runs": times}
+
+
+# restituisce l'identificativo del commit corrente (o None al di fuori di un repository git)
+def current_commit():
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+#------------------ casi di prova
+
+# ogni gruppo di casi di prova ha una propria funzione, in modo che le funzioni misurate
+# non condividano le variabili (universi, insiemi) dei gruppi successivi
+
+# costruzione di insiemi neutrosofici
+def construction_cases(rng, scale):
+    cases = list()
+    n = 2000 * scale
+    U = random_universe(n)
+    triples = random_triples(rng, n)
+    text = triples_to_string(triples)
+    cases.append(("NSset from string", {"n": n}, lambda: NSset(U, text)))
+    cases.append(("NSset from list", {"n": n}, lambda: NSset(U, triples)))
+    cases.append(("NSset from universe", {"n": n}, lambda: NSset(U)))
+    return cases
+
+
+# operazioni insiemistiche
+def operation_cases(rng, scale):
+    cases = list()
+    n = 20000 * scale
+    U = random_universe(n)
+    A = random_set(rng, U)
+    B = random_set(rng, U)
+    C = A & B
+    cases.append(("NSset union", {"n": n}, lambda: A + B))
+    cases.append(("NSset intersection", {"n": n}, lambda: A & B))
+    cases.append(("NSset complement", {"n": n}, lambda: ~A))
+    cases.append(("NSset isNSsubset", {"n": n}, lambda: C.isNSsubset(A)))
+    return cases
+
+
+# costruzione di famiglie con eliminazione dei duplicati
+def family_cases(rng, scale):
+    (n, k) = (20, 500 * scale)
+    U = random_universe(n)
+    sets = random_sets(rng, U, k, duplicates=0.3)
+    return [("NSfamily construction", {"n": n, "k": k}, lambda: NSfamily(sets))]
+
+
+# basi e topologie
+def topology_cases(rng, scale):
+    cases = list()
+    (n, k) = (10, 8)
+    U = random_universe(n)
+    subbase = NSfamily(random_sets(rng, U, k))
+    cases.append(("NSfamily getNSBase", {"n": n, "k": k}, lambda: subbase.getNSBase()))
+    (n, k) = (10, 10)
+    V = random_universe(n)
+    base = NSfamily(random_sets(rng, V, k))
+    cases.append(("NSfamily getNSTopologyByBase", {"n": n, "k": k}, lambda: base.getNSTopologyByBase()))
+    (n, k) = (10, 4)
+    W = random_universe(n)
+    topology = NSfamily(random_sets(rng, W, k)).getNSTopologyBySubBase()
+    cases.append(("NSfamily isNeutrosophicTopology", {"n": n, "k": k, "open sets": topology.cardinality()},
+                  lambda: topology.isNeutrosophicTopology()))
+    return cases
+
+
+# immagini e controimmagini
+def mapping_cases(rng, scale):
+    cases = list()
+    (n, m) = (20000 * scale, 2000 * scale)
+    X = random_universe(n, "x")
+    Y = random_universe(m, "y")
+    f = random_mapping(rng, X, Y)
+    A = random_set(rng, X)
+    B = random_set(rng, Y)
+    f.NSimage(A)   # costruisce gli indici della funzione fuori dalla misura
+    cases.append(("NSmapping NSimage", {"n": n, "m": m}, lambda: f.NSimage(A)))
+    cases.append(("NSmapping NScounterimage", {"n": n, "m": m}, lambda: f.NScounterimage(B)))
+    return cases
+
+
+# restituisce la lista dei casi di prova come terne (nome, parametri, funzione da misurare)
+def benchmarks(seed, scale):
+    rng = random.Random(seed)
+    cases = list()
+    for group in (construction_cases, operation_cases, family_cases, topology_cases, mapping_cases):
+        cases.extend(group(rng, scale))
+    return cases
+
+
+#------------------ programma principale
+
+# stampa il confronto tra i tempi mediani correnti e quelli di un'esecuzione precedente
+def compare(results, previous):
+    old = {r["name"]: r for r in previous["results"]}
+    print(f"\ncomparison with commit {previous.get('commit')}:")
+    for r in results:
+        if r["name"] in old and old[r["name"]]["parameters"] == r["parameters"]:
+            ratio = r["median"] / old[r["name"]]["median"]
+            print(f"  {r['name']:<36} {ratio:8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark suite of the Python Neutrosophic Sets package")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the random data generators")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs of each case")
+    parser.add_argument("--scale", type=int, default=1, help="multiplier of the size of the large cases")
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmark", "pyns_benchmark.json"),
+                        help="JSON file receiving the results (by default benchmark/pyns_benchmark.json)")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare with")
+    args = parser.parse_args()
+
+    results = list()
+    for (name, parameters, function) in benchmarks(args.seed, args.scale):
+        stats = measure(function, args.repeat)
+        results.append({"name": name, "parameters": parameters, **stats})
+        print(f"{name:<38} {stats['median'] * 1000:10.2f} ms   {parameters}")
+
+    report = {"commit": current_commit(),
+              "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "seed": args.seed,
+              "repeat": args.repeat,
+              "scale": args.scale,
+              "results": results}
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nresults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
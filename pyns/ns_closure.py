@@ -0,0 +1,118 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+ns_closure.py
+Functions shared by the in-memory and the out-of-core families of neutrosophic sets which check their closure
+under neutrosophic union or intersection and the axioms of a neutrosophic topology, and which describe the results
+as NSclosureReport objects. A family gives access to the degrees of its sets by position and tells
+whether the degrees resulting from a combination of its sets belong to it.
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+"""
+from .ns_set import NSset
+from .ns_closurereport import NSclosureReport
+from itertools import combinations
+from functools import reduce
+from time import time
+
+
+# cerca una combinazione di insiemi il cui risultato non appartiene alla famiglia
+def searchCounterexample(storage, l, belongs, operation, sizes, progress, checkpoint):
+    """
+    Checks one at a time, in lexicographic order, the combinations of the given sizes of the sets of a family
+    until the result of the operation on one of them does not belong to the family.
+    ----
+    Parameters:
+    - storage: function returning the NSstorage object of the degrees of the set of a given position
+    - l: number of sets of the family
+    - belongs: function telling whether an NSstorage object holds the degrees of a set of the family
+    - operation: operation between two NSstorage objects (NSstorage.union or NSstorage.intersection)
+    - sizes: numbers of sets of the combinations to check
+    - progress: NSprogress object notified whenever the number of combinations examined reaches the checkpoint
+    - checkpoint: number of combinations examined at which progress is notified for the first time
+    ----
+    Returns: the pair formed by the tuple of the positions of the sets of the first combination whose result
+             does not belong to the family (or None) and by the number of combinations examined
+    """
+    k = 0   # numero di combinazioni esaminate
+    for i in sizes:
+        for combin in combinations(range(l), i):
+            k += 1
+            if k >= checkpoint:   # senza funzione di notifica il punto di controllo non viene mai raggiunto
+                checkpoint = progress.update(k)
+            # Calcola l'operazione (unione o intersezione) sui gradi dei sottoinsiemi nella combinazione
+            if not belongs(reduce(operation, [storage(j) for j in combin])):
+                return combin, k   # il risultato non è presente nella famiglia
+    return None, k   # tutti i risultati sono presenti, la famiglia è chiusa rispetto all'operazione
+
+
+# verifica la chiusura di una famiglia rispetto a un'operazione
+def closureReport(sets, search, setoperation, operation_name, total, progress):
+    """
+    Runs the search of a counterexample to the closure of a family under an operation and describes its result.
+    ----
+    Parameters:
+    - sets: the sets of the family, accessed by position only to materialize the counterexample
+    - search: function receiving the first checkpoint of progress and returning the pair formed by the tuple
+              of the positions of the sets of a counterexample (or None) and by the number of combinations examined
+    - setoperation: the operation as a function of two NSset objects, used only to build the missing result
+    - operation_name: name of the operation ("union" or "intersection")
+    - total: number of combinations to check
+    - progress: NSprogress object receiving the events of the verification
+    ----
+    Returns: the NSclosureReport object of the verification
+    """
+    start_time = time()
+    checkpoint = progress.start(operation_name, total)
+    (counterexample, examined) = search(checkpoint)
+    elapsed = time() - start_time
+    progress.finish(examined, success=counterexample is None)
+    if counterexample is None:
+        return NSclosureReport(operation_name, examined=examined, total=total, elapsed=elapsed)
+    combination = tuple(sets[i] for i in counterexample)
+    return NSclosureReport(operation_name, combination, reduce(setoperation, combination), examined, total, elapsed)
+
+
+# verifica gli assiomi di una topologia neutrosofica
+def topologyReport(family, universe, unionclosed, intersectionclosed, progress):
+    """
+    Checks if a family satisfies the axioms of a neutrosophic topology, i.e. if it contains the empty
+    and the absolute neutrosophic sets and it is closed under neutrosophic union and intersection.
+    ----
+    Parameters:
+    - family: the family of neutrosophic sets (supporting the operator in)
+    - universe: the universe set of the family
+    - unionclosed: function receiving progress and returning the NSclosureReport of the closure under union
+    - intersectionclosed: function receiving progress and returning the NSclosureReport of the closure
+                          under intersection
+    - progress: NSprogress object receiving the events of both the closure checks and, if the family
+                is a topology, the timing event of the whole verification
+    ----
+    Returns: the NSclosureReport object of the verification (a missing empty set is reported
+             as the union of no set and a missing absolute set as the intersection of no set)
+    """
+    start_time = time()
+    # Controllo se l'insieme vuoto è presente nella famiglia
+    empty = NSset.EMPTY(universe)
+    # Controllo se l'insieme universo è presente nella famiglia
+    absolute = NSset.ABSOLUTE(universe)
+    if empty not in family:
+        result = NSclosureReport("union", (), empty, elapsed=time() - start_time)
+    elif absolute not in family:
+        result = NSclosureReport("intersection", (), absolute, elapsed=time() - start_time)
+    else:
+        # Verifica la proprietà di chiusura rispetto all'unione
+        result = unionclosed(progress)
+        (examined, total) = (result.getExamined(), 2 * result.getTotal())
+        # Verifica la proprietà di chiusura rispetto all'intersezione
+        if result:
+            result = intersectionclosed(progress)
+            examined += result.getExamined()
+        operation = result.getOperation() if not result else "topology"
+        result = NSclosureReport(operation, result.getCombination(), result.getResult(), examined, total,
+                                 time() - start_time)
+    # Se tutti i controlli passano, la famiglia è una topologia neutrosofica
+    if result:
+        progress.start("topology", result.getTotal(), start_time)
+        progress.timing(result.getExamined(), success=True)
+    return result
@@ -0,0 +1,121 @@
+class NSclosureReport:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_closurereport.py
+    Class defining the result of the verification of the closure of a neutrosophic family under
+    neutrosophic union or intersection (or of the axioms of a neutrosophic topology), which holds
+    the counterexample found, if any, together with the number of combinations examined and the time spent.
+    The report is true if and only if the verification was positive.
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    # costruttore
+    def __init__(self, operation, combination=None, result=None, examined=0, total=0, elapsed=0.0):
+        """
+        Constructor of the report of a closure verification.
+        ----
+        Parameters:
+        - operation: name of the operation checked ("union", "intersection" or "topology")
+        - combination: tuple of the neutrosophic sets of the family whose result does not belong to the family
+                       (the empty tuple if the missing set is the empty or the absolute one), or None
+        - result: the neutrosophic set which does not belong to the family, or None if the verification was positive
+        - examined: number of combinations of sets examined
+        - total: total number of combinations to examine
+        - elapsed: time spent in seconds
+        """
+        self.__operation = operation
+        self.__combination = combination
+        self.__result = result
+        self.__examined = examined
+        self.__total = total
+        self.__elapsed = elapsed
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce il nome dell'operazione verificata
+    def getOperation(self):
+        """
+        Method that returns the name of the operation checked ("union", "intersection" or "topology")
+        """
+        return self.__operation
+
+
+    # restituisce la combinazione di insiemi del controesempio
+    def getCombination(self):
+        """
+        Method that returns the tuple of the sets of the family whose result does not belong to the family
+        (the empty tuple for the empty set, i.e. the union of no set, and for the absolute set,
+        i.e. the intersection of no set), or None if the verification was positive
+        """
+        return self.__combination
+
+
+    # restituisce l'insieme neutrosofico mancante
+    def getResult(self):
+        """
+        Method that returns the neutrosophic set which does not belong to the family,
+        or None if the verification was positive
+        """
+        return self.__result
+
+
+    # restituisce il numero di combinazioni esaminate
+    def getExamined(self):
+        """
+        Method that returns the number of combinations of sets examined
+        """
+        return self.__examined
+
+
+    # restituisce il numero totale di combinazioni da esaminare
+    def getTotal(self):
+        """
+        Method that returns the total number of combinations to examine
+        """
+        return self.__total
+
+
+    # restituisce il tempo impiegato
+    def getElapsed(self):
+        """
+        Method that returns the time spent by the verification in seconds
+        """
+        return self.__elapsed
+
+
+    # verifica se l'esito è positivo
+    def isClosed(self):
+        """
+        Method that returns True if the verification was positive, i.e. if no counterexample was found
+        """
+        return self.__result is None
+
+
+    # esito della verifica col metodo speciale __bool__
+    def __bool__(self):
+        return self.isClosed()
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce il resoconto come stringa col metodo speciale __str__
+    def __str__(self):
+        """
+        Method that returns the report in string format for the user
+        """
+        status = "positive" if self.isClosed() else "negative"
+        text = (f"Verification of closure under neutrosophic {self.__operation} was {status}: "
+                f"{self.__examined} / {self.__total} combinations examined in {self.__elapsed:.2f} seconds")
+        if not self.isClosed():
+            names = [A.getName() or str(A) for A in self.__combination]
+            name = self.__result.getName()
+            text += f"\nthe {self.__operation} of {names} is " if names else "\nthe set "
+            text += f"{name + ' = ' if name else ''}{self.__result} which does not belong to the family"
+        return text
+
+
+    # restituisce il resoconto come stringa col metodo speciale __repr__
+    def __repr__(self):
+        return (f"NSclosureReport(operation={self.__operation!r}, closed={self.isClosed()}, "
+                f"examined={self.__examined}, total={self.__total}, elapsed={self.__elapsed:.6f})")
@@ -1,11 +1,24 @@
 from .ns_universe import NSuniverse
 from .ns_set import NSset
+from .ns_storage import NSstorage
+from .ns_packedfamily import NSpackedfamily
+from .ns_mappedfamily import NSmappedfamily
+from .ns_parallel import initClosureWorker, checkClosureChunk
+from .ns_closure import searchCounterexample, closureReport, topologyReport
+from .ns_progress import NSprogress
+from .ns_label import NSlabel
 #--
-from .ns_util import NSreplace, NSstringToDict, NSisExtDict, nameToBB, isBB
+from .ns_util import NSreplace, NSstringToDict, NSisExtDict, nameToBB, isBB, complementName, NSreadCSV, NSwriteCSV
 import inspect
 from itertools import combinations
 from functools import reduce
-from time import time
+from array import array
+from operator import le
+from os import cpu_count, remove
+from multiprocessing import get_context, Manager
+from tempfile import NamedTemporaryFile
+from uuid import uuid4
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
 
 class NSfamily:
     """
@@ -17,6 +30,8 @@ class NSfamily:
     www.nordo.it   |  giorgio.nordo@unime.it
     """
 
+    parallelthreshold = 20000  # minimum number of combinations for which a closure check is made in parallel
+
     # costruttore
     def __init__(self, *args):
         """
@@ -27,6 +42,7 @@ class NSfamily:
         - args: generic argument which can be an element referable a neutrosophic set
         """
         neutrosophicfamily = list()    # lista che contiene gli oggetti insiemi neutrosofici
+        index = dict()    # indice hash che associa la forma canonica di ogni insieme alla sua posizione
         #--------------------
         length = len(args)
         if length == 0:
@@ -37,25 +53,43 @@ class NSfamily:
             elem = args[0]
             if type(elem) == NSset:   #---- singolo oggetto insieme neutrosofico
                 neutrosophicfamily = [elem]
+                index[elem.key()] = 0
                 universe = elem.getUniverse()
             elif type(elem) in [list ,tuple]: #---- lista o tupla di oggetti insiemi neutrosofici
                 for e in elem:
-                    if e not in neutrosophicfamily:   # evita di inserire elementi duplicati
-                        e.setName(e.getName())   # per poter conservare il nome nella famiglia
+                    key = e.key()
+                    if key not in index:   # evita di inserire elementi duplicati
+                        e.setName(e.getLabel())   # per poter conservare il nome nella famiglia
+                        index[key] = len(neutrosophicfamily)
                         neutrosophicfamily.append(e)
                 if len(neutrosophicfamily) > 0:  # se c'è almeno un insieme neutrosofico prendi l'universo
                     universe = neutrosophicfamily[0].getUniverse()
                 else:
                     universe = None
+            elif type(elem) in [NSpackedfamily, NSmappedfamily]:   #---- famiglia impacchettata o su file, i cui insiemi vengono materializzati
+                for e in elem:
+                    key = e.key()
+                    if key not in index:   # evita di inserire elementi duplicati
+                        index[key] = len(neutrosophicfamily)
+                        neutrosophicfamily.append(e)
+                universe = elem.getUniverse()
+            else:
+                raise ValueError("obj not compatible with the type neutrosophic family")
         elif length > 1:  # elenco diretto di insiemi neutrosofici
             for e in args:
-                if e not in neutrosophicfamily:  # evita di inserire elementi duplicati
-                    e.setName(e.getName())  # per poter conservare il nome nella famiglia
+                key = e.key()
+                if key not in index:  # evita di inserire elementi duplicati
+                    e.setName(e.getLabel())  # per poter conservare il nome nella famiglia
+                    index[key] = len(neutrosophicfamily)
                     neutrosophicfamily.append(e)
             universe = args[0].getUniverse()
         # memorizza i valori ottenuti nelle proprietà dell'oggetto
         self.__universe = universe
         self.__neutrosophicfamily = neutrosophicfamily
+        self.__index = index
+        self.__indexprecision = NSset.precisionequality   # precisione delle forme canoniche dell'indice
+        self.__order = None   # ordine di inclusione tra gli insiemi della famiglia (calcolato quando serve)
+        self.__lattice = None   # gradi degli insiemi e dei loro complementari ordinati per rango (calcolati quando servono)
         self.__name = None
 
 
@@ -102,11 +136,109 @@ class NSfamily:
 
     #------------------------------------------------------------------------------------
 
+    # metodo privato che restituisce il tipo dei gradi della famiglia
+    def __typecode(self):
+        """ private method that returns the type code of the degrees of the family, i.e. that of its first set
+        (or the default one if the family is empty), to which the degrees of the other sets are converted
+        whenever they are gathered in a single array
+        """
+        if not self.__neutrosophicfamily:
+            return NSstorage.typecode
+        return self.__neutrosophicfamily[0].getStorage().getTypecode()
+
+
+    # restituisce la rappresentazione impacchettata della famiglia
+    def pack(self):
+        """
+        Method that returns the packed representation of the family, i.e. an NSpackedfamily object storing
+        the degrees of all its neutrosophic sets in a single (k, n, 3) array over the common universe
+        """
+        if self.__universe is None:
+            raise ValueError("the family has no universe set")
+        typecode = self.__typecode()
+        data = array(typecode)
+        for s in self.__neutrosophicfamily:
+            data.extend(NSstorage.convert(s.getStorage().get(), typecode))
+        return NSpackedfamily(self.__universe, data, [s.getName() for s in self.__neutrosophicfamily])
+
+    #------------------------------------------------------------------------------------
+
+    # metodo statico che legge una famiglia neutrosofica da un file CSV
+    @staticmethod
+    def fromCSV(path, delimiter=None, chunksize=65536, typecode=None):
+        """
+        Reads a family of neutrosophic sets from a CSV (or TSV) file whose rows contain an element
+        of the universe followed by its membership, indeterminacy and non-membership degrees in each set,
+        possibly preceded by a header labelling the columns of every set as "name:mu", "name:sigma", "name:omega".
+        The rows are streamed in chunks directly into the storages of the degrees of the sets, built in one pass.
+        ----
+        Parameters:
+        - path: path of the file
+        - delimiter: separator of the columns (by default a tab for .tsv files and a comma otherwise)
+        - chunksize: number of rows converted at a time
+        - typecode: optional type code of the stored degrees of all the sets (by default float64)
+        ----
+        Returns: the family of the (distinct) neutrosophic sets read from the file
+        """
+        (elements, names, arrays) = NSreadCSV(path, delimiter, chunksize)
+        universe = NSuniverse(elements)
+        sets = list()
+        for (name, data) in zip(names, arrays):
+            NSset.checkDegrees(data)
+            nset = NSset(universe, NSstorage(universe.cardinality(), NSstorage.encode(data, typecode)))
+            nset.setName(name)
+            sets.append(nset)
+        family = NSfamily(sets)
+        family.setUniverse(universe)
+        return family
+
+
+    # metodo che scrive la famiglia neutrosofica in un file CSV
+    def toCSV(self, path, delimiter=None):
+        """
+        Writes the family of neutrosophic sets to a CSV (or TSV) file, one row for each element of the universe
+        with its degrees in all the sets of the family, after a header labelled with the names of the sets,
+        in a format read by fromCSV.
+        ----
+        Parameters:
+        - path: path of the file
+        - delimiter: separator of the columns (by default a tab for .tsv files and a comma otherwise)
+        """
+        if self.__universe is None:
+            raise ValueError("the family has no universe set")
+        NSwriteCSV(path, self.__universe.get(), [s.getName() for s in self.__neutrosophicfamily],
+                   [NSstorage.decode(s.getStorage().get()) for s in self.__neutrosophicfamily], delimiter)
+
+
+    #------------------------------------------------------------------------------------
+
+
+    # metodo privato che restituisce l'indice hash delle forme canoniche degli insiemi
+    def __keyIndex(self):
+        """ private method that returns the hash index associating the canonical form of every set of the family
+        to its position, rebuilding it if precisionequality has changed since it was built (the sets which become
+        equal at the new precision are not removed from the family, and the index refers to the first of them)
+        """
+        precision = NSset.precisionequality
+        if self.__indexprecision != precision:
+            index = dict()
+            for (i, s) in enumerate(self.__neutrosophicfamily):
+                index.setdefault(s.key(), i)
+            self.__index = index
+            self.__indexprecision = precision
+        return self.__index
+
 
     # Ridefinizione dell'operatore "in" sovrascrivendo il metodo __contains__
     def __contains__(self, nsset):
-        # Verifica se nsset è presente nella famiglia
-        return nsset in self.__neutrosophicfamily
+        """
+        Checks if a neutrosophic set belongs to the family by means of the hash index
+        of the canonical forms of its members (which should not be modified after the family is built).
+        """
+        if type(nsset) != NSset:
+            raise ValueError("the parameter is not a neutrosophic set")
+        i = self.__keyIndex().get(nsset.key())
+        return i is not None and self.__neutrosophicfamily[i].getUniverse() == nsset.getUniverse()
 
 
     #------------------------------------------------------------------------------------
@@ -138,27 +270,46 @@ class NSfamily:
     def getNSBase(self):
         """
         Returns the neutrosophic topological basis obtained from a family of neutrosophic sets
-        (i.e. a subbase) as the set of all possible neutrosophic intersections
+        (i.e. a subbase) as the set of all possible neutrosophic intersections.
+        The combinations of sets are generated by increasing size, extending every combination of the previous size
+        with one more set, so that each intersection costs a single operation on the already computed intersection
+        of its prefix. A combination whose intersection was already obtained from a previous combination
+        with no greater last set is not extended, since all its extensions give intersections already obtained.
         """
         subbase = self.__neutrosophicfamily   # famiglia finita di insiemi neutrosofici
+        universe = self.getUniverse()
+        storages = [s.getStorage() for s in subbase]
+        precision = NSset.precisionequality
         base = list()   # lista che conterrà la base corrispondente
-        # considero tutte le combinazioni di sottoinsiemi della sottobase
-        for i in range(1, len(subbase) + 1):
-            for combin in combinations(subbase, i):  # combination è la lista che contiene una sottofamiglia di insiemi neutrosofici
-                # calcolo l'intersezione dei sottoinsiemi in combinazione usando il metodo di ordine superiore reduce
-                intersez = reduce(lambda x, y: x.NSintersection(y), combin)
-                # crea il nome per l'intersezione combinando i nomi degli insiemi nella combinazione
-                names = [s.getName() for s in combin if s.getName()]  # ottieni i nomi di ogni insieme della combinazione
-                intersez_name = " ∩ ".join(names) if names else None  # Unisci i nomi con " ∩ "
-                if intersez_name:
-                    intersez.setName(intersez_name)  # assegna il nome all'intersezione
-                # controlla se questo elemento corrisponde a qualche elemento presente ed etichettato
-                for s in subbase:
-                    if intersez == s:
-                        intersez.setName(s.getName())
-                        break
-                # aggiungo l'elemento alla base
-                base.append(intersez)
+        seen = dict()   # forma canonica di ogni intersezione già ottenuta -> minimo ultimo insieme che la produce
+        # le combinazioni di un solo insieme sono gli insiemi stessi della sottobase
+        frontier = list()   # combinazioni della dimensione corrente da estendere, con le loro intersezioni
+        for j, s in enumerate(subbase):
+            seen[s.key()] = j
+            base.append(s)
+            frontier.append(((j,), storages[j]))
+        # estende ogni combinazione con gli insiemi successivi al suo ultimo, in ordine lessicografico
+        while frontier:
+            extended = list()
+            for (combin, storage) in frontier:
+                for j in range(combin[-1] + 1, len(subbase)):
+                    result = storage.intersection(storages[j])
+                    key = result.key(precision)
+                    last = seen.get(key)
+                    if last is not None and last <= j:
+                        continue   # le estensioni di questa combinazione ripetono quelle della precedente
+                    extended.append((combin + (j,), result))
+                    seen[key] = j
+                    if last is not None:
+                        continue   # intersezione già presente nella base
+                    # un'intersezione uguale a un insieme della sottobase è già presente col suo nome,
+                    # per cui il nome viene sempre composto da quelli degli insiemi della combinazione
+                    # (come etichetta differita, costruita solo se viene richiesta)
+                    intersez = NSset(universe, result)
+                    intersez.setName(NSlabel([subbase[k].getLabel() for k in combin + (j,)], "∩"))
+                    # aggiungo l'elemento alla base
+                    base.append(intersez)
+            frontier = extended
         # converto la base in oggetto NSfamily e la restituisco
         base = NSfamily(base)
         base.setUniverse(self.getUniverse())    # mantieni l'universo col relativo nome
@@ -168,49 +319,98 @@ class NSfamily:
 
     # metodo che restituisce la topologia neutrosofica ottenuta da una base neutrosofica
     # come insieme di tutte le possibili unioni neutrosofiche
-    def getNSTopologyByBase(self):
+    def getNSTopologyByBase(self, target=None):
         """
         Returns the neutrosophic topology obtained from a neutrosophic base
-        as the set of all possible neutrosophic unions
+        as the set of all possible neutrosophic unions.
+        The unions are computed on the degrees of the sets and labelled with deferred labels,
+        which are rendered only when they are asked for.
+        ----
+        Parameters:
+        - target: optional out-of-core NSmappedfamily object over the same universe to which the open sets
+                  are appended as soon as they are produced, instead of being kept in memory; if it is given
+                  the target itself is returned
         """
         base = self.__neutrosophicfamily   # famiglia finita di insiemi neutrosofici
-        topology = list()               # lista che conterrà la base corrispondente
-        universe = self.__universe
-        empty = NSset.EMPTY(universe)
-        empty.setName("\u2205\u0303")   # vuoto con tilde - empty.setName("∅")
+        universe = self.getUniverse()
+        storages = [b.getStorage() for b in base]
+        # lista che conterrà la topologia corrispondente (oppure famiglia su file che la riceve)
+        topology = list() if target is None else target
+        empty, absolute = self.__emptyAndAbsolute()
         topology.append(empty)  # aggiungi l'insieme neutrosofico vuoto
         # aggiungi tutte le possibili unioni finite di sottoinsiemi della base
-        for i in range(1, len(base) + 1):
-            for combin in combinations(base, i):
-                union = reduce(lambda x, y: x.NSunion(y), combin)
-                # crea il nome per l'unione combinando i nomi degli insiemi nella combinazione
-                names = [s.getName() for s in combin if s.getName()]  # Ottieni i nomi di ogni insieme nella combinazione
-                # aggiungi parentesi solo se ci sono più nomi coinvolti nell'intersezione
-                if len(names) > 1:
-                    union_name = " ∪ ".join(f"({name})" if "∩" in name else name for name in names)
-                else:
-                    union_name = " ∪ ".join(names)  # Lascia senza parentesi se c'è un singolo nome
-                if union_name:
-                    union.setName(union_name)  # Assegna il nome all'unione
-                # controlla se questo elemento corrisponde a qualche elemento presente ed etichettato
-                for b in base:
-                    if union == b:
-                        union.setName(b.getName())
-                        break
+        topology.extend(base)   # unioni di un solo insieme
+        for i in range(2, len(base) + 1):
+            for combin in combinations(range(len(base)), i):
+                union = NSset(universe, reduce(NSstorage.union, [storages[k] for k in combin]))
+                # un'unione uguale a un insieme della base ne prende il nome, trovato con l'indice hash
+                position = self.__keyIndex().get(union.key())
+                if position is not None:
+                    union.setName(base[position].getLabel())
+                else:   # compone il nome con quelli degli insiemi della combinazione, racchiudendo le intersezioni
+                    union.setName(NSlabel([base[k].getLabel() for k in combin], "∪", "∩"))
                 topology.append(union)
+        topology.append(absolute)  # aggiungi l'insieme neutrosofico assoluto
+        if target is not None:   # gli insiemi ripetuti non sono stati aggiunti alla famiglia su file
+            return target
+        # converto la lista topologia in oggetto NSfamily e la restituisco
+        topology = NSfamily(topology)
+        topology.setUniverse(self.getUniverse())  # mantieni l'universo col relativo nome
+        return topology
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce gli insiemi neutrosofici vuoto e assoluto etichettati
+    def __emptyAndAbsolute(self):
+        """
+        Returns the pair formed by the empty and the absolute neutrosophic sets over the universe
+        of the family, labelled with the empty set symbol and with the name of the universe, respectively
+        """
+        universe = self.__universe
+        empty = NSset.EMPTY(universe, self.__typecode())
+        empty.setName("\u2205\u0303")   # vuoto con tilde - empty.setName("∅")
         # Imposta il nome dell'insieme assoluto utilizzando il nome dell'universo
-        absolute = NSset.ABSOLUTE(universe)
+        absolute = NSset.ABSOLUTE(universe, self.__typecode())
         #----- gestione del nome dell'universo
         universe_name = universe.getName()
         if isBB(universe_name) == False:    # se ha già la tilde lascialo immutato
             absolute.setName(nameToBB(universe_name) if universe_name else "\U0001D54C\u0303")
         else:
             absolute.setName(universe_name)
-        topology.append(absolute)  # aggiungi l'insieme neutrosofico assoluto
-        # converto la lista topologia in oggetto NSfamily e la restituisco
-        topology = NSfamily(topology)
-        topology.setUniverse(self.getUniverse())  # mantieni l'universo col relativo nome
-        return topology
+        return empty, absolute
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che calcola come punto fisso la chiusura di una lista di insiemi neutrosofici
+    # rispetto ad un'operazione con gli insiemi di una lista di generatori
+    @staticmethod
+    def __fixpoint(start, generators, degreeoperation, setoperation, found):
+        """
+        Returns the list of the sets obtained from the start list by repeatedly applying
+        the operation to each new set and to every generator until no new set arises.
+        ----
+        Parameters:
+        - start: list of distinct neutrosophic sets whose canonical forms are already in found
+        - generators: list of neutrosophic sets to combine with every new set
+        - degreeoperation: operation between two NSstorage objects used to detect the new sets
+        - setoperation: the same operation between two NSset objects, used to build (and label) only the new sets
+        - found: set of the canonical forms of the sets already found, updated with the new ones
+        ----
+        Returns: the start list followed by the new sets
+        """
+        precision = NSset.precisionequality
+        closure = list(start)
+        i = 0
+        while i < len(closure):
+            A = closure[i]
+            degreesA = A.getStorage()
+            for B in generators:
+                key = degreeoperation(degreesA, B.getStorage()).key(precision)
+                if key not in found:
+                    found.add(key)
+                    closure.append(setoperation(A, B))
+            i += 1
+        return closure
 
     #------------------------------------------------------------------------------------
 
@@ -221,110 +421,598 @@ class NSfamily:
         """
         Returns the neutrosophic topology obtained from a neutrosophic subbase
         as a set of all possible neutrosophic unions of neutrosophic intersections
-        of any family of neutrosophic sets
+        of any family of neutrosophic sets.
+        The topology is computed as a fixpoint: starting from the subbase, the intersections of each new set
+        with the sets of the subbase are added until no new set arises (obtaining the base), and then
+        the unions of each new set with the sets of the base are added in the same way.
+        Since the neutrosophic union and intersection are distributive, the result is also closed under
+        intersection, and the cost depends on the cardinality of the topology and not on the number
+        of subfamilies of the subbase (the same topology is obtained, less efficiently,
+        by getNSBase().getNSTopologyByBase()).
         """
-        nsbase = self.getNSBase()
-        nstopology = nsbase.getNSTopologyByBase()
+        empty, absolute = self.__emptyAndAbsolute()
+        found = {empty.key(), absolute.key()}  # forme canoniche degli insiemi già trovati
+        subbase = list()   # insiemi distinti della sottobase, esclusi il vuoto e l'assoluto
+        for A in self.__neutrosophicfamily:
+            key = A.key()
+            if key not in found:
+                found.add(key)
+                subbase.append(A)
+        base = self.__fixpoint(subbase, subbase, NSstorage.intersection, NSset.NSintersection, found)
+        topology = self.__fixpoint(base, base, NSstorage.union, NSset.NSunion, found)
+        # converto la lista topologia in oggetto NSfamily e la restituisco
+        nstopology = NSfamily([empty] + topology + [absolute])
+        nstopology.setUniverse(self.getUniverse())  # mantieni l'universo col relativo nome
+        return nstopology
+
+
+    # metodo che restituisce la topologia neutrosofica ottenuta aggiungendo un insieme alla sottobase
+    def extendWith(self, nset):
+        """
+        Returns the neutrosophic topology generated by the current neutrosophic topology together with
+        a new neutrosophic set, i.e. the topology generated by any subbase of the current one with nset added,
+        without generating it again from the subbase.
+        Every open set of the new topology has the form G ∪ (H ∩ nset) with G and H open sets of the current one,
+        so only the distinct intersections H ∩ nset which are not already open are computed and joined with
+        the open sets, and the new sets are detected through the hash index of the current topology.
+        The current family is assumed to be a neutrosophic topology.
+        ----
+        Parameters:
+        - nset: neutrosophic set over the universe of the topology
+        ----
+        Returns: the neutrosophic topology generated by the current one and nset
+        """
+        self.__checkSet(nset)
+        precision = NSset.precisionequality
+        opensets = self.__neutrosophicfamily
+        found = set(self.__keyIndex())   # forme canoniche degli insiemi già trovati
+        degreesX = nset.getStorage()
+        # intersezioni distinte degli aperti con il nuovo insieme (quelle già aperte non producono nuovi insiemi)
+        traces = list()
+        for H in opensets:
+            key = H.getStorage().intersection(degreesX).key(precision)
+            if key not in found:
+                found.add(key)
+                traces.append(nset if key == nset.key() else H.NSintersection(nset))   # conserva l'etichetta di nset
+        # unioni degli aperti con le nuove intersezioni
+        topology = list(opensets) + traces
+        for D in traces:
+            degreesD = D.getStorage()
+            for G in opensets:
+                key = G.getStorage().union(degreesD).key(precision)
+                if key not in found:
+                    found.add(key)
+                    topology.append(G.NSunion(D))
+        nstopology = NSfamily(topology)
+        nstopology.setUniverse(self.getUniverse())  # mantieni l'universo col relativo nome
         return nstopology
 
 
     #------------------------------------------------------------------------------------
 
-    # funzione privata generico per la visualizzazione del report sui tempi
-    def __time_report(self, operation_name, start_time, success=True):
+    # metodo statico privato che restituisce la strumentazione delle verifiche
+    @staticmethod
+    def __instrumentation(trace, timereport, progress):
+        """ private method that returns the NSprogress object receiving the events of a verification:
+        the given one, if any, or the one printing the steps and the times according to trace and timereport
         """
-        Generates a time report based on the start time and the end time.
-        operation_name: The name of the operation being reported.
-        start_time: The initial time when the operation started.
-        success: Boolean indicating whether the operation was successful (True) or failed (False).
-        """
-        end_time = time()
-        execution_time = end_time - start_time
-        hours, remainder = divmod(execution_time, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        status = "positive" if success else "negative"
-        print(f"Verification of closure under neutrosophic {operation_name} was {status} and lasted {int(hours)} hours, {int(minutes)} minutes, {seconds:.2f} seconds")
+        return progress if progress is not None else NSprogress.printing(trace, timereport)
 
     #-------------------------------------------------------------
 
 
     # Metodo privato generico per la verifica della chiusura di una famiglia neutrosofica rispetto a un'operazione
-    def __check_closure(self, operation, operation_name, trace=False, timereport=False):
+    def __closureReport(self, operation, setoperation, operation_name, progress, exhaustive=False,
+                        workers=None, executor=None):
         """
-        Generic method that checks if the neutrosophic family is closed under a given operation (union or intersection).
-        The operation should be passed as a lambda function, and the operation_name should describe it for debugging purposes.
+        Generic method that checks if the neutrosophic family is closed under a given operation (union or intersection)
+        and returns an NSclosureReport object holding the combination of sets whose result does not belong
+        to the family (if any), the missing result, the number of combinations examined and the time spent.
+        The operation should be passed both as a function of two NSstorage objects (the degrees of two neutrosophic sets),
+        used to check the combinations, and as a function of two NSset objects, used only to build the missing result,
+        and the operation_name should describe it for debugging purposes.
+        Since the operation is associative, the closure under the operation applied to pairs implies the closure
+        under every finite reduction, so only the pairs of sets are checked unless exhaustive is True,
+        in which case all the combinations of two or more sets are reduced.
+        If workers or executor is given, the combinations are checked in parallel by a pool of processes,
+        unless they are fewer than parallelthreshold, in which case starting the processes would cost more
+        than the check itself.
+        The progress and the time spent are notified to the given NSprogress object.
         """
-        family = self.__neutrosophicfamily  # Ottieni la famiglia di insiemi neutrosofici
+        family = [A.getStorage() for A in self.__neutrosophicfamily]  # Ottieni i gradi degli insiemi della famiglia
         l = len(family)  # Lunghezza della famiglia
-        if trace:
+        if exhaustive:
+            sizes = range(2, l + 1)  # Evita operazioni con meno di due insiemi
             nmax = 2 ** l - l - 1  # Numero di sottoinsiemi con almeno due elementi
-            cifremax = len(str(nmax))
-            k = 0
-        if timereport:
-            start_time = time()
-        # Consideriamo tutte le combinazioni di sottoinsiemi della famiglia
-        for i in range(2, l + 1):  # Evita operazioni con meno di due insiemi
-            for combin in combinations(family, i):
-                if trace:
-                    k += 1
-                    print(f"Closure under neutrosophic {operation_name}: step {k:{cifremax}} / {nmax}")
-                # Calcola l'operazione (unione o intersezione) sui sottoinsiemi nella combinazione
-                result = reduce(operation, combin)
-                # Controlla se il risultato è presente nella famiglia
-                if result not in family:
-                    if timereport:
-                        self.__time_report(operation_name, start_time, success=False)
-                    return False  # Se trovi un risultato non presente nella famiglia, restituisci False
-        if timereport:
-            self.__time_report(operation_name, start_time, success=True)
-        return True  # Se tutte le combinazioni sono presenti, la famiglia è chiusa rispetto all'operazione
+        else:
+            sizes = [2]   # è sufficiente considerare le coppie di insiemi
+            nmax = l * (l - 1) // 2  # Numero di coppie di insiemi distinti
+        if (workers is None and executor is None) or nmax < self.parallelthreshold:
+            search = lambda checkpoint: self.__closureSequential(family, operation, sizes, progress, checkpoint)
+        else:
+            search = lambda checkpoint: self.__closureParallel(operation, list(sizes), progress, checkpoint,
+                                                               workers, executor)
+        return closureReport(self.__neutrosophicfamily, search, setoperation, operation_name, nmax, progress)
+
+
+    # metodo privato che verifica la chiusura rispetto a un'operazione in un unico processo
+    def __closureSequential(self, family, operation, sizes, progress, checkpoint):
+        """ private method that checks the combinations of the given sizes of the storages of the family
+        one at a time and returns the pair formed by the tuple of the positions of the first combination whose result
+        does not belong to the family (or None) and by the number of combinations examined.
+        The progress is notified whenever the number of combinations examined reaches the checkpoint.
+        """
+        index = self.__keyIndex()   # indice hash delle forme canoniche degli insiemi della famiglia
+        precision = NSset.precisionequality
+        # i risultati di massimi e minimi riproducono esattamente i gradi di un insieme della famiglia,
+        # per cui si confrontano prima i byte dei gradi e solo in caso negativo la forma canonica
+        rawindex = {A.key() for A in family}
+        belongs = lambda result: result.key() in rawindex or result.key(precision) in index
+        return searchCounterexample(family.__getitem__, len(family), belongs, operation, sizes, progress, checkpoint)
+
+
+    # metodo privato che verifica la chiusura rispetto a un'operazione con un gruppo di processi
+    def __closureParallel(self, operation, sizes, progress, checkpoint, workers, executor):
+        """ private method that splits the combinations of the given sizes among a pool of processes, according to
+        the position of their first set, and returns the pair formed by the tuple of the positions of the sets
+        of a combination whose result does not belong to the family (or None) and by the number of combinations examined.
+        As soon as a process finds a counterexample the pending tasks
+        are cancelled and, when the pool is created here, the running ones are stopped.
+        The counterexample is the first one found, which is not necessarily the first one in lexicographic order.
+        ----
+        Parameters:
+        - workers: number of processes of the pool created here; the family is shipped once to every process
+        - executor: an already existing concurrent.futures executor (on the same machine): the family is written once
+                    to a temporary file, read by every process at its first task, and a managed event stops the running
+                    tasks as soon as a counterexample is found
+        """
+        if self.__universe is None or len(self.__neutrosophicfamily) < 2:
+            return None, 0
+        l = len(self.__neutrosophicfamily)
+        data = self.pack().get()
+        nworkers = workers if workers is not None else cpu_count() or 1
+        # le posizioni iniziali vengono distribuite a rotazione tra i compiti, così che abbiano durate simili
+        nchunks = min(l - 1, 16 * nworkers)
+        chunks = [list(range(c, l - 1, nchunks)) for c in range(nchunks)]
+        if executor is not None:
+            with NamedTemporaryFile(prefix="pyns-", suffix=".bin", delete=False) as file:
+                file.write(data.tobytes())
+            payload = (uuid4().hex, file.name, self.__universe.cardinality(), data.typecode, NSset.precisionequality)
+            try:
+                with Manager() as manager:
+                    return self.__collectCounterexample(executor, chunks, operation, sizes, progress, checkpoint,
+                                                        payload=payload, stop=manager.Event())
+            finally:
+                remove(file.name)
+        payload = (self.__universe.cardinality(), data, NSset.precisionequality)
+        context = get_context()
+        stop = context.Event()   # segnala ai processi che è stato trovato un controesempio
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initClosureWorker,
+                                 initargs=payload + (stop,)) as pool:
+            return self.__collectCounterexample(pool, chunks, operation, sizes, progress, checkpoint,
+                                                stop=stop)
+
+
+    # metodo statico privato che distribuisce i compiti e raccoglie i risultati
+    @staticmethod
+    def __collectCounterexample(pool, chunks, operation, sizes, progress, checkpoint, payload=None, stop=None):
+        """ private method that submits a task for every chunk of first positions to a pool of processes
+        and waits for their results, cancelling all the tasks as soon as one of them finds a counterexample.
+        When the payload of the family is given (i.e. with an existing executor) the stop event is sent with every task,
+        while the processes of a pool created here received it at their initialization.
+        """
+        taskstop = stop if payload is not None else None
+        futures = [pool.submit(checkClosureChunk, operation, chunk, sizes, payload, taskstop) for chunk in chunks]
+        k = 0   # numero di combinazioni esaminate
+        counterexample = None
+        try:
+            for future in as_completed(futures):
+                (examined, counterexample) = future.result()
+                k += examined
+                if k >= checkpoint:
+                    checkpoint = progress.update(k)
+                if counterexample is not None:
+                    break
+        finally:
+            if stop is not None:
+                stop.set()
+            for future in futures:
+                future.cancel()
+            if taskstop is not None:   # i compiti già inviati ai processi terminano subito, prima dell'evento gestito
+                wait(futures)
+        return counterexample, k
 
 
     #-------------------------------------------------------------
 
 
     # Metodo per verificare la chiusura rispetto all'unione
-    def NSunionClosed(self, trace=False, timereport=False):
-        return self.__check_closure(lambda x, y: x.NSunion(y), "union", trace=trace, timereport=timereport)
+    def NSunionClosed(self, trace=False, timereport=False, exhaustive=False, workers=None, executor=None, report=False,
+                      progress=None):
+        """
+        Method that checks if the neutrosophic family is closed under neutrosophic union.
+        By default only the O(n^2) unions of pairs of sets are checked, which is enough for finite families;
+        if exhaustive is True the unions of all the combinations of two or more sets are checked.
+        The check is made in parallel by a new pool of workers processes or by an existing executor
+        (e.g. a concurrent.futures.ProcessPoolExecutor) if one of them is given.
+        If report is True an NSclosureReport object is returned instead of a boolean value, holding the
+        counterexample (if any) together with the number of combinations examined and the time spent.
+        The progress and the time spent are printed if trace and timereport are True, or sent as structured
+        events to the hooks of the NSprogress object progress, if given.
+        """
+        result = self.__closureReport(NSstorage.union, NSset.NSunion, "union",
+                                      self.__instrumentation(trace, timereport, progress),
+                                      exhaustive=exhaustive, workers=workers, executor=executor)
+        return result if report else result.isClosed()
+
+
+    # restituisce gli insiemi la cui unione non appartiene alla famiglia
+    def NSunionCounterexample(self, trace=False, timereport=False, exhaustive=False, workers=None, executor=None,
+                              progress=None):
+        """
+        Method that looks for a counterexample to the closure of the neutrosophic family under neutrosophic union.
+        The parameters have the same meaning as in NSunionClosed.
+        ----
+        Returns: the tuple of the sets of the family whose union does not belong to the family, or None
+        """
+        return self.NSunionClosed(trace=trace, timereport=timereport, exhaustive=exhaustive, workers=workers,
+                                  executor=executor, report=True, progress=progress).getCombination()
 
     #-----------
 
     # Metodo per verificare la chiusura rispetto all'intersezione
-    def NSintersectionClosed(self, trace=False, timereport=False):
-        return self.__check_closure(lambda x, y: x.NSintersection(y), "intersection", trace=trace, timereport=timereport)
+    def NSintersectionClosed(self, trace=False, timereport=False, exhaustive=False, workers=None, executor=None,
+                             report=False, progress=None):
+        """
+        Method that checks if the neutrosophic family is closed under neutrosophic intersection.
+        By default only the O(n^2) intersections of pairs of sets are checked, which is enough for finite families;
+        if exhaustive is True the intersections of all the combinations of two or more sets are checked.
+        The check is made in parallel by a new pool of workers processes or by an existing executor
+        (e.g. a concurrent.futures.ProcessPoolExecutor) if one of them is given.
+        If report is True an NSclosureReport object is returned instead of a boolean value, holding the
+        counterexample (if any) together with the number of combinations examined and the time spent.
+        The progress and the time spent are printed if trace and timereport are True, or sent as structured
+        events to the hooks of the NSprogress object progress, if given.
+        """
+        result = self.__closureReport(NSstorage.intersection, NSset.NSintersection, "intersection",
+                                      self.__instrumentation(trace, timereport, progress),
+                                      exhaustive=exhaustive, workers=workers, executor=executor)
+        return result if report else result.isClosed()
+
+
+    # restituisce gli insiemi la cui intersezione non appartiene alla famiglia
+    def NSintersectionCounterexample(self, trace=False, timereport=False, exhaustive=False, workers=None,
+                                     executor=None, progress=None):
+        """
+        Method that looks for a counterexample to the closure of the neutrosophic family under neutrosophic intersection.
+        The parameters have the same meaning as in NSintersectionClosed.
+        ----
+        Returns: the tuple of the sets of the family whose intersection does not belong to the family, or None
+        """
+        return self.NSintersectionClosed(trace=trace, timereport=timereport, exhaustive=exhaustive, workers=workers,
+                                         executor=executor, report=True, progress=progress).getCombination()
 
     #-----------
 
     # Metodo che verifica se una famiglia neutrosofica costituisce una topologia neutrosofica
-    def isNeutrosophicTopology(self, trace=False, timereport=False):
+    def isNeutrosophicTopology(self, trace=False, timereport=False, exhaustive=False, workers=None, executor=None,
+                               report=False, progress=None):
         """
         Method that checks if the neutrosophic family satisfies the axioms of a neutrosophic topology.
         Returns True if the family constitutes a neutrosophic topology, otherwise returns False.
+        The closure under union and intersection is checked on pairs of sets unless exhaustive is True,
+        and in parallel if workers or executor is given (see NSunionClosed).
+        If report is True an NSclosureReport object is returned instead of a boolean value: if the family is not
+        a topology it holds the operation which failed and its counterexample (a missing empty set is reported
+        as the union of no set and a missing absolute set as the intersection of no set).
+        The events of both the closure checks and, if the family is a topology, the timing event of the whole
+        verification are sent to progress (or printed according to trace and timereport, see NSunionClosed).
+        """
+        unionclosed = lambda progress: self.NSunionClosed(exhaustive=exhaustive, workers=workers, executor=executor,
+                                                          report=True, progress=progress)
+        intersectionclosed = lambda progress: self.NSintersectionClosed(exhaustive=exhaustive, workers=workers,
+                                                                        executor=executor, report=True,
+                                                                        progress=progress)
+        result = topologyReport(self, self.__universe, unionclosed, intersectionclosed,
+                                self.__instrumentation(trace, timereport, progress))
+        return result if report else result.isClosed()
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce l'ordine di inclusione tra gli insiemi della famiglia
+    def __inclusionOrder(self):
+        """ private method that returns (computing and caching it, if necessary) the inclusion order of the family.
+        The sets are numbered by their rank in a linear extension of the inclusion (a set precedes its proper supersets)
+        and the order is returned as the tuple (order, rank, above, upper, lower) where:
+        - order[r] is the position in the family of the set of rank r and rank is the inverse list
+        - above[r] is the bit mask of the ranks of the sets properly containing the set of rank r
+        - upper[r] is the list of the ranks of the sets covering the set of rank r, i.e. properly containing it
+          with no other set of the family between them (its upper covers in the Hasse diagram)
+        - lower[r] is the list of the ranks of the sets covered by the set of rank r (its lower covers)
+        The members of the family should not be modified after the order is computed.
+        """
+        if self.__order is None:
+            k = len(self.__neutrosophicfamily)
+            (order, above) = self.pack().supersetMasks() if k > 0 else ([], [])
+            rank = [0] * k
+            for (r, i) in enumerate(order):
+                rank[i] = r
+            upper = [list() for r in range(k)]
+            lower = [list() for r in range(k)]
+            for r in range(k):
+                # il sovrainsieme proprio di rango minimo tra quelli rimasti è un ricoprimento,
+                # dopodiché vengono scartati tutti i suoi sovrainsiemi propri
+                remaining = above[r]
+                while remaining:
+                    low = remaining & -remaining
+                    s = low.bit_length() - 1
+                    upper[r].append(s)
+                    lower[s].append(r)
+                    remaining &= ~above[s]
+                    remaining ^= low
+            self.__order = (order, rank, above, upper, lower)
+        return self.__order
+
+
+    # metodo privato che restituisce la posizione di un insieme neutrosofico della famiglia
+    def __positionOf(self, nset):
+        """ private method that returns the position of a neutrosophic set in the family
+        or raises an error if the set does not belong to the family
         """
+        if nset not in self:
+            raise ValueError("the neutrosophic set does not belong to the family")
+        return self.__keyIndex()[nset.key()]
+
+
+    # metodo privato che restituisce la famiglia degli insiemi di date posizioni
+    def __subfamily(self, positions):
+        """ private method that returns the neutrosophic family of the sets of given positions
+        over the same universe of the current family
+        """
+        family = NSfamily([self.__neutrosophicfamily[i] for i in positions])
+        if self.__universe is not None:
+            family.setUniverse(self.__universe)
+        return family
+
+    #-----------
+
+    # restituisce gli elementi minimali della famiglia rispetto all'inclusione
+    def getNSMinimalElements(self):
+        """
+        Returns the neutrosophic family of the minimal elements of the current family with respect to
+        the neutrosophic inclusion, i.e. of the sets which do not properly contain any other set of the family
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        return self.__subfamily([order[r] for r in range(len(order)) if not lower[r]])
+
+
+    # restituisce gli elementi massimali della famiglia rispetto all'inclusione
+    def getNSMaximalElements(self):
+        """
+        Returns the neutrosophic family of the maximal elements of the current family with respect to
+        the neutrosophic inclusion, i.e. of the sets which are not properly contained in any other set of the family
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        return self.__subfamily([order[r] for r in range(len(order)) if not upper[r]])
+
+
+    # restituisce gli insiemi della famiglia che ricoprono un suo insieme
+    def getNSUpperCovers(self, nset):
+        """
+        Returns the list of the sets of the family covering a given set of the family, i.e. properly containing it
+        with no other set of the family between them.
+        ----
+        Parameters:
+        - nset: a neutrosophic set belonging to the family
+        ----
+        Returns: the list of the upper covers of nset in the Hasse diagram of the family
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        return [self.__neutrosophicfamily[order[s]] for s in upper[rank[self.__positionOf(nset)]]]
+
+
+    # restituisce gli insiemi della famiglia ricoperti da un suo insieme
+    def getNSLowerCovers(self, nset):
+        """
+        Returns the list of the sets of the family covered by a given set of the family, i.e. properly contained in it
+        with no other set of the family between them.
+        ----
+        Parameters:
+        - nset: a neutrosophic set belonging to the family
+        ----
+        Returns: the list of the lower covers of nset in the Hasse diagram of the family
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        return [self.__neutrosophicfamily[order[s]] for s in lower[rank[self.__positionOf(nset)]]]
+
+
+    # restituisce il diagramma di Hasse della famiglia
+    def getNSHasseDiagram(self):
+        """
+        Returns the Hasse diagram of the family ordered by neutrosophic inclusion, i.e. the transitive reduction
+        of the inclusion relation, as the list of the pairs (A, B) of sets of the family such that B covers A.
+        ----
+        Returns: the list of the edges (A, B) of the Hasse diagram
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
         family = self.__neutrosophicfamily
-        universe = self.__universe
-        if timereport:
-            start_time = time()
-        # Controllo se l'insieme vuoto è presente nella famiglia
-        empty = NSset.EMPTY(universe)
-        if empty not in family:
-            return False
-        # Controllo se l'insieme universo è presente nella famiglia
-        absolute = NSset.ABSOLUTE(universe)
-        if absolute not in family:
-            return False
-        # Verifica la proprietà di chiusura rispetto all'unione
-        if not self.NSunionClosed(trace=trace, timereport=timereport):
-            return False
-        # Verifica la proprietà di chiusura rispetto all'intersezione
-        if not self.NSintersectionClosed(trace=trace, timereport=timereport):
-            return False
-        # Se tutti i controlli passano, la famiglia è una topologia neutrosofica
-        if timereport:
-            self.__time_report("topology", start_time, success=True)
-        return True
+        return [(family[order[r]], family[order[s]]) for r in range(len(order)) for s in upper[r]]
+
+
+    # genera le catene massimali della famiglia
+    def NSmaximalChains(self):
+        """
+        Generator of the maximal chains of the family ordered by neutrosophic inclusion, i.e. of the paths
+        of the Hasse diagram going from a minimal element to a maximal one.
+        Note that the number of maximal chains can grow exponentially with the size of the family.
+        ----
+        Returns: an iterator over the maximal chains, each one given as the list of its sets in increasing order
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        family = self.__neutrosophicfamily
+        # visita in profondità del diagramma di Hasse a partire da ogni elemento minimale
+        stack = [[r] for r in reversed(range(len(order))) if not lower[r]]
+        while stack:
+            chain = stack.pop()
+            covers = upper[chain[-1]]
+            if not covers:
+                yield [family[order[r]] for r in chain]
+            for s in reversed(covers):
+                stack.append(chain + [s])
+
+
+    #-----------
+
+    # restituisce la base minima di una topologia neutrosofica
+    def getNSMinimalBase(self):
+        """
+        Returns the minimal neutrosophic base of the current family (usually a neutrosophic topology), i.e. the family
+        of its join-irreducible sets: the sets which are not the neutrosophic union of the sets of the family
+        properly contained in them (the empty set, which is the union of no set, is excluded).
+        Every base of a finite neutrosophic topology contains these sets and they generate the whole topology
+        by means of unions. A set is the union of the sets properly contained in it if and only if
+        it is the union of its lower covers in the Hasse diagram, so that no combination of sets is examined.
+        ----
+        Returns: the neutrosophic family of the join-irreducible sets of the current family
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        family = self.__neutrosophicfamily
+        empty = NSstorage(self.__universe.cardinality()) if self.__universe is not None else None
+        irreducible = list()
+        for r in range(len(order)):
+            G = family[order[r]]
+            storage = empty
+            for s in lower[r]:   # unione dei ricoprimenti inferiori di G
+                storage = storage.union(family[order[s]].getStorage())
+            if storage.key(NSset.precisionequality) != G.key():
+                irreducible.append(order[r])
+        return self.__subfamily(sorted(irreducible))
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce i gradi di un insieme con i gradi di non appartenenza cambiati di segno
+    def __orderedBlock(self, storage):
+        """ private method that returns the flat array (mu, sigma, -omega) of the degrees of a storage,
+        converted to the type code of the family, so that A is a neutrosophic subset of B if and only if
+        every value of the array of A is less than or equal to the corresponding value of the array of B
+        """
+        return storage.ordered(self.__typecode())
 
 
+    # metodo privato che restituisce l'indice usato per il calcolo di interni e chiusure
+    def __latticeIndex(self):
+        """ private method that returns (computing and caching it, if necessary) the pair of lists (blocks, coblocks)
+        of the ordered blocks of the degrees of the sets of the family and of their complements, listed by rank
+        in the inclusion order
+        """
+        if self.__lattice is None:
+            (order, rank, above, upper, lower) = self.__inclusionOrder()
+            family = self.__neutrosophicfamily
+            self.__lattice = ([self.__orderedBlock(family[i].getStorage()) for i in order],
+                              [self.__orderedBlock(family[i].getStorage().complement()) for i in order])
+        return self.__lattice
+
+
+    # metodo privato che cerca gli insiemi massimali della famiglia che soddisfano una condizione
+    def __maximalSatisfying(self, condition):
+        """ private method that returns the ranks of the maximal sets of the family satisfying a condition
+        which is inherited by subsets (i.e. if it holds for a set it holds for all its subsets).
+        The Hasse diagram is traversed upward from the minimal elements and the traversal is pruned
+        at the sets not satisfying the condition, since none of their supersets can satisfy it.
+        ----
+        Parameters:
+        - condition: boolean function of the rank of a set of the family
+        """
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        k = len(order)
+        status = bytearray(k)   # 0: non esaminato, 1: soddisfa la condizione, 2: non la soddisfa
+        stack = list()
+        for r in range(k):
+            if not lower[r]:
+                status[r] = 1 if condition(r) else 2
+                if status[r] == 1:
+                    stack.append(r)
+        maximal = list()
+        while stack:
+            r = stack.pop()
+            top = True   # nessun ricoprimento di r soddisfa la condizione
+            for s in upper[r]:
+                if status[s] == 0:
+                    status[s] = 1 if condition(s) else 2
+                    if status[s] == 1:
+                        stack.append(s)
+                if status[s] == 1:
+                    top = False
+            if top:
+                maximal.append(r)
+        return maximal
+
+
+    # metodo privato che controlla che un insieme neutrosofico sia definito sull'universo della famiglia
+    def __checkSet(self, nset):
+        if type(nset) != NSset:
+            raise ValueError("the parameter is not a neutrosophic set")
+        if nset.getUniverse() != self.__universe:
+            raise ValueError("the neutrosophic set and the family cannot be defined on different universe sets")
+
+    #-----------
+
+    # interno neutrosofico di un insieme rispetto alla famiglia
+    def NSinterior(self, nset):
+        """
+        Returns the neutrosophic interior of a neutrosophic set with respect to the current family (usually a
+        neutrosophic topology), i.e. the union of the sets of the family which are contained in it.
+        The inclusion order of the family is computed only once, so that many interiors are cheap.
+        ----
+        Parameters:
+        - nset: neutrosophic set over the universe of the family
+        ----
+        Returns: the neutrosophic interior of nset (the empty set if no set of the family is contained in nset)
+        """
+        self.__checkSet(nset)
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        (blocks, coblocks) = self.__latticeIndex()
+        b = self.__orderedBlock(nset.getStorage())
+        maximal = self.__maximalSatisfying(lambda r: all(map(le, blocks[r], b)))
+        storage = NSstorage(self.__universe.cardinality(), typecode=self.__typecode())   # insieme vuoto
+        for r in maximal:
+            storage = storage.union(self.__neutrosophicfamily[order[r]].getStorage())
+        interior = NSset(self.__universe, storage)
+        if len(maximal) == 1:   # l'interno è un insieme della famiglia
+            interior.setName(self.__neutrosophicfamily[order[maximal[0]]].getName())
+        return interior
+
+
+    # chiusura neutrosofica di un insieme rispetto alla famiglia
+    def NSclosure(self, nset):
+        """
+        Returns the neutrosophic closure of a neutrosophic set with respect to the current family (usually a
+        neutrosophic topology), i.e. the intersection of the closed sets (the complements of the sets of the family)
+        which contain it. The inclusion order of the family and the complements of its sets are computed
+        only once, so that many closures are cheap.
+        ----
+        Parameters:
+        - nset: neutrosophic set over the universe of the family
+        ----
+        Returns: the neutrosophic closure of nset (the absolute set if no closed set contains nset)
+        """
+        self.__checkSet(nset)
+        (order, rank, above, upper, lower) = self.__inclusionOrder()
+        (blocks, coblocks) = self.__latticeIndex()
+        b = self.__orderedBlock(nset.getStorage())
+        # i complementari degli insiemi massimali tra quelli il cui complementare contiene nset
+        # sono i chiusi minimali che contengono nset
+        maximal = self.__maximalSatisfying(lambda r: all(map(le, b, coblocks[r])))
+        storage = NSstorage(self.__universe.cardinality(), typecode=self.__typecode())
+        storage.fill((1, 1, 0))   # insieme assoluto
+        for r in maximal:
+            storage = storage.intersection(self.__neutrosophicfamily[order[r]].getStorage().complement())
+        closure = NSset(self.__universe, storage)
+        if len(maximal) == 1:   # la chiusura è il complementare di un insieme della famiglia
+            closure.setName(complementName(self.__neutrosophicfamily[order[maximal[0]]].getName()))
+        return closure
+
     #------------------------------------------------------------------------------------
 
     # restituisce True se la famiglia neutrosofica corrente è contenuta in quella
@@ -343,11 +1031,7 @@ class NSfamily:
         if self.getUniverse() != nsfamily.getUniverse():
             raise ValueError("the two neutrosophic families cannot be defined on different universe sets")
         else:
-            result = True
-            for e in self.__neutrosophicfamily:
-                if e not in nsfamily.__neutrosophicfamily:
-                    result = False
-                    break
+            result = all(e.key() in nsfamily.__keyIndex() for e in self.__neutrosophicfamily)
             return result
 
     #----------
@@ -446,7 +1130,7 @@ class NSfamily:
             raise ValueError("The two neutrosophic families cannot be defined on different universes.")
         # Combine the families while avoiding duplicates
         combined_sets = self.__neutrosophicfamily + [s for s in other_family.__neutrosophicfamily if
-                                                     s not in self.__neutrosophicfamily]
+                                                     s.key() not in self.__keyIndex()]
         # Create a new NSfamily from the union and return it
         return NSfamily(combined_sets)
 
@@ -476,7 +1160,7 @@ class NSfamily:
         if self.getUniverse() != other_family.getUniverse():
             raise ValueError("The two neutrosophic families cannot be defined on different universes.")
         # Find the common sets in both families
-        common_sets = [s for s in self.__neutrosophicfamily if s in other_family.__neutrosophicfamily]
+        common_sets = [s for s in self.__neutrosophicfamily if s.key() in other_family.__keyIndex()]
         # Create a new NSfamily from the intersection and return it
         return NSfamily(common_sets)
 
@@ -508,7 +1192,7 @@ class NSfamily:
         if self.getUniverse() != other_family.getUniverse():
             raise ValueError("The two neutrosophic families cannot be defined on different universes.")
         # Trova gli insiemi presenti solo nella prima famiglia
-        unique_sets = [s for s in self.__neutrosophicfamily if s not in other_family.__neutrosophicfamily]
+        unique_sets = [s for s in self.__neutrosophicfamily if s.key() not in other_family.__keyIndex()]
         # Crea una nuova NSfamily con la differenza e restituiscila
         return NSfamily(unique_sets)
 
@@ -0,0 +1,265 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+ns_io.py
+Functions saving and loading neutrosophic sets, families and mappings in a compact, versioned binary format.
+A file is made of a header (magic number, version, kind of object and type code of the degrees)
+followed by little-endian sections, each one aligned to 8 bytes:
+- a block of strings: the number of strings, the length of their UTF-8 encoding, one byte for each string
+  telling whether it is defined (names may be None) and the strings separated by \\0
+- an array: the number of its items followed by their raw values
+A neutrosophic set or family stores the name and the elements of its universe once, then the names of its sets
+and the raw degrees of all of them; a mapping stores its domain and codomain and the array of the positions
+in the codomain of the values of the elements of the domain.
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+"""
+from .ns_universe import NSuniverse
+from .ns_set import NSset
+from .ns_storage import NSstorage
+from .ns_family import NSfamily
+from .ns_packedfamily import NSpackedfamily
+from .ns_mappedfamily import NSmappedfamily
+from .ns_mapping import NSmapping
+from array import array
+from mmap import mmap as memorymap, ACCESS_READ
+from struct import Struct
+from sys import byteorder
+
+MAGIC = b"PYNS"
+VERSION = 1
+CHUNK = 1 << 24             # numero massimo di byte dei gradi scritti alla volta da una famiglia su file
+HEADER = Struct("<4sHBc")   # numero magico, versione, tipo di oggetto, type code dei gradi
+COUNT = Struct("<QQ")       # numero di elementi e lunghezza in byte di una sezione
+# tipi di oggetto memorizzabili
+SET = 1
+FAMILY = 2
+MAPPING = 3
+
+
+#------------------ scrittura
+
+# scrive i byte di una sezione seguiti dai byte nulli che la allineano a 8 byte
+def writeAligned(file, data):
+    """
+    Writes a sequence of bytes followed by the null bytes which align the end of the section to 8 bytes
+    """
+    file.write(data)
+    file.write(bytes(-len(data) % 8))
+
+
+# scrive un blocco di stringhe (eventualmente non definite)
+def writeStrings(file, strings):
+    """
+    Writes a block of strings, some of which may be None
+    """
+    encoded = "\0".join(s if s is not None else "" for s in strings).encode("utf-8")
+    file.write(COUNT.pack(len(strings), len(encoded)))
+    writeAligned(file, bytes(s is not None for s in strings) + encoded)
+
+
+# scrive un array di valori in formato little-endian
+def writeArray(file, data):
+    """
+    Writes an array of numbers (degrees or positions) with their raw little-endian values
+    """
+    if byteorder == "big":
+        data = array(data.typecode, data)
+        data.byteswap()
+    file.write(COUNT.pack(len(data), data.itemsize * len(data)))
+    writeAligned(file, data.tobytes())
+
+
+# scrive un array di valori fornito a blocchi di byte
+def writeChunks(file, typecode, count, chunks):
+    """
+    Writes an array of count numbers of the given type code, given as an iterable of blocks of their raw bytes
+    (in the byte order of the machine), so that the array is never held in memory as a whole
+    """
+    length = array(typecode).itemsize * count
+    file.write(COUNT.pack(count, length))
+    for chunk in chunks:
+        if byteorder == "big":
+            data = array(typecode)
+            data.frombytes(chunk)
+            data.byteswap()
+            chunk = data.tobytes()
+        file.write(chunk)
+    file.write(bytes(-length % 8))
+
+
+# scrive un universo
+def writeUniverse(file, universe):
+    """
+    Writes the name and the elements of a universe set
+    """
+    writeStrings(file, [universe.getName()])
+    writeStrings(file, universe.get())
+
+
+# salva un oggetto in formato binario
+def NSsave(obj, path):
+    """
+    Saves a neutrosophic set, a neutrosophic family (also packed or out-of-core) or a mapping in a binary file.
+    The degrees of an out-of-core family are copied from its file in blocks.
+    ----
+    Parameters:
+    - obj: the NSset, NSfamily, NSpackedfamily, NSmappedfamily or NSmapping object to save
+    - path: path of the file
+    """
+    with open(path, "wb") as file:
+        if type(obj) == NSmapping:
+            file.write(HEADER.pack(MAGIC, VERSION, MAPPING, b"q"))
+            (domain, codomain) = (obj.getDomain(), obj.getCodomain())
+            writeStrings(file, [obj.getName()])
+            writeUniverse(file, domain)
+            writeUniverse(file, codomain)
+            writeArray(file, array("q", [codomain.indexOf(obj.getValue(u)) for u in domain.get()]))
+            return
+        if type(obj) == NSmappedfamily:
+            (universe, typecode, k) = (obj.getUniverse(), obj.getTypecode(), obj.cardinality())
+            file.write(HEADER.pack(MAGIC, VERSION, FAMILY, typecode.encode()))
+            writeUniverse(file, universe)
+            writeStrings(file, obj.getNames())
+            size = 3 * universe.cardinality()   # numero di gradi di ogni insieme
+            step = max(1, CHUNK // (size * array(typecode).itemsize))   # numero di insiemi scritti alla volta
+            writeChunks(file, typecode, size * k, (obj.getBytes(i, min(i + step, k)) for i in range(0, k, step)))
+            return
+        if type(obj) == NSset:
+            (kind, universe, names, data) = (SET, obj.getUniverse(), [obj.getName()], obj.getStorage().get())
+        elif type(obj) in [NSfamily, NSpackedfamily]:
+            packed = obj.pack() if type(obj) == NSfamily else obj   # i gradi di tutti gli insiemi in un solo tipo
+            (kind, universe, names, data) = (FAMILY, packed.getUniverse(), packed.getNames(), packed.get())
+        else:
+            raise ValueError("obj cannot be saved as a neutrosophic set, family or mapping")
+        file.write(HEADER.pack(MAGIC, VERSION, kind, data.typecode.encode()))   # il tipo dei gradi memorizzati
+        writeUniverse(file, universe)
+        writeStrings(file, names)
+        writeArray(file, data)
+
+
+#------------------ lettura
+
+# legge un blocco di stringhe
+def readStrings(view, offset):
+    """
+    Reads a block of strings from a memory view of a file starting from a given offset.
+    ----
+    Returns: the pair formed by the list of the strings and the offset of the next section
+    """
+    (count, length) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    defined = view[offset:offset + count]
+    strings = str(view[offset + count:offset + count + length], "utf-8").split("\0") if count > 0 else []
+    if len(strings) != count:
+        raise ValueError("corrupted block of strings")
+    strings = [s if d else None for (s, d) in zip(strings, defined)]
+    return strings, offset + count + length + (-(count + length) % 8)
+
+
+# legge un array di valori
+def readArray(view, offset, typecode):
+    """
+    Reads an array of numbers from a memory view of a file starting from a given offset,
+    copying its raw bytes at once.
+    ----
+    Returns: the pair formed by the array and the offset of the next section
+    """
+    (count, length) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    data = array(typecode)
+    if length != count * data.itemsize:
+        raise ValueError("corrupted array")
+    data.frombytes(view[offset:offset + length])
+    if byteorder == "big":
+        data.byteswap()
+    return data, offset + length + (-length % 8)
+
+
+# legge un universo
+def readUniverse(view, offset):
+    """
+    Reads the name and the elements of a universe set.
+    ----
+    Returns: the pair formed by the NSuniverse object and the offset of the next section
+    """
+    (name, offset) = readStrings(view, offset)
+    (elements, offset) = readStrings(view, offset)
+    universe = NSuniverse(elements)
+    universe.setName(name[0])
+    return universe, offset
+
+
+# ricostruisce l'oggetto memorizzato in un file
+def decode(view, packed=False, path=None):
+    """
+    Rebuilds the object stored in the memory view of a file saved by NSsave. If the path of the file is given,
+    a family is opened as a read-only NSmappedfamily reading its degrees directly from the file.
+    """
+    (magic, version, kind, typecode) = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("the file is not a neutrosophic binary file")
+    if version > VERSION:
+        raise ValueError(f"unsupported version {version} of the neutrosophic binary format")
+    offset = HEADER.size
+    if kind == MAPPING:
+        (name, offset) = readStrings(view, offset)
+        (domain, offset) = readUniverse(view, offset)
+        (codomain, offset) = readUniverse(view, offset)
+        (targets, offset) = readArray(view, offset, typecode.decode())
+        values = codomain.get()
+        mapping = NSmapping(domain, codomain, [values[t] for t in targets])
+        mapping.setName(name[0])
+        return mapping
+    if kind not in (SET, FAMILY):
+        raise ValueError(f"unknown kind {kind} of object in the neutrosophic binary file")
+    (universe, offset) = readUniverse(view, offset)
+    (names, offset) = readStrings(view, offset)
+    if path is not None and kind == FAMILY and byteorder == "little" and universe.cardinality() > 0:
+        (count, length) = COUNT.unpack_from(view, offset)
+        if count != 3 * universe.cardinality() * len(names) or length != count * array(typecode.decode()).itemsize:
+            raise ValueError("the number of degrees does not correspond with the number of elements")
+        return NSmappedfamily.fromFile(path, universe, names, offset + COUNT.size, typecode.decode())
+    (data, offset) = readArray(view, offset, typecode.decode())
+    if packed and kind == FAMILY:
+        return NSpackedfamily(universe, data, names)
+    size = 3 * universe.cardinality()
+    if len(data) != size * len(names):
+        raise ValueError("the number of degrees does not correspond with the number of elements")
+    sets = list()
+    for i in range(len(names)):
+        nset = NSset(universe, NSstorage(size // 3, data[i * size:(i + 1) * size]))
+        nset.setName(names[i])
+        sets.append(nset)
+    if kind == SET:
+        return sets[0]
+    family = NSfamily(sets)
+    family.setUniverse(universe)
+    return family
+
+
+# carica un oggetto da un file binario
+def NSload(path, mmap=False, packed=False):
+    """
+    Loads a neutrosophic set, a neutrosophic family or a mapping saved by NSsave.
+    The degrees are copied from the file with a single block copy, without parsing any number,
+    and keep the type code (float64 or quantized) with which they were saved.
+    ----
+    Parameters:
+    - path: path of the file
+    - mmap: if True a family is opened as a read-only NSmappedfamily object, which reads the degrees of its sets
+            directly from the memory mapping of the file, so that they are not copied in memory and no NSset object
+            is created until a set is accessed (on big-endian machines the family is loaded as usual);
+            a neutrosophic set or a mapping is loaded as usual
+    - packed: if True a family is loaded as an NSpackedfamily object, without creating the NSset objects
+    ----
+    Returns: the NSset, NSfamily (or NSpackedfamily or NSmappedfamily) or NSmapping object stored in the file
+    """
+    if mmap and packed:
+        raise ValueError("a family cannot be loaded both packed and memory-mapped")
+    with open(path, "rb") as file:
+        if not mmap:
+            return decode(memoryview(file.read()), packed)
+        with memorymap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return decode(view, path=path)
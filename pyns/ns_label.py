@@ -0,0 +1,63 @@
+class NSlabel:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_label.py
+    Class defining the deferred label of a neutrosophic set generated by an operation on a combination
+    of neutrosophic sets (e.g. an intersection of the sets of a subbase or a union of the sets of a base).
+    The label only keeps the names (strings or other labels) of the operands and is rendered as a string,
+    once, only when it is asked for, so that the generation of large families builds no strings.
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    # costruttore
+    def __init__(self, names, symbol, enclose=None):
+        """
+        Constructor of a deferred label.
+        ----
+        Parameters:
+        - names: list of the names of the operands (strings, NSlabel objects or None for unlabelled operands)
+        - symbol: symbol of the operation (e.g. "∩" or "∪") joining the names
+        - enclose: optional symbol such that, when there are more names, those containing it are enclosed
+                   in parentheses
+        """
+        self.__names = names
+        self.__symbol = symbol
+        self.__enclose = enclose
+        self.__text = None
+        self.__rendered = False
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce l'etichetta come stringa, costruendola solo la prima volta
+    def render(self):
+        """
+        Method that returns the label as a string, joining the non-empty names of the operands
+        with the symbol of the operation, or None if no operand is labelled
+        """
+        if not self.__rendered:
+            names = [str(name) for name in self.__names if name is not None]
+            names = [name for name in names if name]
+            if len(names) > 1 and self.__enclose:
+                names = [f"({name})" if self.__enclose in name else name for name in names]
+            self.__text = f" {self.__symbol} ".join(names) if names else None
+            self.__rendered = True
+            self.__names = None   # i nomi degli operandi non servono più
+        return self.__text
+
+
+    # restituisce l'etichetta come stringa col metodo speciale __str__
+    def __str__(self):
+        text = self.render()
+        return text if text is not None else ""
+
+
+    # formatta l'etichetta col metodo speciale __format__
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+    # restituisce l'etichetta come stringa col metodo speciale __repr__
+    def __repr__(self):
+        return f"NSlabel({self.render()!r})"
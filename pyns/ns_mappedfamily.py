@@ -0,0 +1,374 @@
+from .ns_universe import NSuniverse
+from .ns_set import NSset
+from .ns_storage import NSstorage
+from .ns_progress import NSprogress
+from .ns_closure import searchCounterexample, closureReport, topologyReport
+from .ns_label import NSlabel
+#--
+from array import array
+from hashlib import blake2b
+from mmap import mmap, ACCESS_READ
+from tempfile import TemporaryFile
+from os import remove
+
+class NSmappedfamily:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_mappedfamily.py
+    Class defining an out-of-core family of distinct neutrosophic sets over a common universe, whose degrees
+    are kept in a memory-mapped file, in the same (k, n, 3) layout of NSpackedfamily, while only a hash index
+    of 16-byte digests of the canonical forms of the sets and their names are kept in memory.
+    The sets can be appended one at a time as they are produced and are materialized as NSset objects
+    only when they are accessed, so that the family can be larger than the available memory.
+    The file holds only the raw degrees and is a scratch file, deleted when the family is closed:
+    the family can be kept by saving it with NSsave (see ns_io), which streams its degrees from the file,
+    and reopened read-only by NSload with mmap=True, which reads them directly from the saved file.
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    # costruttore
+    def __init__(self, universe, path=None, capacity=1024, typecode=None):
+        """
+        Constructor of an empty out-of-core family of neutrosophic sets.
+        ----
+        Parameters:
+        - universe: the common universe (NSuniverse object) of the neutrosophic sets
+        - path: optional path of the scratch file receiving the degrees (which is overwritten and deleted
+                when the family is closed); if omitted an anonymous temporary file is used
+        - capacity: initial number of neutrosophic sets which the file can hold (it is doubled when needed)
+        - typecode: optional type code of the degrees stored in the file, to which the degrees of the appended sets
+                    are converted (by default float64)
+        """
+        if type(universe) != NSuniverse:
+            raise ValueError("the first parameter is not a universe set")
+        if universe.cardinality() == 0:
+            raise IndexError("the universe set must contain at least an element")
+        self.__universe = universe
+        if typecode is not None and typecode not in NSstorage.scales:
+            raise ValueError(f"unknown type code {typecode} of the degrees")
+        typecode = typecode or NSstorage.typecode
+        capacity = max(1, capacity)
+        file = TemporaryFile() if path is None else open(path, "w+b")
+        file.truncate(capacity * 3 * universe.cardinality() * array(typecode).itemsize)
+        self.__setup(universe, typecode, path, file, mmap(file.fileno(), 0), 0, capacity, list())
+
+
+    # metodo statico che apre in sola lettura una famiglia memorizzata in un file
+    @staticmethod
+    def fromFile(path, universe, names, offset, typecode):
+        """
+        Opens read-only the out-of-core family of the neutrosophic sets whose degrees are stored in an existing file,
+        in the (k, n, 3) layout, starting from a given offset (e.g. a family saved by NSsave, see NSload).
+        The degrees are read directly from the memory mapping of the file, so that they are never copied as a whole
+        and no NSset object is created until a set is accessed.
+        ----
+        Parameters:
+        - path: path of the file
+        - universe: the common universe (NSuniverse object) of the neutrosophic sets
+        - names: list of the k names (labels) of the neutrosophic sets
+        - offset: position in the file of the first degree
+        - typecode: type code of the stored degrees (in the byte order of the machine)
+        ----
+        Returns: the read-only NSmappedfamily object, to which no set can be appended
+        """
+        if type(universe) != NSuniverse:
+            raise ValueError("the second parameter is not a universe set")
+        if universe.cardinality() == 0:
+            raise IndexError("the universe set must contain at least an element")
+        with open(path, "rb") as file:
+            mapped = mmap(file.fileno(), 0, access=ACCESS_READ)   # la mappatura resta valida dopo la chiusura
+        if offset + len(names) * 3 * universe.cardinality() * array(typecode).itemsize > len(mapped):
+            mapped.close()
+            raise ValueError("the file does not contain the degrees of all the neutrosophic sets")
+        family = NSmappedfamily.__new__(NSmappedfamily)
+        family.__setup(universe, typecode, None, None, mapped, offset, len(names), list(names))
+        return family
+
+
+    # metodo privato che inizializza le proprietà della famiglia
+    def __setup(self, universe, typecode, path, file, mapped, offset, capacity, names):
+        """ private method that initializes the properties of a family whose degrees are mapped in memory
+        from the given offset of a file, which is None if the family is read-only
+        """
+        self.__universe = universe
+        self.__typecode = typecode   # tipo dei gradi memorizzati nel file
+        self.__size = 3 * universe.cardinality() * array(typecode).itemsize   # byte di ogni insieme
+        self.__path = path
+        self.__file = file
+        self.__map = mapped
+        self.__offset = offset   # posizione nel file del primo grado
+        self.__capacity = capacity
+        self.__k = len(names)
+        self.__names = names
+        self.__index = dict()      # impronta della forma canonica -> posizione
+        self.__overflow = dict()   # forma canonica -> posizione, per le (improbabili) collisioni delle impronte
+        self.__indexprecision = None   # valore di precisionequality con cui è stato costruito l'indice
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce l'universo comune degli insiemi neutrosofici
+    def getUniverse(self):
+        """
+        Method that returns the universe set of the neutrosophic sets of the family
+        """
+        return self.__universe
+
+
+    # restituisce il numero di insiemi neutrosofici
+    def cardinality(self):
+        """
+        Method that returns the number of neutrosophic sets of the family
+        """
+        return self.__k
+
+
+    # restituisce il numero di insiemi neutrosofici con il metodo speciale __len__
+    def __len__(self):
+        return self.__k
+
+
+    # restituisce i nomi degli insiemi neutrosofici
+    def getNames(self):
+        """
+        Method that returns the list of the names (labels) of the neutrosophic sets (None if not labelled)
+        """
+        return [name.render() if type(name) == NSlabel else name for name in self.__names]
+
+
+    # restituisce il tipo dei gradi memorizzati nel file
+    def getTypecode(self):
+        """
+        Method that returns the type code of the degrees stored in the file ("d", "H" or "B")
+        """
+        return self.__typecode
+
+
+    # restituisce il numero di byte occupati dai gradi nel file
+    def nbytes(self):
+        """
+        Method that returns the number of bytes occupied by the degrees in the file
+        """
+        return self.__k * self.__size
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce la posizione (non negativa) dell'i-esimo insieme neutrosofico
+    def __position(self, i):
+        """ private method that checks the index of a neutrosophic set of the family
+        and converts a negative index in the corresponding non-negative one
+        """
+        if not -self.__k <= i < self.__k:
+            raise IndexError("non-existent neutrosophic set")
+        return i % self.__k
+
+
+    # restituisce la memoria dei gradi dell'i-esimo insieme neutrosofico
+    def getStorage(self, i):
+        """
+        Method that returns a copy of the degrees of the i-th neutrosophic set, read from the file,
+        as an NSstorage object
+        """
+        i = self.__position(i)
+        data = array(self.__typecode)
+        start = self.__offset + i * self.__size
+        data.frombytes(self.__map[start:start + self.__size])
+        return NSstorage(self.__universe.cardinality(), data)
+
+
+    # restituisce i byte dei gradi di un intervallo di insiemi neutrosofici
+    def getBytes(self, start, stop):
+        """
+        Method that returns the raw bytes (in the byte order of the machine) of the degrees
+        of the neutrosophic sets of positions from start to stop (excluded), read from the file
+        """
+        if not 0 <= start <= stop <= self.__k:
+            raise IndexError("non-existent neutrosophic set")
+        return self.__map[self.__offset + start * self.__size:self.__offset + stop * self.__size]
+
+
+    # restituisce l'i-esimo insieme neutrosofico col metodo speciale __getitem__
+    def __getitem__(self, i):
+        """
+        Materializes the i-th neutrosophic set of the family as an NSset object
+        """
+        nset = NSset(self.__universe, self.getStorage(i))
+        nset.setName(self.__names[self.__position(i)])
+        return nset
+
+
+    # iteratore che materializza un insieme neutrosofico alla volta
+    def __iter__(self):
+        for i in range(self.__k):
+            yield self[i]
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce l'indice hash aggiornato alla precisione corrente
+    def __keyIndex(self):
+        """ private method that returns the pair formed by the index of the digests of the canonical forms
+        of the sets and by the dictionary of the canonical forms whose digests collide, rebuilding them
+        (reading the sets from the file) whenever precisionequality has changed since they were built;
+        if some sets coincide at the new precision, the first of them is indexed
+        """
+        precision = NSset.precisionequality
+        if self.__indexprecision != precision:
+            (self.__index, self.__overflow) = (dict(), dict())
+            self.__indexprecision = precision   # da qui __find usa l'indice in costruzione
+            for i in range(self.__k):
+                key = self.getStorage(i).key(precision)
+                if self.__find(key) is None:
+                    self.__insert(key, i)
+        return self.__index, self.__overflow
+
+
+    # metodo privato che inserisce nell'indice la forma canonica di un insieme
+    def __insert(self, key, i):
+        """ private method that indexes the canonical form of the i-th set, which does not belong to the index
+        """
+        digest = blake2b(key, digest_size=16).digest()
+        if digest in self.__index:
+            self.__overflow[key] = i
+        else:
+            self.__index[digest] = i
+
+
+    # metodo privato che restituisce la posizione di un insieme con una data forma canonica
+    def __find(self, key):
+        """ private method that returns the position of the neutrosophic set of the family having
+        the given canonical form (as returned by NSstorage.key), or None if it does not belong to the family.
+        The digest of the canonical form is looked up in the index and the set found is compared with it.
+        """
+        (index, overflow) = self.__keyIndex()
+        position = index.get(blake2b(key, digest_size=16).digest())
+        if position is None:
+            return None
+        if self.getStorage(position).key(NSset.precisionequality) == key:
+            return position
+        return overflow.get(key)
+
+
+    # verifica l'appartenenza di un insieme neutrosofico alla famiglia col metodo speciale __contains__
+    def __contains__(self, nset):
+        """
+        Checks by means of the hash index if a neutrosophic set belongs to the family
+        """
+        if type(nset) != NSset:
+            raise ValueError("the argument is not a neutrosophic set")
+        return self.__find(nset.key()) is not None
+
+
+    # aggiunge un insieme neutrosofico alla famiglia
+    def append(self, nset):
+        """
+        Appends a neutrosophic set to the family, writing its degrees at the end of the file,
+        unless it already belongs to the family.
+        ----
+        Parameters:
+        - nset: the neutrosophic set (over the universe of the family) to append
+        ----
+        Returns: True if the neutrosophic set has been appended, False if it already belonged to the family
+        """
+        if type(nset) != NSset:
+            raise ValueError("the argument is not a neutrosophic set")
+        if nset.getUniverseList() != self.__universe.get():
+            raise ValueError("the neutrosophic set is not defined over the universe of the family")
+        if self.__file is None:
+            raise ValueError("the family is read-only")
+        key = nset.key()
+        if self.__find(key) is not None:
+            return False
+        if self.__k == self.__capacity:   # raddoppia la capacità del file
+            self.__map.close()
+            self.__capacity *= 2
+            self.__file.truncate(self.__capacity * self.__size)
+            self.__map = mmap(self.__file.fileno(), self.__capacity * self.__size)
+        start = self.__k * self.__size
+        self.__map[start:start + self.__size] = NSstorage.convert(nset.getStorage().get(), self.__typecode).tobytes()
+        self.__insert(key, self.__k)
+        self.__names.append(nset.getLabel())
+        self.__k += 1
+        return True
+
+
+    # aggiunge più insiemi neutrosofici alla famiglia
+    def extend(self, nsets):
+        """
+        Appends all the neutrosophic sets of an iterable (e.g. a list or a generator) to the family
+        ----
+        Returns: the number of neutrosophic sets appended
+        """
+        return sum(self.append(nset) for nset in nsets)
+
+
+    # scrive su disco le modifiche e chiude il file
+    def close(self):
+        """
+        Closes and deletes the scratch file of the degrees (use NSsave before to keep the family),
+        or only closes the mapping of the file of a read-only family
+        """
+        if not self.__map.closed:
+            self.__map.close()
+            if self.__file is not None:
+                self.__file.close()
+            if self.__path is not None:
+                remove(self.__path)
+
+
+    # gestione del contesto col metodo speciale __enter__
+    def __enter__(self):
+        return self
+
+
+    # gestione del contesto col metodo speciale __exit__
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che verifica la chiusura rispetto a un'operazione
+    def __closureReport(self, operation, setoperation, operation_name, progress):
+        """ private method that checks if the family is closed under an operation applied to all the pairs of sets,
+        reading the degrees of the sets from the file, and returns an NSclosureReport object
+        """
+        (k, precision) = (self.__k, NSset.precisionequality)
+        belongs = lambda result: self.__find(result.key(precision)) is not None
+        search = lambda checkpoint: searchCounterexample(self.getStorage, k, belongs, operation, [2], progress,
+                                                         checkpoint)
+        return closureReport(self, search, setoperation, operation_name, k * (k - 1) // 2, progress)
+
+
+    # Metodo per verificare la chiusura rispetto all'unione
+    def NSunionClosed(self, trace=False, timereport=False, report=False, progress=None):
+        """
+        Method that checks if the family is closed under neutrosophic union, checking all the pairs of sets.
+        The parameters have the same meaning as in NSfamily.NSunionClosed.
+        """
+        progress = progress if progress is not None else NSprogress.printing(trace, timereport)
+        result = self.__closureReport(NSstorage.union, NSset.NSunion, "union", progress)
+        return result if report else result.isClosed()
+
+
+    # Metodo per verificare la chiusura rispetto all'intersezione
+    def NSintersectionClosed(self, trace=False, timereport=False, report=False, progress=None):
+        """
+        Method that checks if the family is closed under neutrosophic intersection, checking all the pairs of sets.
+        The parameters have the same meaning as in NSfamily.NSintersectionClosed.
+        """
+        progress = progress if progress is not None else NSprogress.printing(trace, timereport)
+        result = self.__closureReport(NSstorage.intersection, NSset.NSintersection, "intersection", progress)
+        return result if report else result.isClosed()
+
+
+    # Metodo che verifica se la famiglia costituisce una topologia neutrosofica
+    def isNeutrosophicTopology(self, trace=False, timereport=False, report=False, progress=None):
+        """
+        Method that checks if the family satisfies the axioms of a neutrosophic topology.
+        The parameters and the result have the same meaning as in NSfamily.isNeutrosophicTopology.
+        """
+        progress = progress if progress is not None else NSprogress.printing(trace, timereport)
+        unionclosed = lambda progress: self.NSunionClosed(report=True, progress=progress)
+        intersectionclosed = lambda progress: self.NSintersectionClosed(report=True, progress=progress)
+        result = topologyReport(self, self.__universe, unionclosed, intersectionclosed, progress)
+        return result if report else result.isClosed()
@@ -1,8 +1,12 @@
 from .ns_universe import NSuniverse
 from .ns_set import NSset
+from .ns_family import NSfamily
+from .ns_storage import NSstorage
+from .ns_packedfamily import NSpackedfamily
 #--
 from .ns_util import NSreplace, NSstringToDict, NSisExtDict
 import inspect
+from array import array
 
 class NSmapping:
     """
@@ -41,8 +45,8 @@ class NSmapping:
         elif length == 1:
             if type(args[0]) == NSmapping:  # se è un oggetto NSmapping lo ricopia
                 domain = args[0].getDomain()
-                codomain = args[0].getDomain()
-                map = args[0].getMap()
+                codomain = args[0].getCodomain()
+                map = dict(args[0].getMap())  # copia le corrispondenze per non condividerle con l'altro oggetto
             # -------------------------------------------------------
             elif type(args[0]) == dict:  # se è un dizionario
                 map = args[0]
@@ -131,6 +135,9 @@ class NSmapping:
         self.__codomain = codomain
         self.__map = map
         self.__name = None
+        self.__fibres = None    # indice codominio -> fibra, calcolato su richiesta
+        self.__targets = None   # posizioni nel codominio dei valori degli elementi del dominio, calcolate su richiesta
+        self.__segments = None  # posizioni delle fibre non vuote nel dominio, calcolate su richiesta
 
     #-----------------------------------
 
@@ -144,6 +151,16 @@ class NSmapping:
         var_name = next((nome for nome, valore in local_vars.items() if valore is self), None)
         self.__name = var_name
 
+    #-----------
+    # metodo che forza il nome (etichetta) dell'oggetto funzione neutrosofica
+    def setName(self, name):
+        """
+        method that forces the name (label) of the object neutrosophic mapping
+        Args:
+            name: name to assign
+        """
+        self.__name = name
+
     #-----------
     # metodo che restituisce il nome dell'oggetto funzione neutrosofica (se memorizzato)
     def getName(self):
@@ -161,7 +178,7 @@ class NSmapping:
         ----
         Returns: the universe set corresponding to the domain of the current mapping
         """
-        return NSuniverse(self.__domain.get())
+        return NSuniverse(self.__domain)
 
 
     # restituisce il codominio della funzione
@@ -170,7 +187,7 @@ class NSmapping:
         ----
         Returns: the universe set corresponding to the codomain of the current mapping
         """
-        return NSuniverse(self.__codomain.get())
+        return NSuniverse(self.__codomain)
 
 
     # restituisce le coppie elemento-valorej come dizionario
@@ -195,11 +212,15 @@ class NSmapping:
         """
         u = str(u)
         v = str(v)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.__domain.get():
+        if u not in self.__domain:
             raise IndexError("non-existent element in the domain of the mapping")
-        if v not in self.__codomain.get():
+        if v not in self.__codomain:
             raise IndexError("non-existent element in the codomain of the mapping")
         self.__map[u] = v
+        # invalida gli indici calcolati sulle corrispondenze precedenti
+        self.__fibres = None
+        self.__targets = None
+        self.__segments = None
 
 
     # ------------------------------------------------------------------------------------
@@ -215,13 +236,74 @@ class NSmapping:
         Returns: the value of u by the current mapping
         """
         u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.__domain.get():
+        if u not in self.__domain:
             raise IndexError("non-existent element in the domain of the mapping")
         return self.__map[u]
 
 
     # ------------------------------------------------------------------------------------
 
+    # metodo privato che restituisce l'indice delle fibre
+    def __fibreIndex(self):
+        """ private method that returns (computing and caching it, if necessary) the dictionary
+        associating to each element of the codomain its fibre, i.e. the list of the elements of the domain
+        having it as value (elements of the codomain with an empty fibre are missing)
+        """
+        if self.__fibres is None:
+            fibres = dict()
+            for e in self.__map:
+                fibres.setdefault(self.__map[e], []).append(e)
+            self.__fibres = fibres
+        return self.__fibres
+
+
+    # metodo privato che restituisce le posizioni nel codominio dei valori degli elementi del dominio
+    def __targetIndex(self):
+        """ private method that returns (computing and caching it, if necessary) the array whose i-th item
+        is the position in the codomain of the value of the i-th element of the domain
+        """
+        if self.__targets is None:
+            codomain = self.__codomain
+            self.__targets = array("q", [codomain.indexOf(self.__map[u]) for u in self.__domain.get()])
+        return self.__targets
+
+
+    # metodo privato che restituisce le posizioni nel dominio delle fibre non vuote
+    def __segmentIndex(self):
+        """ private method that returns (computing and caching it, if necessary) the list of the pairs (j, segment)
+        where j is the position of an element of the codomain with a non-empty fibre and segment is the list
+        of the positions in the domain of the elements of its fibre
+        """
+        if self.__segments is None:
+            segments = dict()
+            for (i, j) in enumerate(self.__targetIndex()):
+                segments.setdefault(j, []).append(i)
+            self.__segments = list(segments.items())
+        return self.__segments
+
+
+    # metodo privato che restituisce le posizioni dei gradi dei valori degli elementi del dominio
+    def __gatherIndex(self):
+        """ private method that returns the list of the positions, in the flat array of the degrees
+        of a neutrosophic set over the codomain, of the three degrees of the value of each element of the domain
+        """
+        return [h for j in self.__targetIndex() for h in (3 * j, 3 * j + 1, 3 * j + 2)]
+
+
+    # metodo privato che restituisce i gradi di un insieme neutrosofico nell'ordine di un dato universo
+    @staticmethod
+    def __degreesOver(nset, universe):
+        """ private method that returns the flat array of the degrees of a neutrosophic set
+        listed in the order of the elements of a given universe (that must be contained in that of nset)
+        """
+        data = nset.getStorage().get()
+        if nset.getUniverse() == universe:
+            return data
+        positions = [nset.getUniverse().indexOf(u) for u in universe.get()]   # solleva IndexError per elementi estranei
+        return array(data.typecode, [data[h] for k in positions for h in (3 * k, 3 * k + 1, 3 * k + 2)])
+
+    # ------------------------------------------------------------------------------------
+
     # ottiene la fibra della funzione di un determinato elemento del codominio
     def getFibre(self, v):
         """
@@ -234,12 +316,9 @@ class NSmapping:
         Returns: the fibre of v expressed as list of elements of the domain
         """
         v = str(v)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if v not in self.__codomain.get():
+        if v not in self.__codomain:
             raise IndexError("non-existent element in the codomain of the mapping")
-        fibre = list()
-        for e in self.__map:
-            if self.__map[e] == v:
-                fibre.append(e)
+        fibre = list(self.__fibreIndex().get(v, []))   # copia per non alterare l'indice
         return fibre
 
 
@@ -255,21 +334,8 @@ class NSmapping:
         ----
         Returns: neutrosophic image of nset by the current mapping
         """
-        result = NSset(self.__codomain)
-        for v in self.getCodomain():
-            fibre = self.getFibre(v)
-            if fibre == []:
-                triple = [1,1,0]
-            else:
-                mu_values = list()
-                sigma_values = list()
-                omega_values = list()
-                for u in fibre:
-                    mu_values.append(nset.getMembership(u))
-                    sigma_values.append(nset.getIndeterminacy(u))
-                    omega_values.append(nset.getNonMembership(u))
-                triple = [max(mu_values), max(sigma_values), min(omega_values)]  # i.e. (mu, sigma, omega)
-            result.setElement(v, triple)
+        data = self.__degreesOver(nset, self.__domain)
+        result = NSset(self.__codomain, NSstorage(self.__codomain.cardinality(), self.__imageDegrees(data, 1)))
         return result
 
 
@@ -283,13 +349,275 @@ class NSmapping:
         ----
         Returns: neutrosophic counterimage of nset by the current mapping
         """
-        result = NSset(self.__domain)
-        for u in self.getDomain():
-            value = self.getValue(u)
-            triple = nset.getElement(value)   # i.e. (mu, sigma, omega)
-            result.setElement(u, triple)
+        data = self.__degreesOver(nset, self.__codomain)
+        result = NSset(self.__domain, NSstorage(self.__domain.cardinality(), self.__counterimageDegrees(data, 1)))
         return result
 
+    # ------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce i gradi impacchettati di una famiglia nell'ordine di un dato universo
+    @staticmethod
+    def __packedOver(nsfamily, universe):
+        """ private method that returns the flat array of the degrees of all the sets of a neutrosophic family,
+        packed in a single (k, n, 3) array and listed in the order of the elements of a given universe
+        (that must be contained in that of the family)
+        """
+        if type(nsfamily) != NSfamily:
+            raise ValueError("the parameter is not a neutrosophic family")
+        if nsfamily.cardinality() == 0:
+            return array(NSstorage.typecode)
+        data = nsfamily.pack().get()
+        source = nsfamily.getUniverse()
+        if source == universe:
+            return data
+        positions = [source.indexOf(u) for u in universe.get()]   # solleva IndexError per elementi estranei
+        size = 3 * source.cardinality()
+        gather = [h for k in positions for h in (3 * k, 3 * k + 1, 3 * k + 2)]
+        return array(data.typecode, [data[base + h] for base in range(0, len(data), size) for h in gather])
+
+
+    # restituisce la famiglia impacchettata delle immagini degli insiemi di una famiglia
+    def __packedImages(self, nsfamily):
+        """ private method that returns the packed family of the images of the sets of a neutrosophic family,
+        listed in the same order, computed by a single segment reduction of the packed degrees of the family
+        """
+        data = self.__packedOver(nsfamily, self.__domain)
+        return NSpackedfamily(self.__codomain, self.__imageDegrees(data, nsfamily.cardinality()))
+
+
+    # restituisce la famiglia impacchettata delle controimmagini degli insiemi di una famiglia
+    def __packedCounterimages(self, nsfamily):
+        """ private method that returns the packed family of the counterimages of the sets of a neutrosophic family,
+        listed in the same order, computed by a single gather of the packed degrees of the family
+        """
+        data = self.__packedOver(nsfamily, self.__codomain)
+        return NSpackedfamily(self.__domain, self.__counterimageDegrees(data, nsfamily.cardinality()))
+
+
+    # restituisce la famiglia delle immagini degli insiemi neutrosofici di una famiglia
+    def NSimageFamily(self, nsfamily):
+        """
+        Method that returns the family of the neutrosophic images of the sets of a neutrosophic family
+        by the mapping. The degrees of the whole family are packed in a single array and the images of all
+        its sets are computed at once, by reducing the degrees of each fibre with (max, max, min).
+        ----
+        Parameters:
+        - nsfamily: neutrosophic family on the domain
+        ----
+        Returns: the neutrosophic family of the images of the sets of nsfamily by the current mapping
+        """
+        result = NSfamily(self.__packedImages(nsfamily))
+        result.setUniverse(self.__codomain)
+        return result
+
+
+    # restituisce la famiglia delle controimmagini degli insiemi neutrosofici di una famiglia
+    def NScounterimageFamily(self, nsfamily):
+        """
+        Method that returns the family of the neutrosophic counterimages of the sets of a neutrosophic family
+        by the mapping. The degrees of the whole family are packed in a single array and the counterimages
+        of all its sets are gathered at once.
+        ----
+        Parameters:
+        - nsfamily: neutrosophic family on the codomain
+        ----
+        Returns: the neutrosophic family of the counterimages of the sets of nsfamily by the current mapping
+        """
+        result = NSfamily(self.__packedCounterimages(nsfamily))
+        result.setUniverse(self.__domain)
+        return result
+
+    # ------------------------------------------------------------------------------------
+
+    # metodo privato che calcola i gradi delle immagini
+    def __imageDegrees(self, data, k):
+        """ private method that returns the flat array of the degrees of the images of k neutrosophic sets
+        by a single segment reduction: the degrees of the elements of each fibre are reduced with (max, max, min)
+        for all the k sets at once, while the elements of the codomain with an empty fibre receive (1, 1, 0).
+        ----
+        Parameters:
+        - data: flat array of the degrees of the k neutrosophic sets, each one in the order of the domain
+        - k: number of neutrosophic sets
+        ----
+        Returns: the flat array of the degrees of the k images over the codomain
+        """
+        (n, m) = (self.__domain.cardinality(), self.__codomain.cardinality())
+        image = NSstorage.encode([1, 1, 0], data.typecode) * (m * k)
+        if k == 0:
+            return image
+        stride = 3 * m   # distanza tra i gradi dello stesso elemento in due immagini consecutive
+        columns = (data[0::3], data[1::3], data[2::3])   # la colonna del grado c di u_i in tutti gli insiemi è columns[c][i::n]
+        for (j, segment) in self.__segmentIndex():
+            h = 3 * j
+            for (c, operation) in enumerate((max, max, min)):
+                column = columns[c]
+                if k == 1:   # un solo insieme: riduzione diretta dei gradi della fibra
+                    image[h + c] = operation(map(column.__getitem__, segment))
+                elif len(segment) == 1:
+                    image[h + c::stride] = column[segment[0]::n]
+                else:
+                    image[h + c::stride] = array(data.typecode, map(operation, *[column[i::n] for i in segment]))
+        return image
+
+
+    # metodo privato che calcola i gradi delle controimmagini
+    def __counterimageDegrees(self, data, k):
+        """ private method that returns the flat array of the degrees of the counterimages of k neutrosophic sets,
+        i.e. the degrees of the values of the elements of the domain, gathered in a single pass: the column
+        of every degree of an element of the codomain in all the k sets is copied at once to the elements of its fibre.
+        ----
+        Parameters:
+        - data: flat array of the degrees of the k neutrosophic sets, each one in the order of the codomain
+        - k: number of neutrosophic sets
+        ----
+        Returns: the flat array of the degrees of the k counterimages over the domain
+        """
+        if k == 1:
+            return array(data.typecode, map(data.__getitem__, self.__gatherIndex()))
+        (n, m) = (self.__domain.cardinality(), self.__codomain.cardinality())
+        counterimage = array(data.typecode, [0]) * (3 * n * k)
+        (size, stride) = (3 * m, 3 * n)   # distanze tra i gradi dello stesso elemento in due insiemi consecutivi
+        for (j, segment) in self.__segmentIndex():
+            for c in range(3):
+                column = data[3 * j + c::size]   # grado c di v_j in tutti gli insiemi
+                for i in segment:
+                    counterimage[3 * i + c::stride] = column
+        return counterimage
+
+
+    # ------------------------------------------------------------------------------------
+
+
+    # verifica se la funzione è iniettiva
+    def isInjective(self):
+        """
+        Method that checks if the mapping is injective, i.e. if distinct elements of the domain have distinct values
+        """
+        targets = self.__targetIndex()
+        return len(set(targets)) == len(targets)
+
+
+    # verifica se la funzione è suriettiva
+    def isSurjective(self):
+        """
+        Method that checks if the mapping is surjective, i.e. if every element of the codomain is the value
+        of some element of the domain
+        """
+        return len(set(self.__targetIndex())) == self.__codomain.cardinality()
+
+
+    # verifica se la funzione è biettiva
+    def isBijective(self):
+        """
+        Method that checks if the mapping is bijective, i.e. injective and surjective
+        """
+        return self.__domain.cardinality() == self.__codomain.cardinality() and self.isInjective()
+
+    # ------------------------------------------------------------------------------------
+
+    # metodo privato che verifica che due famiglie siano definite sul dominio e sul codominio
+    def __checkTopologies(self, nstopology1, nstopology2):
+        """ private method that raises an error if the two parameters are not neutrosophic families
+        on the domain and on the codomain of the mapping, respectively
+        """
+        if type(nstopology1) != NSfamily or type(nstopology2) != NSfamily:
+            raise ValueError("the parameters are not neutrosophic families")
+        if nstopology1.getUniverse() is None or nstopology2.getUniverse() is None:   # famiglie vuote, prive di universo
+            raise ValueError("the neutrosophic families are empty")
+        if nstopology1.getUniverse() != self.__domain:
+            raise ValueError("the first neutrosophic family is not defined on the domain of the mapping")
+        if nstopology2.getUniverse() != self.__codomain:
+            raise ValueError("the second neutrosophic family is not defined on the codomain of the mapping")
+
+
+    # restituisce un aperto del codominio la cui controimmagine non è aperta
+    def NScontinuityCounterexample(self, nstopology1, nstopology2):
+        """
+        Method that looks for a counterexample to the neutrosophic continuity of the mapping, i.e. an open set
+        of the codomain whose counterimage is not open in the domain. The counterimages of all the open sets
+        are computed at once on the packed degrees of the topology and are materialized one at a time,
+        so that the search stops at the first counterexample.
+        ----
+        Parameters:
+        - nstopology1: neutrosophic topology on the domain
+        - nstopology2: neutrosophic topology on the codomain
+        ----
+        Returns: the first open set of nstopology2 whose counterimage does not belong to nstopology1, or None
+        """
+        self.__checkTopologies(nstopology1, nstopology2)
+        counterimages = self.__packedCounterimages(nstopology2)
+        for (i, B) in enumerate(nstopology2):
+            if counterimages[i] not in nstopology1:
+                return B
+        return None
+
+
+    # restituisce un aperto del dominio la cui immagine non è aperta
+    def NSopennessCounterexample(self, nstopology1, nstopology2):
+        """
+        Method that looks for a counterexample to the neutrosophic openness of the mapping, i.e. an open set
+        of the domain whose image is not open in the codomain. The images of all the open sets
+        are computed at once on the packed degrees of the topology and are materialized one at a time,
+        so that the search stops at the first counterexample.
+        ----
+        Parameters:
+        - nstopology1: neutrosophic topology on the domain
+        - nstopology2: neutrosophic topology on the codomain
+        ----
+        Returns: the first open set of nstopology1 whose image does not belong to nstopology2, or None
+        """
+        self.__checkTopologies(nstopology1, nstopology2)
+        images = self.__packedImages(nstopology1)
+        for (i, A) in enumerate(nstopology1):
+            if images[i] not in nstopology2:
+                return A
+        return None
+
+
+    # verifica se la funzione è neutrosoficamente continua
+    def isNScontinuous(self, nstopology1, nstopology2):
+        """
+        Method that checks if the mapping is neutrosophically continuous with respect to two neutrosophic topologies,
+        i.e. if the counterimage of every open set of the codomain is open in the domain.
+        ----
+        Parameters:
+        - nstopology1: neutrosophic topology on the domain
+        - nstopology2: neutrosophic topology on the codomain
+        ----
+        Returns: True if the mapping is neutrosophically continuous, False otherwise
+        """
+        return self.NScontinuityCounterexample(nstopology1, nstopology2) is None
+
+
+    # verifica se la funzione è neutrosoficamente aperta
+    def isNSopen(self, nstopology1, nstopology2):
+        """
+        Method that checks if the mapping is neutrosophically open with respect to two neutrosophic topologies,
+        i.e. if the image of every open set of the domain is open in the codomain.
+        ----
+        Parameters:
+        - nstopology1: neutrosophic topology on the domain
+        - nstopology2: neutrosophic topology on the codomain
+        ----
+        Returns: True if the mapping is neutrosophically open, False otherwise
+        """
+        return self.NSopennessCounterexample(nstopology1, nstopology2) is None
+
+
+    # verifica se la funzione è un omeomorfismo neutrosofico
+    def isNShomeomorphism(self, nstopology1, nstopology2):
+        """
+        Method that checks if the mapping is a neutrosophic homeomorphism with respect to two neutrosophic topologies,
+        i.e. if it is bijective, neutrosophically continuous and neutrosophically open.
+        ----
+        Parameters:
+        - nstopology1: neutrosophic topology on the domain
+        - nstopology2: neutrosophic topology on the codomain
+        ----
+        Returns: True if the mapping is a neutrosophic homeomorphism, False otherwise
+        """
+        return (self.isBijective() and self.isNScontinuous(nstopology1, nstopology2)
+                and self.isNSopen(nstopology1, nstopology2))
 
     # ------------------------------------------------------------------------------------
 
@@ -0,0 +1,282 @@
+from .ns_universe import NSuniverse
+from .ns_set import NSset
+from .ns_storage import NSstorage
+#--
+from .ns_util import complementName, operationName
+from array import array
+from operator import le
+
+class NSpackedfamily:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_packedfamily.py
+    Class defining the packed (columnar) representation of a family of neutrosophic sets over a common universe,
+    i.e. a (k, n, 3) array of float64 (or quantized) values in row-major order whose i-th block of 3*n values contains
+    the degrees of the i-th neutrosophic set of the family. The neutrosophic sets are materialized
+    as NSset objects only when they are accessed.
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    # costruttore
+    def __init__(self, universe, data=None, names=None):
+        """
+        Constructor of the packed representation of a family of neutrosophic sets.
+        ----
+        Parameters:
+        - universe: the common universe (NSuniverse object) of the neutrosophic sets
+        - data: optional flat sequence of the 3*n*k already validated degrees of the k neutrosophic sets;
+                if omitted the packed family is empty
+        - names: optional list of the k names (labels) of the neutrosophic sets
+        """
+        if type(universe) != NSuniverse:
+            raise ValueError("the first parameter is not a universe set")
+        if data is None:
+            data = array(NSstorage.typecode)
+        elif type(data) != array or data.typecode not in NSstorage.scales:
+            data = NSstorage.encode(data)
+        size = 3 * universe.cardinality()   # numero di gradi di ogni insieme neutrosofico
+        if (size == 0 and len(data) > 0) or (size > 0 and len(data) % size != 0):
+            raise IndexError("the number of degrees does not correspond with the number of elements")
+        k = len(data) // size if size > 0 else 0
+        if names is None:
+            names = [None] * k
+        elif len(names) != k:
+            raise IndexError("the number of names does not correspond with the number of neutrosophic sets")
+        self.__universe = universe
+        self.__size = size
+        self.__k = k
+        self.__data = data
+        self.__names = list(names)
+        self.__blocks = None   # blocchi dei gradi ordinati per l'inclusione (calcolati quando servono)
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce l'universo comune degli insiemi neutrosofici
+    def getUniverse(self):
+        """
+        Method that returns the universe set of the neutrosophic sets of the packed family
+        """
+        return self.__universe
+
+
+    # restituisce il numero di insiemi neutrosofici
+    def cardinality(self):
+        """
+        Method that returns the number of neutrosophic sets of the packed family
+        """
+        return self.__k
+
+
+    # restituisce il numero di insiemi neutrosofici con il metodo speciale __len__
+    def __len__(self):
+        return self.__k
+
+
+    # restituisce l'array contiguo dei gradi
+    def get(self):
+        """
+        Method that returns the flat contiguous array of the degrees of all the neutrosophic sets
+        """
+        return self.__data
+
+
+    # restituisce i nomi degli insiemi neutrosofici
+    def getNames(self):
+        """
+        Method that returns the list of the names (labels) of the neutrosophic sets (None if not labelled)
+        """
+        return list(self.__names)
+
+
+    # restituisce l'occupazione di memoria dei gradi in byte
+    def nbytes(self):
+        """
+        Method that returns the number of bytes occupied by the degrees
+        """
+        return self.__data.itemsize * len(self.__data)
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce la posizione (non negativa) dell'i-esimo insieme neutrosofico
+    def __position(self, i):
+        """ private method that checks the index of a neutrosophic set of the packed family
+        and converts a negative index in the corresponding non-negative one
+        """
+        if not -self.__k <= i < self.__k:
+            raise IndexError("non-existent neutrosophic set")
+        return i % self.__k
+
+
+    # restituisce la memoria dei gradi dell'i-esimo insieme neutrosofico
+    def getStorage(self, i):
+        """
+        Method that returns a copy of the degrees of the i-th neutrosophic set as an NSstorage object
+        """
+        i = self.__position(i)
+        size = self.__size
+        return NSstorage(size // 3, self.__data[i * size:(i + 1) * size])
+
+
+    # restituisce l'i-esimo insieme neutrosofico col metodo speciale __getitem__
+    def __getitem__(self, i):
+        """
+        Materializes the i-th neutrosophic set of the packed family as an NSset object
+        """
+        nset = NSset(self.__universe, self.getStorage(i))
+        nset.setName(self.__names[self.__position(i)])
+        return nset
+
+
+    # iteratore che materializza un insieme neutrosofico alla volta
+    def __iter__(self):
+        for i in range(self.__k):
+            yield self[i]
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce i gradi di tutti gli insiemi come un'unica memoria
+    def __whole(self):
+        """ private method that returns the degrees of all the neutrosophic sets as a single NSstorage
+        of n*k elements, so that the element-by-element kernels process the whole family in one pass
+        """
+        return NSstorage(self.__k * self.__size // 3, self.__data)
+
+
+    # famiglia dei complementari
+    def complement(self):
+        """
+        Returns the packed family of the neutrosophic complements of the sets of the current packed family,
+        computed on the whole array of the degrees at once.
+        """
+        names = [complementName(name) for name in self.__names]
+        return NSpackedfamily(self.__universe, self.__whole().complement().get(), names)
+
+
+    # metodo privato che applica un'operazione a tutte le coppie di insiemi neutrosofici
+    def __pairwise(self, operation, symbol):
+        """ private method that returns the packed family of the results of a neutrosophic operation
+        on all the pairs (A_i, A_j) with i < j, in lexicographic order. For each i the block of A_i
+        is repeated and combined with the blocks of all the following sets in a single pass.
+        """
+        (data, size, k, names) = (self.__data, self.__size, self.__k, self.__names)
+        result = array(data.typecode)
+        result_names = list()
+        for i in range(k - 1):
+            left = data[i * size:(i + 1) * size] * (k - 1 - i)
+            right = data[(i + 1) * size:]
+            m = len(left) // 3
+            result.extend(operation(NSstorage(m, left), NSstorage(m, right)).get())
+            result_names.extend(operationName(names[i], names[j], symbol) for j in range(i + 1, k))
+        return NSpackedfamily(self.__universe, result, result_names)
+
+
+    # unioni di tutte le coppie di insiemi neutrosofici
+    def pairwiseUnions(self):
+        """
+        Returns the packed family of the neutrosophic unions A_i ∪ A_j of all the pairs of sets
+        of the current packed family with i < j, in lexicographic order.
+        """
+        return self.__pairwise(NSstorage.union, "∪")
+
+
+    # intersezioni di tutte le coppie di insiemi neutrosofici
+    def pairwiseIntersections(self):
+        """
+        Returns the packed family of the neutrosophic intersections A_i ∩ A_j of all the pairs of sets
+        of the current packed family with i < j, in lexicographic order.
+        """
+        return self.__pairwise(NSstorage.intersection, "∩")
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce i blocchi dei gradi ordinati per l'inclusione
+    def __orderedBlocks(self):
+        """ private method that returns (computing and caching it, if necessary) the list of the blocks
+        of degrees of the neutrosophic sets with the non-membership degrees reversed, i.e. (mu, sigma, -omega),
+        so that A_i is a neutrosophic subset of A_j if and only if every value of the i-th block
+        is less than or equal to the corresponding value of the j-th block
+        """
+        if self.__blocks is None:
+            (size, k) = (self.__size, self.__k)
+            ordered = self.__whole().ordered()
+            self.__blocks = [ordered[i * size:(i + 1) * size] for i in range(k)]
+        return self.__blocks
+
+
+    # verifica se l'i-esimo insieme neutrosofico è contenuto nel j-esimo
+    def isSubset(self, i, j):
+        """
+        Checks if the i-th neutrosophic set of the packed family is a neutrosophic subset of the j-th one
+        """
+        blocks = self.__orderedBlocks()
+        return all(map(le, blocks[self.__position(i)], blocks[self.__position(j)]))
+
+
+    # matrice delle inclusioni tra gli insiemi neutrosofici
+    def subsetMatrix(self):
+        """
+        Returns the inclusion matrix of the packed family, i.e. the list of k lists of booleans
+        whose j-th value of the i-th list is True if and only if A_i is a neutrosophic subset of A_j.
+        Every inclusion is a single comparison of two blocks of degrees which stops at the first violation.
+        ----
+        Returns: the k x k inclusion matrix as a list of lists
+        """
+        blocks = self.__orderedBlocks()
+        return [[all(map(le, a, b)) for b in blocks] for a in blocks]
+
+
+    # metodo privato che calcola le maschere dei sovrainsiemi propri con bit indicizzati secondo un dato ordinamento
+    def __masks(self, order):
+        """ private method that returns the list of the bit masks of the proper supersets of the sets
+        of the packed family listed in a given order: the s-th bit of the r-th mask is set
+        if and only if the set order[r] is a proper neutrosophic subset of the set order[s].
+        The masks are computed one coordinate at a time: the sets are sorted by the value of the coordinate
+        and every mask is intersected with the union of the bits of the sets with a value not smaller than its own.
+        """
+        blocks = self.__orderedBlocks()
+        k = len(order)
+        bit = [1 << r for r in range(k)]
+        masks = [(1 << k) - 1] * k
+        for h in range(self.__size):
+            column = [blocks[i][h] for i in order]   # valori della coordinata h nell'ordine dato
+            ranks = sorted(range(k), key=column.__getitem__)
+            accumulated = 0   # bit degli insiemi con valore non minore di quello corrente
+            p = k - 1
+            while p >= 0:
+                value = column[ranks[p]]
+                q = p
+                while q >= 0 and column[ranks[q]] == value:   # gli insiemi con lo stesso valore
+                    accumulated |= bit[ranks[q]]
+                    q -= 1
+                for t in range(q + 1, p + 1):
+                    masks[ranks[t]] &= accumulated
+                p = q
+        # un insieme non è sovrainsieme proprio di sé stesso né degli insiemi uguali (ripetuti)
+        equals = dict()
+        for r in range(k):
+            key = blocks[order[r]].tobytes()
+            equals[key] = equals.get(key, 0) | bit[r]
+        return [masks[r] & ~equals[blocks[order[r]].tobytes()] for r in range(k)]
+
+
+    # ordine di inclusione stretta tra gli insiemi neutrosofici, rappresentato con maschere di bit
+    def supersetMasks(self):
+        """
+        Returns the strict inclusion order of the packed family as a pair (order, masks) where:
+        - order is a linear extension of the inclusion, i.e. the list of the positions of the k sets
+          arranged so that every set precedes all its proper supersets
+        - masks is the list of k integers used as bit masks such that the s-th bit of the r-th mask is set
+          if and only if the set order[r] is a proper neutrosophic subset of the set order[s]
+        All the comparisons are made in parallel on the bits of the masks, one coordinate at a time.
+        ----
+        Returns: the pair (order, masks)
+        """
+        k = self.__k
+        masks = self.__masks(list(range(k)))
+        # un insieme ha più sovrainsiemi propri di ogni suo sovrainsieme proprio, quindi ordinando
+        # per numero decrescente di sovrainsiemi si ottiene un'estensione lineare dell'inclusione
+        counts = [bin(mask).count("1") for mask in masks]
+        order = sorted(range(k), key=lambda i: -counts[i])
+        return order, self.__masks(order)
@@ -0,0 +1,116 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+ns_parallel.py
+Functions executed by the worker processes which check in parallel the closure of a neutrosophic family
+under neutrosophic union or intersection. The family is shipped to every process only once,
+as the flat array of the degrees of its sets, and each task examines the combinations of sets
+whose first set has one of the positions assigned to the task. With an already existing executor the degrees
+are written once to a file by the main process and each worker process reads them only at its first task.
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+"""
+from .ns_storage import NSstorage
+from itertools import combinations
+from functools import reduce
+from array import array
+
+# stato del processo di lavoro impostato dall'inizializzatore
+workerstate = dict()
+# numero di combinazioni esaminate tra due controlli dell'evento di arresto
+stopinterval = 1000
+
+
+# inizializza un processo di lavoro con i gradi degli insiemi della famiglia
+def initClosureWorker(n, data, precision, stop=None, payloadid=None):
+    """
+    Initializes a worker process rebuilding the storages of the sets of the family and their hash indexes.
+    ----
+    Parameters:
+    - n: cardinality of the universe
+    - data: flat array of the degrees of all the sets of the family
+    - precision: number of decimal places of the canonical forms of the sets
+    - stop: optional event set by the main process to stop the worker as soon as a counterexample is found
+    - payloadid: optional identifier of the family, used to recognize it in the following tasks
+    """
+    size = 3 * n
+    storages = [NSstorage(n, data[i * size:(i + 1) * size]) for i in range(len(data) // size)] if size > 0 else []
+    workerstate.clear()
+    workerstate["storages"] = storages
+    workerstate["rawindex"] = {s.key() for s in storages}
+    workerstate["index"] = {s.key(precision) for s in storages}
+    workerstate["precision"] = precision
+    workerstate["stop"] = stop
+    workerstate["payloadid"] = payloadid
+
+
+# carica la famiglia dal file scritto dal processo principale, se non è già stata caricata
+def loadClosurePayload(payloadid, path, n, typecode, precision):
+    """
+    Initializes a worker process with the degrees of the sets of the family written to a file by the main process,
+    unless it was already initialized with the same family by a previous task.
+    ----
+    Parameters:
+    - payloadid: unique identifier of the family
+    - path: path of the file holding the raw degrees of all the sets of the family
+    - n: cardinality of the universe
+    - typecode: type code of the degrees
+    - precision: number of decimal places of the canonical forms of the sets
+    """
+    if workerstate.get("payloadid") != payloadid:
+        data = array(typecode)
+        with open(path, "rb") as file:
+            data.frombytes(file.read())
+        initClosureWorker(n, data, precision, payloadid=payloadid)
+
+
+# verifica la chiusura sulle combinazioni che iniziano con gli insiemi assegnati
+def checkClosureChunk(operation, firsts, sizes, payload=None, stop=None):
+    """
+    Checks the closure under an operation of the combinations of sets of the family whose first set
+    has one of the given positions. The stop event is checked every stopinterval combinations,
+    so that a task ends shortly after another one has found a counterexample.
+    ----
+    Parameters:
+    - operation: operation between two NSstorage objects (NSstorage.union or NSstorage.intersection)
+    - firsts: positions of the first sets of the combinations to examine
+    - sizes: numbers of sets of the combinations to examine (at least 2)
+    - payload: optional arguments of loadClosurePayload, used when the worker was not initialized by the pool
+    - stop: optional (managed) event which replaces the one given to initClosureWorker
+    ----
+    Returns: the pair (examined, counterexample) where examined is the number of combinations examined
+             and counterexample is the tuple of the positions of the sets of a combination whose result
+             does not belong to the family (or None)
+    """
+    if stop is not None and stop.is_set():   # il compito è partito dopo che è stato trovato un controesempio
+        return 0, None
+    if payload is not None:
+        loadClosurePayload(*payload)
+    storages = workerstate["storages"]
+    (rawindex, index) = (workerstate["rawindex"], workerstate["index"])
+    precision = workerstate["precision"]
+    stop = stop if stop is not None else workerstate["stop"]
+    l = len(storages)
+    examined = 0
+    for i in firsts:
+        if stop is not None and stop.is_set():   # un altro processo ha già trovato un controesempio
+            break
+        A = storages[i]
+        for m in sizes:
+            if m == 2:   # coppie di insiemi
+                for j in range(i + 1, l):
+                    examined += 1
+                    if stop is not None and examined % stopinterval == 0 and stop.is_set():
+                        return examined, None
+                    result = operation(A, storages[j])
+                    if result.key() not in rawindex and result.key(precision) not in index:
+                        return examined, (i, j)
+            else:
+                for rest in combinations(range(i + 1, l), m - 1):
+                    examined += 1
+                    if stop is not None and examined % stopinterval == 0 and stop.is_set():
+                        return examined, None
+                    result = reduce(operation, [storages[j] for j in rest], A)
+                    if result.key() not in rawindex and result.key(precision) not in index:
+                        return examined, (i,) + rest
+    return examined, None
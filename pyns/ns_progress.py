@@ -0,0 +1,156 @@
+from time import time
+from collections import namedtuple
+
+# evento strutturato inviato alle funzioni di notifica
+NSprogressEvent = namedtuple("NSprogressEvent", ["kind", "operation", "step", "total", "elapsed", "rate", "success"])
+NSprogressEvent.__doc__ = """
+    Structured event sent to the hooks of an NSprogress object, with fields:
+    - kind: "progress" for the intermediate events and "timing" for the final one of an operation
+    - operation: name of the operation (e.g. "union", "intersection", "topology")
+    - step: number of steps done
+    - total: total number of steps
+    - elapsed: time in seconds from the beginning of the operation
+    - rate: number of steps per second
+    - success: outcome of the operation (only for the timing events, None otherwise)
+    """
+
+
+class NSprogress:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_progress.py
+    Class defining the instrumentation of the long operations of the package: it sends structured
+    NSprogressEvent objects to a progress hook (throttled by a number of steps and by a time interval)
+    and to a timing hook called when an operation ends. Without hooks nothing is computed, so that
+    the loops of the operations only compare their step counter with a checkpoint never reached.
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    # costruttore
+    def __init__(self, onprogress=None, ontiming=None, every=1, interval=0.0):
+        """
+        Constructor of the instrumentation of an operation.
+        ----
+        Parameters:
+        - onprogress: function called with an NSprogressEvent of kind "progress" during the operation (or None)
+        - ontiming: function called with an NSprogressEvent of kind "timing" at the end of the operation (or None)
+        - every: minimum number of steps between two consecutive progress events
+        - interval: minimum time in seconds between two consecutive progress events
+        """
+        if every < 1:
+            raise ValueError("the number of steps between two progress events must be positive")
+        if interval < 0:
+            raise ValueError("the time interval between two progress events cannot be negative")
+        self.__onprogress = onprogress
+        self.__ontiming = ontiming
+        self.__every = every
+        self.__interval = interval
+        self.__operation = None
+        self.__total = 0
+        self.__start = 0.0
+        self.__last = 0.0        # istante dell'ultimo evento di avanzamento
+        self.__laststep = 0      # passo dell'ultimo evento di avanzamento
+
+    #------------------------------------------------------------------------------------
+
+    # costruttore alternativo che stampa sullo standard output come le opzioni trace e timereport
+    @staticmethod
+    def printing(trace=False, timereport=False):
+        """
+        Returns the NSprogress object which prints every step (if trace is True) and the time spent
+        by every operation (if timereport is True) on the standard output.
+        """
+        return NSprogress(NSprogress.printProgress if trace else None, NSprogress.printTiming if timereport else None)
+
+
+    # funzione di notifica che stampa l'avanzamento
+    @staticmethod
+    def printProgress(event):
+        """
+        Progress hook which prints the number of steps done out of the total on the standard output
+        """
+        print(f"Closure under neutrosophic {event.operation}: step {event.step:{len(str(event.total))}} / {event.total}")
+
+
+    # funzione di notifica che stampa il tempo impiegato
+    @staticmethod
+    def printTiming(event):
+        """
+        Timing hook which prints the outcome of the operation and the time spent on the standard output
+        """
+        hours, remainder = divmod(event.elapsed, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        status = "positive" if event.success else "negative"
+        print(f"Verification of closure under neutrosophic {event.operation} was {status} and lasted {int(hours)} hours, {int(minutes)} minutes, {seconds:.2f} seconds")
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che costruisce un evento
+    def __event(self, kind, step, success=None):
+        """ private method that builds the event of a given kind for the current operation
+        """
+        elapsed = time() - self.__start
+        rate = step / elapsed if elapsed > 0 else 0.0
+        return NSprogressEvent(kind, self.__operation, step, self.__total, elapsed, rate, success)
+
+
+    # inizia un'operazione
+    def start(self, operation, total, start_time=None):
+        """
+        Method that starts the instrumentation of a new operation.
+        ----
+        Parameters:
+        - operation: name of the operation
+        - total: total number of steps of the operation
+        - start_time: optional time (as returned by time.time) at which the operation began, if not now
+        ----
+        Returns: the first checkpoint, i.e. the step from which update should be called
+                 (a step never reached if there is no progress hook)
+        """
+        self.__operation = operation
+        self.__total = total
+        self.__start = self.__last = time() if start_time is None else start_time
+        self.__laststep = 0
+        return self.__every if self.__onprogress is not None else total + 1
+
+
+    # notifica l'avanzamento
+    def update(self, step):
+        """
+        Method called by the operation when the number of steps done reaches the checkpoint:
+        it sends a progress event unless the previous one was sent less than interval seconds ago.
+        ----
+        Returns: the next checkpoint
+        """
+        if self.__interval == 0 or time() - self.__last >= self.__interval:
+            self.__onprogress(self.__event("progress", step))
+            self.__last = time()
+            self.__laststep = step
+        return step + self.__every
+
+
+    # termina un'operazione
+    def finish(self, step, success=True):
+        """
+        Method that ends the current operation, sending the last progress event (if it was not already sent)
+        and the timing event with the outcome of the operation.
+        ----
+        Parameters:
+        - step: number of steps done
+        - success: outcome of the operation
+        """
+        if self.__onprogress is not None and step != self.__laststep:
+            self.__onprogress(self.__event("progress", step))
+            self.__laststep = step
+        self.timing(step, success)
+
+
+    # notifica il tempo impiegato
+    def timing(self, step, success=True):
+        """
+        Method that sends only the timing event of the current operation, with its outcome
+        """
+        if self.__ontiming is not None:
+            self.__ontiming(self.__event("timing", step, success))
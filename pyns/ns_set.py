@@ -1,9 +1,10 @@
-from os.path import extsep
-
 from .ns_universe import NSuniverse
+from .ns_storage import NSstorage
+from .ns_label import NSlabel
 #----
-from .ns_util import NSreplace, NSstringToTriplesList, NSsplitText, nameToBB
+from .ns_util import NSreplace, NSstringToDegrees, NSreadCSV, NSwriteCSV, NSsplitText, nameToBB, complementName, operationName
 import inspect
+from array import array
 
 class NSset:
     """
@@ -19,10 +20,11 @@ class NSset:
     degreename = ["membership", "indeterminacy", "non-membership"]   # names of the degrees
     reprmaxlength = 72  # maximum length in characters of the simplified printout of an NS-set
     precisiondegree = 3  # maximum number of decimal places for printing degrees
+    precisionequality = 9  # number of decimal places of the degrees considered by equality and hashing
 
 
     # costruttore
-    def __init__(self, *args):
+    def __init__(self, *args, typecode=None):
         """
         Generic constructor of an empty neutrosophic set defined over a universe
         or copied by another object neutrosophic set.
@@ -32,20 +34,22 @@ class NSset:
                 (list, tuple, string, list of values, universe set object)
                 or a pair constituted by an element attributable to a universe set
                 and a list of tuples of real values representing the membership degrees of the various elements
+        - typecode: optional type code of the stored degrees, i.e. "d" for float64 degrees, "H" for degrees quantized
+                    as uint16 with 4 decimal places or "B" for degrees quantized as uint8 with 2 decimal places
+                    (by default float64, or the type code of the copied neutrosophic set or storage)
         """
-        neutrosophicset = dict()    # dizionario di liste che contiene i valori dell'insieme neutrosofico
         #--------------------
         length = len(args)
         if length == 1:
             element = args[0]
             if type(element) in [list, tuple, str, NSuniverse]:   # viene passato un oggetto riconducibile a universo e generato un insieme neutrosofico vuoto
                 universe = NSuniverse(element)   # altri tipi vengono convertiti in oggetto universo
-                for e in universe.get():
-                    neutrosophicset[e] = [0,0,1]  # lista di tre elementi corrispondenti a appartenenza, indeterminatezza, non appartenenza
+                degrees = NSstorage(universe.cardinality(), typecode=typecode)  # ogni elemento riceve la tripla (0,0,1) di appartenenza, indeterminatezza, non appartenenza
             elif type(element) == NSset:
-                universe = element.getUniverseList() # viene copiato un oggetto insieme neutrosofico
-                for e in universe:
-                    neutrosophicset[e] = element.getElement(e)
+                universe = element.getUniverse() # viene copiato un oggetto insieme neutrosofico
+                degrees = element.getStorage().copy()
+                if typecode is not None:   # converte i gradi copiati nel tipo richiesto
+                    degrees = NSstorage(degrees.cardinality(), degrees.get(), typecode)
             else:
                 raise ValueError("obj not compatible with the type universe set")
         elif length == 2:
@@ -60,28 +64,39 @@ class NSset:
             if type(values) in [list ,tuple]:
                 if len(values) != len(universelist):
                     raise IndexError("the number of obj triples does not correspond with the number of elements")
-                for i in range(len(universelist)):
-                    elem = universelist[i]
-                    t = values[i]  # prende la tripla della lista corrispondente all'elemento secondo lo stesso ordine
+                data = array("d")   # array contiguo dei gradi di tutti gli elementi
+                for t in values:   # le triple seguono lo stesso ordine degli elementi dell'universo
                     if type(t) not in [tuple,list] or len(t) !=3:
                         raise IndexError("the second parameter of the constructor method must contain only triple")
                     t = [float(t[j]) for j in range(3)]
                     for j in range(3):   # controlla che i valori della tripla siano compatibili
                         if not 0 <= t[j] <= 1:
                             raise ValueError(f"incompatible {self.degreename[j]} degree obj")
-                    neutrosophicset[elem] = t
+                    data.extend(t)
+                degrees = NSstorage(len(universelist), NSstorage.encode(data, typecode))
             # ---- tratta il caso in cui il secondo parametro è una stringa
-            elif type(values) == str:   # preleva le triple (liste o tuple) dalla stringa fornita come secondo parametro
-                tpl_list = NSstringToTriplesList(values)
-                nset = NSset(universe, tpl_list)  # utilizza lo stesso costruttore
-                neutrosophicset = nset.get()
+            elif type(values) == str:   # preleva i gradi delle triple (liste o tuple) dalla stringa fornita come secondo parametro
+                data = NSstringToDegrees(values)
+                if len(data) != 3 * len(universelist):
+                    raise IndexError("the number of obj triples does not correspond with the number of elements")
+                NSset.checkDegrees(data)
+                degrees = NSstorage(len(universelist), NSstorage.encode(data, typecode))
+            # ---- tratta il caso in cui il secondo parametro è una memoria di gradi già validati
+            elif type(values) == NSstorage:
+                if values.cardinality() != len(universelist):
+                    raise IndexError("the number of obj triples does not correspond with the number of elements")
+                degrees = values.copy()   # la memoria viene copiata, così che non sia condivisa con altri insiemi
+                if typecode is not None:
+                    degrees = NSstorage(degrees.cardinality(), degrees.get(), typecode)
             else:
                 raise ValueError("the second parameter of the constructor method must contain a list of triples of real numbers")
         else:
             raise IndexError("the number of parameters do not match those of the constructor method")
         # memorizza i valori ottenuti nelle proprietà dell'oggetto
         self.__universe = universe
-        self.__neutrosophicset = neutrosophicset
+        self.__degrees = degrees
+        self.__key = None   # forma canonica dei gradi, calcolata su richiesta
+        self.__keyprecision = None
         self.__name = None
 
     #-----------------------------------
@@ -103,7 +118,7 @@ class NSset:
         """
         method that forces the name (label) of the object set neutrosophic
         Args:
-            name: name to assign
+            name: name to assign (a string or a deferred NSlabel object, rendered only when it is asked for)
         """
         self.__name = name
 
@@ -114,10 +129,36 @@ class NSset:
         """
         method that returns the name of the object neutrosophic set (if stored), otherwise returns None
         """
+        if type(self.__name) == NSlabel:   # l'etichetta differita viene costruita una sola volta
+            self.__name = self.__name.render()
+        return self.__name
+
+    #-----------
+
+    # metodo che restituisce il nome dell'oggetto insieme neutrosofico così come è memorizzato
+    def getLabel(self):
+        """
+        method that returns the name of the object neutrosophic set as it is stored, i.e. a string,
+        a deferred NSlabel object not yet rendered or None, so that it can be referenced by other labels
+        """
         return self.__name
 
     #------------------------------------------------------------------------------------
 
+    # metodo privato che restituisce la posizione dell'elemento u nell'universo
+    def __position(self, u):
+        """ private method that returns the position of a given element in the universe
+        of the current neutrosophic set, i.e. the row of its degrees in the storage.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the position of u
+        """
+        return self.__universe.indexOf(u)   # solleva IndexError se l'elemento non esiste
+
+    #------------------------------------------------------------------------------------
+
     # metodo privato che assegna l'i-esimo (i=0,1,2) grado dell'elemento u
     def __setDegree(self, u, i, r):
         """ private method that returns the i-th degree (for i=0,1,2) of a given element
@@ -128,13 +169,12 @@ class NSset:
         - i: index of the degree (i=0: membership, i=1: indeterminacy, i=2: non-membership
         . r: obj of the i-th degree
         """
-        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.getUniverseList():
-            raise IndexError("non-existent element")
+        k = self.__position(u)
         r = float(r)
         if not (0 <= r <= 1):
             raise ValueError(f"incompatible {self.degreename[i]} degree obj")
-        self.__neutrosophicset[u][i] = r
+        self.__degrees.setDegree(k, i, r)
+        self.__key = None
 
 
     #------------------------------------------------------------------------------------
@@ -223,8 +263,18 @@ class NSset:
     # metodo che restituisce l'intero insieme neutrosofico come dizionario
     def get(self):
         """ method that returns the dictionary containg the degrees of each element
+        (a new dictionary built on demand from the contiguous storage of the degrees,
+        so that modifying it does not change the neutrosophic set)
         """
-        return self.__neutrosophicset
+        return dict(zip(self.getUniverseList(), self.__degrees.tolist()))
+
+
+    # metodo che restituisce la memoria contigua dei gradi
+    def getStorage(self):
+        """ method that returns the object NSstorage containing the degrees of all the elements
+        in the same order of the universe
+        """
+        return self.__degrees
 
 
     # restituisce la lista dei gradi di appartenenza, indeterminazione e non appartenenza
@@ -238,10 +288,7 @@ class NSset:
         Returns: the list of floats containing the three degrees (membership, indeterminacy and non-membership)
         of the element u
         """
-        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.getUniverseList():
-            raise IndexError("non-existent element")
-        return self.__neutrosophicset[u]
+        return self.__degrees.getTriple(self.__position(u))
 
     #------------------------------------
 
@@ -257,10 +304,7 @@ class NSset:
         ----
         Returns: i-th degree of u
         """
-        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.getUniverseList():
-            raise IndexError("non-existent element")
-        return self.__neutrosophicset[u][i]
+        return self.__degrees.getDegree(self.__position(u), i)
 
 
     #------------------------------------
@@ -313,8 +357,8 @@ class NSset:
         """
         Makes the neutrosophic set equal to the null neutrosophic set.
         """
-        for e in self.__universe.get():
-            self.__neutrosophicset[e] = [0, 0, 1]
+        self.__degrees.fill([0, 0, 1])
+        self.__key = None
 
 
     # pone l'insieme neutrosofico uguale all'insieme neutrosofico assoluto
@@ -322,17 +366,17 @@ class NSset:
         """
         Makes the neutrosophic set equal to the absolute neutrosophic set.
         """
-        for e in self.__universe.get():
-            self.__neutrosophicset[e] = [1, 1, 0]
+        self.__degrees.fill([1, 1, 0])
+        self.__key = None
 
 
     #------------------------------------------------------------------------------------
 
     # metodo statico che restituisce l'insieme neutrosofico vuoto su un insieme universo
     @staticmethod
-    def EMPTY(univ):
+    def EMPTY(univ, typecode=None):
         universe = NSuniverse(univ)
-        nsempty = NSset(universe)
+        nsempty = NSset(universe, typecode=typecode)
         nsempty.setEmpty()
         nsempty.setName("\u2205\u0303")     # insieme vuoto con tilde
         return nsempty
@@ -340,22 +384,102 @@ class NSset:
 
     # metodo statico che restituisce l'insieme neutrosofico assoluto su un insieme universo
     @staticmethod
-    def ABSOLUTE(univ):
+    def ABSOLUTE(univ, typecode=None):
         nameuniv = univ.getName()
         if nameuniv:
             nameabsolute = nameToBB(nameuniv)
         else:
             nameabsolute = "\u2205\u0303"
         universe = NSuniverse(univ)
-        nsabsolute = NSset(universe)
+        nsabsolute = NSset(universe, typecode=typecode)
         nsabsolute.setAbsolute()
         nsabsolute.setName(nameabsolute)
         return nsabsolute
 
 
+    # metodo statico che controlla in blocco i gradi di un array
+    @staticmethod
+    def checkDegrees(data):
+        """
+        Checks at once that all the values of a flat array of degrees belong to the interval [0,1]
+        (NaN values do not pass the comparisons), raising a ValueError for the first incompatible one.
+        """
+        if not (all(map((0.0).__le__, data)) and all(map((1.0).__ge__, data))):
+            j = next(j for j in range(len(data)) if not 0 <= data[j] <= 1)
+            raise ValueError(f"incompatible {NSset.degreename[j % 3]} degree obj")
+
+    #------------------------------------------------------------------------------------
+
+    # metodo statico che legge un insieme neutrosofico da un file CSV
+    @staticmethod
+    def fromCSV(path, delimiter=None, chunksize=65536, typecode=None):
+        """
+        Reads a neutrosophic set from a CSV (or TSV) file whose rows contain an element of the universe
+        followed by its membership, indeterminacy and non-membership degrees, possibly preceded by a header.
+        The rows are streamed in chunks directly into the storage of the degrees, which are validated only once.
+        ----
+        Parameters:
+        - path: path of the file
+        - delimiter: separator of the columns (by default a tab for .tsv files and a comma otherwise)
+        - chunksize: number of rows converted at a time
+        - typecode: optional type code of the stored degrees (by default float64)
+        ----
+        Returns: the neutrosophic set, labelled with the name read from the header (if any)
+        """
+        (elements, names, arrays) = NSreadCSV(path, delimiter, chunksize)
+        if len(arrays) != 1:
+            raise IndexError(f"the file {path} contains {len(arrays)} neutrosophic sets (use NSfamily.fromCSV)")
+        NSset.checkDegrees(arrays[0])
+        universe = NSuniverse(elements)
+        nset = NSset(universe, NSstorage(universe.cardinality(), NSstorage.encode(arrays[0], typecode)))
+        nset.setName(names[0])
+        return nset
+
+
+    # metodo che scrive l'insieme neutrosofico in un file CSV
+    def toCSV(self, path, delimiter=None):
+        """
+        Writes the neutrosophic set to a CSV (or TSV) file, one row (element, mu, sigma, omega) for each
+        element of the universe after a header labelled with the name of the set, in a format read by fromCSV.
+        ----
+        Parameters:
+        - path: path of the file
+        - delimiter: separator of the columns (by default a tab for .tsv files and a comma otherwise)
+        """
+        NSwriteCSV(path, self.getUniverseList(), [self.getName()], [NSstorage.decode(self.__degrees.get())], delimiter)
+
+
     #------------------------------------------------------------------------------------
 
 
+    # metodo che restituisce la forma canonica (hashable) dell'insieme neutrosofico
+    def key(self):
+        """
+        Method that returns the canonical form of the neutrosophic set, i.e. a hashable key obtained
+        by quantizing its degrees to precisionequality decimal places, so that the floating-point noise
+        of chains of operations does not affect equality. The key is cached until the set is modified.
+        ----
+        Returns: the bytes of the quantized degrees of the current neutrosophic set
+        """
+        precision = self.precisionequality
+        if self.__key is None or self.__keyprecision != precision:
+            self.__key = self.__degrees.key(precision)
+            self.__keyprecision = precision
+        return self.__key
+
+
+    # restituisce il valore hash dell'insieme neutrosofico col metodo speciale __hash__
+    def __hash__(self):
+        """ Method that returns the hash of the canonical form of the neutrosophic set,
+        so that neutrosophic sets can be used in sets and as keys of dictionaries
+        (a neutrosophic set should not be modified while it is stored in them).
+        The hash also depends on the universe, so that neutrosophic sets defined on different universes,
+        which cannot be compared, are kept apart.
+        """
+        return hash((tuple(self.getUniverseList()), self.key()))
+
+    #------------------------------------------------------------------------------------
+
     # metodo che restituisce la cardinalità (il numero di elementi) dell'insieme neutrosofico
     def cardinality(self):
         """
@@ -384,13 +508,7 @@ class NSset:
         if self.getUniverseList() != nset.getUniverseList():
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
         else:
-            result = True
-            for e in self.getUniverseList():
-                (muA, sigmaA, omegaA) = self.getElement(e)
-                (muB, sigmaB, omegaB) = nset.getElement(e)
-                if (muA > muB) or (sigmaA > sigmaB) or (omegaA < omegaB):
-                    result = False
-                    break
+            result = self.__degrees.isSubset(nset.getStorage())
             return result
 
 
@@ -432,13 +550,8 @@ class NSset:
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
         if callable(fm) == False or callable(fs) == False or callable(fo) == False:
             raise  ValueError("the last three parameters must be functions")
-        C = NSset(self.__universe)
-        for e in self.getUniverseList():
-            (muA, sigmaA, omegaA) = self.getElement(e)
-            (muB, sigmaB, omegaB) = nset.getElement(e)
-            #----
-            triple = [fm(muA, muB), fs(sigmaA, sigmaB), fo(omegaA, omegaB)]   # i.e. (muC, sigmaC, omegaC)
-            C.setElement(e, triple)
+        # le tre funzioni vengono applicate colonna per colonna all'intera memoria dei gradi
+        C = NSset(self.__universe, self.__degrees.combine(nset.getStorage(), fm, fs, fo))
         return C
 
     #---------------------------------------------------------------
@@ -455,16 +568,8 @@ class NSset:
         """
         C = self.__NSoperation(nset, max, max, min)
         # Assegna l'etichetta al nuovo insieme neutrosofico
-        # Verifica e aggiunge parentesi per etichette composte
-        name_self = self.getName()
-        name_nset = nset.getName()
-        if name_self and any(op in name_self for op in ["∪", "∩", "∖"]):
-            name_self = f"({name_self})"
-        if name_nset and any(op in name_nset for op in ["∪", "∩", "∖"]):
-            name_nset = f"({name_nset})"
-        # Costruisci l'etichetta finale per l'unione
-        union_name = f"{name_self} ∪ {name_nset}" if name_self and name_nset else name_self or name_nset
-        C.setName(union_name)
+        # aggiungendo le parentesi per etichette composte
+        C.setName(operationName(self.getName(), nset.getName(), "∪"))
         return C
 
 
@@ -480,16 +585,8 @@ class NSset:
         """
         C = self.__NSoperation(nset, min, min, max)
         # Assegna l'etichetta al nuovo insieme neutrosofico
-        # Verifica e aggiunge parentesi per etichette composte
-        name_self = self.getName()
-        name_nset = nset.getName()
-        if name_self and any(op in name_self for op in ["∪", "∩", "∖"]):
-            name_self = f"({name_self})"
-        if name_nset and any(op in name_nset for op in ["∪", "∩", "∖"]):
-            name_nset = f"({name_nset})"
-        # Costruisci l'etichetta finale per l'intersezione
-        intersection_name = f"{name_self} ∩ {name_nset}" if name_self and name_nset else name_self or name_nset
-        C.setName(intersection_name)
+        # aggiungendo le parentesi per etichette composte
+        C.setName(operationName(self.getName(), nset.getName(), "∩"))
         return C
 
 
@@ -518,22 +615,11 @@ class NSset:
         ----
         Returns: the neutrosophic complement of the current neutrosophic set
         """
-        C = NSset(self.__universe)
-        for e in self.getUniverseList():
-            (muA, sigmaA, omegaA) = self.getElement(e)
-            #----
-            triple = [omegaA, 1 - sigmaA, muA]    # i.e. (muC, sigmaC, omegaC)
-            C.setElement(e, triple)
+        C = NSset(self.__universe, self.__degrees.complement())   # i.e. (omegaA, 1 - sigmaA, muA)
         # Imposta l'etichetta per il complemento, ad esempio "~A" o "~(A ∪ B)"
         name_self = self.getName()
         if name_self:
-            # Aggiunge il complemento con parentesi se l'etichetta è composta
-            complement_name = f"~{name_self}" if not any(
-                op in name_self for op in ["∪", "∩", "∖"]) else f"~({name_self})"
-            # Rimuove eventuali doppi complementi
-            while complement_name.startswith("~~"):
-                complement_name = complement_name[2:]  # Rimuove i tildi doppi iniziali
-            C.setName(complement_name)
+            C.setName(complementName(name_self))
         return C
 
     #----------------------------------
@@ -550,25 +636,11 @@ class NSset:
         """
         if self.getUniverseList() != nset.getUniverseList():
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
-        C = NSset(self.__universe)
-        for e in self.getUniverseList():
-            (muA, sigmaA, omegaA) = self.getElement(e)
-            (muB, sigmaB, omegaB) = nset.getElement(e)
-            #----
-            triple = [min(muA, omegaB), min(sigmaA, 1 - sigmaB), max(omegaA, muB)]   # i.e. (muC, sigmaC, omegaC)
-            C.setElement(e, triple)
+        # i.e. (min(muA, omegaB), min(sigmaA, 1 - sigmaB), max(omegaA, muB))
+        C = NSset(self.__universe, self.__degrees.difference(nset.getStorage()))
         # Assegna l'etichetta al nuovo insieme neutrosofico
-        # Verifica e aggiunge parentesi per etichette composte
-        name_self = self.getName()
-        name_nset = nset.getName()
-        # Aggiungi parentesi se l'etichetta contiene operatori ∪, ∩, o ∖
-        if name_self and any(op in name_self for op in ["∪", "∩", "∖"]):
-            name_self = f"({name_self})"
-        if name_nset and any(op in name_nset for op in ["∪", "∩", "∖"]):
-            name_nset = f"({name_nset})"
-        # Costruisci l'etichetta finale
-        difference_name = f"{name_self} ∖ {name_nset}" if name_self and name_nset else name_self or name_nset
-        C.setName(difference_name)
+        # aggiungendo le parentesi per etichette composte
+        C.setName(operationName(self.getName(), nset.getName(), "∖"))
         return C
 
 
@@ -582,13 +654,14 @@ class NSset:
         Parameters:
         - nset second neutrosophic set
         ----
-        Returns: True if the current neutrosophic set neutrosofically coincides with the second one
+        Returns: True if the current neutrosophic set neutrosofically coincides with the second one,
+        i.e. if their degrees coincide up to precisionequality decimal places
         """
         if type(nset) != NSset:
             raise ValueError("the second argument is not a neutrosophic set")
         if self.getUniverseList() != nset.getUniverseList():
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
-        equal = self.isNSsubset(nset) and nset.isNSsubset(self)
+        equal = self.key() == nset.key()
         return equal
 
 
@@ -604,8 +677,6 @@ class NSset:
         """
         if type(nset) != NSset:
             raise ValueError("the second argument is not a neutrosophic set")
-        if self.getUniverseList() != nset.getUniverseList():
-            raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
         different = not (self == nset)
         return different
 
@@ -684,8 +755,9 @@ class NSset:
         """
         labelname = ""
         if label:
-            if self.__name is not None:
-                labelname = f"{self.__name} = " if not tabularFormat else f"{self.__name}"
+            name = self.getName()
+            if name is not None:
+                labelname = f"{name} = " if not tabularFormat else f"{name}"
 
         # Formatta i gradi secondo precisiondegree
         precision = self.precisiondegree
@@ -698,8 +770,7 @@ class NSset:
             else:
                 (dashes, elemwidth, valwidth) = ("-" * 90, 36, 14)
             s = f"\n {labelname:{elemwidth}s} |   membership   |  indeterminacy | non-membership |\n" + dashes + "\n"
-            for e in self.getUniverseList():
-                (mu, sigma, omega) = self.getElement(e)
+            for e, (mu, sigma, omega) in zip(self.getUniverseList(), self.__degrees.tolist()):
                 s += f" {str(e):{elemwidth}} | {degree_format.format(mu):{valwidth}} | {degree_format.format(sigma):{valwidth}} | {degree_format.format(omega):{valwidth}} |\n"
             s += dashes + "\n"
         else:
@@ -746,7 +817,8 @@ class NSset:
         Returns: a detailed representation of the current neutrosophic set
         """
         labelname = ""
-        if self.__name is not None:
-            labelname = f"{self.__name} = "
+        name = self.getName()
+        if name is not None:
+            labelname = f"{name} = "
         s = f"Neutrosophic set: {labelname}{str(self)}"
         return s
\ No newline at end of file
@@ -0,0 +1,395 @@
+from array import array
+from operator import le, ge
+
+class NSstorage:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_storage.py
+    Class defining the contiguous storage of the degrees of a neutrosophic set,
+    i.e. an (n, 3) array of float64 values in row-major order whose i-th row contains
+    the membership, indeterminacy and non-membership degrees of the i-th element of the universe.
+    Optionally the degrees are quantized, i.e. stored as fixed-point unsigned integers (uint16 or uint8)
+    which are the degrees multiplied by a fixed scale: they are converted at the boundary of the class
+    (constructor, getters and setters), while the neutrosophic operations work directly on the integers.
+    The type code is a property of every storage, chosen when it is created (float64 by default),
+    so that storages of different type codes can still be combined (as float64 degrees)
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    #------------------ variabili di classe
+    typecode = "d"   # default type code of the array module used for the degrees (float64, or "H"/"B" if quantized)
+    scales = {"d": None, "H": 10000, "B": 100}   # scale of the fixed-point degrees of every type code (None if not quantized)
+
+
+    # costruttore
+    def __init__(self, n, data=None, typecode=None):
+        """
+        Constructor of the storage of the degrees of n elements.
+        ----
+        Parameters:
+        - n: number of elements (i.e. the cardinality of the universe)
+        - data: optional flat sequence of 3*n already validated degrees, taken as they are if it is an array
+                of one of the type codes of the storages and converted to the given type code otherwise;
+                if omitted all the elements receive the degrees (0,0,1) of the empty neutrosophic set
+        - typecode: optional type code of the degrees, i.e. "d" for float64 degrees, "H" for degrees quantized
+                    as uint16 with 4 decimal places or "B" for degrees quantized as uint8 with 2 decimal places
+                    (by default that of the given array or float64)
+        """
+        if data is None:
+            data = NSstorage.encode([0, 0, 1], typecode) * n
+        elif type(data) != array or data.typecode not in NSstorage.scales:
+            data = NSstorage.encode(data, typecode)
+        elif typecode is not None:
+            data = NSstorage.convert(data, typecode)
+        if len(data) != 3 * n:
+            raise IndexError("the number of degrees does not correspond with the number of elements")
+        self.__n = n
+        self.__data = data
+        self.__scale = NSstorage.scales[data.typecode]
+
+    #------------------------------------------------------------------------------------
+
+    # metodo statico che converte una sequenza di gradi reali in un dato tipo
+    @staticmethod
+    def encode(values, typecode=None):
+        """
+        Converts a flat sequence of real degrees into an array of the given type code
+        (by default float64), rounding the quantized degrees to the nearest fixed-point value.
+        An array of float64 degrees is returned as it is when the degrees are not quantized.
+        """
+        typecode = typecode or NSstorage.typecode
+        if typecode not in NSstorage.scales:
+            raise ValueError(f"unknown type code {typecode} of the degrees")
+        scale = NSstorage.scales[typecode]
+        if scale is None:
+            return values if type(values) == array and values.typecode == typecode else array(typecode, values)
+        return array(typecode, [int(x * scale + 0.5) for x in values])   # i gradi non sono negativi
+
+
+    # metodo statico che converte un array di gradi in un array di gradi reali
+    @staticmethod
+    def decode(data):
+        """
+        Converts an array of degrees of any type code into an array of float64 degrees
+        (the array itself if its degrees are not quantized).
+        """
+        scale = NSstorage.scales[data.typecode]
+        if scale is None:
+            return data
+        return array("d", [x / scale for x in data])
+
+
+    # metodo statico che converte un array di gradi in un dato tipo
+    @staticmethod
+    def convert(data, typecode=None):
+        """
+        Converts an array of degrees of any type code into an array of the given type code
+        (by default float64), returning the array itself if it has already that type code.
+        """
+        typecode = typecode or NSstorage.typecode
+        if data.typecode == typecode:
+            return data
+        return NSstorage.encode(NSstorage.decode(data), typecode)
+
+
+    # metodo privato che restituisce la memoria dei gradi come gradi reali
+    def __float(self):
+        """ private method that returns the storage itself if its degrees are not quantized
+        and a storage of the same degrees as float64 values otherwise; the binary operations
+        convert both the operands in this way when their degrees have different type codes
+        """
+        if self.__scale is None:
+            return self
+        return NSstorage(self.__n, NSstorage.decode(self.__data))
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce il numero di elementi memorizzati
+    def cardinality(self):
+        """
+        Method that returns the number of elements whose degrees are stored
+        """
+        return self.__n
+
+
+    # restituisce l'array contiguo dei gradi
+    def get(self):
+        """
+        Method that returns the flat contiguous array of the degrees, i.e. the sequence
+        mu_0, sigma_0, omega_0, mu_1, sigma_1, omega_1, ...
+        """
+        return self.__data
+
+
+    # restituisce il tipo dei gradi memorizzati
+    def getTypecode(self):
+        """
+        Method that returns the type code of the stored degrees ("d", "H" or "B")
+        """
+        return self.__data.typecode
+
+
+    # restituisce l'occupazione di memoria dei gradi in byte
+    def nbytes(self):
+        """
+        Method that returns the number of bytes occupied by the degrees
+        """
+        return self.__data.itemsize * len(self.__data)
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce la tripla dei gradi dell'elemento di posizione i
+    def getTriple(self, i):
+        """
+        Obtain the three degrees of the element of position i.
+        ----
+        Parameters:
+        - i: position of the element in the universe
+        ----
+        Returns: the list [mu, sigma, omega] of the degrees of the i-th element
+        """
+        k = 3 * i
+        if self.__scale is None:
+            return self.__data[k:k + 3].tolist()
+        return [x / self.__scale for x in self.__data[k:k + 3]]
+
+
+    # restituisce il j-esimo grado (j=0,1,2) dell'elemento di posizione i
+    def getDegree(self, i, j):
+        """
+        Obtain the j-th degree (j=0: membership, j=1: indeterminacy, j=2: non-membership)
+        of the element of position i.
+        """
+        if self.__scale is None:
+            return self.__data[3 * i + j]
+        return self.__data[3 * i + j] / self.__scale
+
+
+    # assegna la tripla dei gradi all'elemento di posizione i
+    def setTriple(self, i, triple):
+        """
+        Assign the three (already validated) degrees to the element of position i.
+        ----
+        Parameters:
+        - i: position of the element in the universe
+        - triple: sequence of membership, indeterminacy and non-membership degree
+        """
+        k = 3 * i
+        self.__data[k:k + 3] = NSstorage.encode(triple, self.__data.typecode)
+
+
+    # assegna il j-esimo grado (j=0,1,2) all'elemento di posizione i
+    def setDegree(self, i, j, r):
+        """
+        Assign the (already validated) j-th degree r to the element of position i.
+        """
+        self.__data[3 * i + j] = r if self.__scale is None else int(r * self.__scale + 0.5)
+
+
+    # assegna la stessa tripla a tutti gli elementi
+    def fill(self, triple):
+        """
+        Assign the same triple of degrees to all the elements.
+        """
+        self.__data[:] = NSstorage.encode(triple, self.__data.typecode) * self.__n
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce una copia indipendente della memoria dei gradi
+    def copy(self):
+        """
+        Method that returns an independent copy of the current storage
+        """
+        return NSstorage(self.__n, array(self.__data.typecode, self.__data))
+
+
+    # restituisce una chiave hashable che identifica i gradi memorizzati
+    def key(self, precision=None):
+        """
+        Method that returns a hashable key identifying the stored degrees.
+        ----
+        Parameters:
+        - precision: number of decimal places to which the degrees are quantized;
+                     if omitted the key is made of the raw bytes of the degrees
+        ----
+        Returns: bytes such that two storages have the same key if and only if
+                 all their (quantized) degrees coincide; the keys with a given precision
+                 of quantized and float64 storages of the same degrees coincide
+        """
+        if precision is None:
+            return self.__data.tobytes()
+        scale = 10 ** precision
+        if self.__scale is None:
+            return array("q", [int(x * scale + 0.5) for x in self.__data]).tobytes()   # i gradi non sono negativi
+        if scale % self.__scale == 0:   # conversione esatta tra interi
+            factor = scale // self.__scale
+            return array("q", [x * factor for x in self.__data]).tobytes()
+        return array("q", [int(x / self.__scale * scale + 0.5) for x in self.__data]).tobytes()
+
+
+    # restituisce la lista delle triple
+    def tolist(self):
+        """
+        Method that returns the degrees as a list of triples [mu, sigma, omega]
+        """
+        data = NSstorage.decode(self.__data)
+        return [data[k:k + 3].tolist() for k in range(0, len(data), 3)]
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce le tre colonne dei gradi
+    def __columns(self):
+        """ private method that returns the three columns of the membership, indeterminacy
+        and non-membership degrees as separate arrays
+        """
+        data = self.__data
+        return data[0::3], data[1::3], data[2::3]
+
+
+    # metodo privato che costruisce una nuova memoria a partire dalle tre colonne dei gradi
+    def __fromColumns(self, mu, sigma, omega):
+        """ private method that returns a new storage interleaving the three given columns
+        of membership, indeterminacy and non-membership degrees
+        """
+        typecode = self.__data.typecode
+        data = array(typecode, [0]) * (3 * self.__n)
+        data[0::3] = array(typecode, mu)
+        data[1::3] = array(typecode, sigma)
+        data[2::3] = array(typecode, omega)
+        return NSstorage(self.__n, data)
+
+
+    # metodo statico privato che restituisce i massimi elemento per elemento di due colonne
+    @staticmethod
+    def __maxima(x, y):
+        return [p if p > q else q for p, q in zip(x, y)]
+
+
+    # metodo statico privato che restituisce i minimi elemento per elemento di due colonne
+    @staticmethod
+    def __minima(x, y):
+        return [p if p < q else q for p, q in zip(x, y)]
+
+
+    # metodo privato che applica una funzione elemento per elemento a due colonne
+    def __apply(self, f, x, y):
+        """ private method that applies the function f element by element to two columns,
+        using the faster comprehension kernels for the built-in functions max and min,
+        which work directly on the quantized degrees as well
+        """
+        if f is max:
+            return self.__maxima(x, y)
+        if f is min:
+            return self.__minima(x, y)
+        scale = self.__scale
+        if scale is not None:   # le altre funzioni ricevono i gradi reali
+            (x, y) = ([p / scale for p in x], [q / scale for q in y])
+        result = [float(f(p, q)) for p, q in zip(x, y)]
+        for r in result:
+            if not 0 <= r <= 1:
+                raise ValueError("incompatible degree obj")
+        return result if scale is None else [int(r * scale + 0.5) for r in result]
+
+    #------------------------------------------------------------------------------------
+
+    # operazione generica su due memorie di gradi
+    def combine(self, other, fm, fs, fo):
+        """
+        Returns the storage obtained by applying element by element the functions fm, fs and fo
+        to the membership, indeterminacy and non-membership degrees of the current storage
+        and of the second one, respectively.
+        """
+        if self.__data.typecode != other.__data.typecode:   # gradi in rappresentazioni diverse
+            return self.__float().combine(other.__float(), fm, fs, fo)
+        (muA, sigmaA, omegaA) = self.__columns()
+        (muB, sigmaB, omegaB) = other.__columns()
+        return self.__fromColumns(self.__apply(fm, muA, muB),
+                                  self.__apply(fs, sigmaA, sigmaB),
+                                  self.__apply(fo, omegaA, omegaB))
+
+
+    # unione neutrosofica dei gradi
+    def union(self, other):
+        """
+        Returns the storage of the neutrosophic union, i.e. (max, max, min) of the degrees
+        """
+        if self.__data.typecode != other.__data.typecode:   # gradi in rappresentazioni diverse
+            return self.__float().union(other.__float())
+        (a, b) = (self.__data, other.__data)
+        data = array(a.typecode, self.__maxima(a, b))   # massimi di tutti i gradi
+        data[2::3] = array(a.typecode, self.__minima(a[2::3], b[2::3]))   # corregge i gradi di non appartenenza
+        return NSstorage(self.__n, data)
+
+
+    # intersezione neutrosofica dei gradi
+    def intersection(self, other):
+        """
+        Returns the storage of the neutrosophic intersection, i.e. (min, min, max) of the degrees
+        """
+        if self.__data.typecode != other.__data.typecode:   # gradi in rappresentazioni diverse
+            return self.__float().intersection(other.__float())
+        (a, b) = (self.__data, other.__data)
+        data = array(a.typecode, self.__minima(a, b))   # minimi di tutti i gradi
+        data[2::3] = array(a.typecode, self.__maxima(a[2::3], b[2::3]))   # corregge i gradi di non appartenenza
+        return NSstorage(self.__n, data)
+
+
+    # differenza neutrosofica dei gradi
+    def difference(self, other):
+        """
+        Returns the storage of the neutrosophic difference,
+        i.e. (min(muA, omegaB), min(sigmaA, 1 - sigmaB), max(omegaA, muB))
+        """
+        if self.__data.typecode != other.__data.typecode:   # gradi in rappresentazioni diverse
+            return self.__float().difference(other.__float())
+        (muA, sigmaA, omegaA) = self.__columns()
+        (muB, sigmaB, omegaB) = other.__columns()
+        one = self.__scale or 1.0   # il grado 1 nella rappresentazione dei gradi
+        return self.__fromColumns(self.__minima(muA, omegaB),
+                                  self.__minima(sigmaA, [one - q for q in sigmaB]),
+                                  self.__maxima(omegaA, muB))
+
+
+    # complementare neutrosofico dei gradi
+    def complement(self):
+        """
+        Returns the storage of the neutrosophic complement, i.e. (omega, 1 - sigma, mu)
+        """
+        (mu, sigma, omega) = self.__columns()
+        one = self.__scale or 1.0   # il grado 1 nella rappresentazione dei gradi
+        return self.__fromColumns(omega, [one - q for q in sigma], mu)
+
+
+    # inclusione neutrosofica dei gradi
+    def isSubset(self, other):
+        """
+        Returns True if the degrees of the current storage are neutrosophically contained
+        in those of the second one, i.e. muA <= muB, sigmaA <= sigmaB and omegaA >= omegaB
+        for every element
+        """
+        if self.__data.typecode != other.__data.typecode:   # gradi in rappresentazioni diverse
+            return self.__float().isSubset(other.__float())
+        (muA, sigmaA, omegaA) = self.__columns()
+        (muB, sigmaB, omegaB) = other.__columns()
+        return all(map(le, muA, muB)) and all(map(le, sigmaA, sigmaB)) and all(map(ge, omegaA, omegaB))
+
+
+    # restituisce i gradi con i gradi di non appartenenza rovesciati
+    def ordered(self, typecode=None):
+        """
+        Method that returns the flat array (mu, sigma, -omega) of the degrees, or (mu, sigma, scale - omega)
+        for quantized degrees, so that a storage is neutrosophically contained in another one if and only if
+        every value of its array is less than or equal to the corresponding value of the array of the other one.
+        ----
+        Parameters:
+        - typecode: optional type code to which the degrees are converted, so that the arrays
+                    of storages with different type codes can be compared (by default that of the storage)
+        """
+        data = NSstorage.convert(self.__data, typecode or self.__data.typecode)
+        data = array(data.typecode, data)
+        omega = data[2::3]
+        scale = NSstorage.scales[data.typecode]
+        data[2::3] = array(data.typecode, [-x for x in omega] if scale is None else [scale - x for x in omega])   # esatto
+        return data
@@ -21,6 +21,7 @@ class NSuniverse:
         - args: generic argument (list, tuple, string, list of values or an universe object)
         """
         universe = list()   # lista di stringhe
+        index = None        # indice hash elemento -> posizione
         #--------------------
         length = len(args)
         if length == 0:
@@ -31,7 +32,9 @@ class NSuniverse:
             if type(elem) in [list, tuple]:
                 universe = [str(e) for e in elem]
             elif type(elem) == NSuniverse:
+                # condivide la lista degli elementi e l'indice dell'universo già validato
                 universe = elem.get()
+                index = elem.__index
             elif type(elem) == str:
                 sostituz = { "{":"", "}":"", "[":"", "]":"", "(":"", ")":"",
                              ",":" ", ";":" " }
@@ -43,12 +46,15 @@ class NSuniverse:
         else:   # se la lunghezza è maggiore di 1
             for i in range(length):
                 universe.append(str(args[i]))
-        # controlla che non siano stati assegnati elementi ripetuti
-        univset = set(universe)
-        if len(universe) != len(univset):
-            raise ValueError("the universe set cannot contain repeated elements")
+        if index is None:
+            # costruisce l'indice hash che associa ad ogni elemento la sua posizione
+            index = {e: i for i, e in enumerate(universe)}
+            # controlla che non siano stati assegnati elementi ripetuti
+            if len(universe) != len(index):
+                raise ValueError("the universe set cannot contain repeated elements")
         # memorizza il valore ottenuto nella proprietà dell'oggetto
         self.__universe = universe
+        self.__index = index
         self.__name = None
 
 
@@ -106,6 +112,33 @@ class NSuniverse:
         """
         return len(self.__universe)
 
+
+    # metodo che restituisce la posizione di un elemento nell'universo
+    def indexOf(self, u):
+        """
+        Method that returns the position of a given element in the universe set
+        by means of the hash index built by the constructor.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the position (starting from 0) of u in the current universe set
+        """
+        try:
+            return self.__index[str(u)]   # converte in stringa perché l'universo è lista di stringhe
+        except KeyError:
+            raise IndexError("non-existent element") from None
+
+
+    # Ridefinizione dell'operatore "in" sovrascrivendo il metodo __contains__
+    def __contains__(self, u):
+        """
+        Checks if a given element belongs to the current universe set.
+        ----
+        Returns: True if u is an element of the universe set
+        """
+        return str(u) in self.__index
+
     #------------------------------------------------------------------------------------
 
     # restituisce True se l'insieme universo corrente è contenuto in quello
@@ -119,9 +152,7 @@ class NSuniverse:
         ----
         Returns: True if the current universe set is contained in the second one
         """
-        setself = set(self.get())
-        setunv = set(unv.get())
-        result = setself.issubset(setunv)
+        result = all(e in unv for e in self.get())
         return result
 
     #------------------------------------------------------------------------------------
@@ -133,7 +164,7 @@ class NSuniverse:
         ----
         Returns: True if the universes are equal
         """
-        equal = (self.get() == unv.get())
+        equal = (self.get() is unv.get()) or (self.get() == unv.get())
         return equal
 
 
@@ -7,8 +7,11 @@ author: Giorgio Nordo - Dipartimento MIFT. Università di Messina, Italy
 www.nordo.it   |  giorgio.nordo@unime.it
 """
 from enum import global_str
-from re import findall
+from re import findall, compile
 from ast import literal_eval
+from array import array
+from itertools import chain, islice
+import csv
 import inspect
 
 
@@ -43,6 +46,172 @@ def NSstringToTriplesList(text):
     return tpl_list
 
 
+# parentesi quadre convertite in tonde (con la stessa lunghezza, così che le posizioni nel testo non cambino)
+BRACKETS = str.maketrans("[]", "()")
+# tripla di gradi tra parentesi tonde, con un'eventuale virgola finale
+TRIPLE = compile(r"\(([^,()]*),([^,()]*),([^,()]*),?\s*\)")
+# numero di caratteri esaminati alla volta
+BLOCKSIZE = 1 << 20
+
+
+# converte una stringa di triple direttamente nell'array dei gradi
+def NSstringToDegrees(text, typecode="d"):
+    """
+    Converts a string containing a list of triples of real numbers, enclosed in parentheses or brackets
+    and separated by commas or semicolons, into the flat array of their values. The text is scanned
+    in blocks by a compiled regular expression whose numbers are converted in bulk into a single array,
+    without building the intermediate tuples of NSstringToTriplesList.
+    ----
+    Parameters:
+    - text: string
+    - typecode: type code of the array (by default "d", i.e. float64)
+    Returns: the array of the 3*k values of the k triples in the order in which they appear
+    """
+    text = text.translate(BRACKETS)
+    data = array(typecode)
+    (pos, length) = (0, len(text))
+    while pos < length:
+        # il blocco termina con una parentesi chiusa, così che nessuna tripla venga spezzata
+        endpos = text.find(")", min(pos + BLOCKSIZE, length - 1)) + 1 or length
+        triples = TRIPLE.findall(text, pos, endpos)
+        if len(triples) != text.count("(", pos, endpos):
+            malformedTriple(text, pos, endpos)
+        try:
+            data.extend(map(float, chain.from_iterable(triples)))
+        except ValueError:
+            malformedTriple(text, pos, endpos)
+        pos = endpos
+    return data
+
+
+# segnala la prima tripla non corretta di un blocco di testo
+def malformedTriple(text, pos, endpos):
+    """
+    Raises the exception describing the first malformed triple of the given block of a text of triples
+    (whose brackets are already converted into parentheses), reporting its offset in the text:
+    an IndexError if it does not contain three values and a ValueError otherwise.
+    """
+    start = text.find("(", pos, endpos)
+    while start >= 0:
+        match = TRIPLE.match(text, start)
+        if match is None:
+            end = text.find(")", start + 1)
+            content = text[start + 1:end if end >= 0 else len(text)]
+            if end < 0 or "(" in content:
+                raise ValueError(f"unbalanced parenthesis at offset {start} of the string of triples")
+            values = content.split(",")
+            if len(values) == 4 and not values[3].strip():   # virgola finale
+                values.pop()
+            if len(values) != 3:
+                raise IndexError(f"the value at offset {start} of the string of triples is not a triple")
+            raise ValueError(f"malformed triple at offset {start} of the string of triples: {text[start:end + 1]}")
+        try:
+            [float(value) for value in match.groups()]
+        except ValueError:
+            raise ValueError(f"malformed triple at offset {start} of the string of triples: {match.group()}")
+        start = text.find("(", match.end(), endpos)
+
+
+# restituisce il separatore di un file CSV o TSV
+def csvDelimiter(path, delimiter=None):
+    """
+    Returns the given delimiter or, if it is None, the one implied by the extension of the file,
+    i.e. a tab for the .tsv files and a comma otherwise
+    """
+    if delimiter is not None:
+        return delimiter
+    return "\t" if str(path).lower().endswith(".tsv") else ","
+
+
+# legge a blocchi di righe un file CSV di elementi e gradi
+def NSreadCSV(path, delimiter=None, chunksize=65536, typecode="d"):
+    """
+    Reads a CSV (or TSV) file whose rows contain an element followed by one or more triples of degrees
+    (membership, indeterminacy, non-membership), streaming the rows in chunks and converting the degrees
+    of each chunk in bulk into one array for every triple of columns, so that only the elements and the
+    arrays are kept in memory. A first row whose degrees are not numbers is taken as a header, in which
+    the columns of a triple can be labelled "name:mu", "name:sigma", "name:omega".
+    ----
+    Parameters:
+    - path: path of the file
+    - delimiter: separator of the columns (by default a tab for .tsv files and a comma otherwise)
+    - chunksize: number of rows converted at a time
+    - typecode: type code of the arrays of degrees
+    ----
+    Returns: the triple (elements, names, arrays) formed by the list of the elements, the list of the names
+             of the triples of columns (None when not labelled) and the list of the arrays of their degrees
+    """
+    elements = list()
+    (names, arrays) = (None, None)
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file, delimiter=csvDelimiter(path, delimiter))
+        while True:
+            chunk = [row for row in islice(reader, chunksize) if row]   # le righe vuote vengono ignorate
+            if not chunk:
+                break
+            if arrays is None:   # prima riga: intestazione oppure primo elemento
+                width = len(chunk[0])
+                if width < 4 or (width - 1) % 3 != 0:
+                    raise IndexError(f"the rows of {path} must contain an element followed by triples of degrees")
+                k = (width - 1) // 3
+                try:
+                    [float(value) for value in chunk[0][1:]]
+                    names = [None] * k
+                except ValueError:   # intestazione
+                    header = chunk.pop(0)
+                    names = [header[1 + 3 * g].rpartition(":")[0] or None for g in range(k)]
+                arrays = [array(typecode) for g in range(k)]
+            for row in chunk:
+                if len(row) != width:
+                    raise IndexError(f"the row of the element {row[0]} of {path} does not contain {width} values")
+            try:
+                for g in range(k):
+                    arrays[g].extend(map(float, chain.from_iterable(row[1 + 3 * g:4 + 3 * g] for row in chunk)))
+            except ValueError:
+                row = next(row for row in chunk if not all(isNumber(value) for value in row[1:]))
+                raise ValueError(f"the row of the element {row[0]} of {path} contains a value which is not a number")
+            elements.extend(row[0] for row in chunk)
+    if arrays is None:
+        raise IndexError(f"the file {path} does not contain any element")
+    return elements, names, arrays
+
+
+# verifica se una stringa rappresenta un numero reale
+def isNumber(text):
+    """
+    Returns True if the string represents a real number
+    """
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+# scrive a blocchi di righe un file CSV di elementi e gradi
+def NSwriteCSV(path, elements, names, arrays, delimiter=None):
+    """
+    Writes a CSV (or TSV) file whose rows contain an element followed by its degrees in one or more
+    neutrosophic sets, preceded by a header labelling the columns of every set with its name.
+    The rows are generated one at a time and the degrees are written with all their digits,
+    so that NSreadCSV reads back exactly the same values.
+    ----
+    Parameters:
+    - path: path of the file
+    - elements: list of the elements of the universe
+    - names: list of the names of the neutrosophic sets (None when not labelled)
+    - arrays: list of the flat arrays of the degrees of the neutrosophic sets
+    - delimiter: separator of the columns (by default a tab for .tsv files and a comma otherwise)
+    """
+    header = ["element"]
+    for name in names:
+        header.extend(f"{name}:{degree}" if name else degree for degree in ["mu", "sigma", "omega"])
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file, delimiter=csvDelimiter(path, delimiter))
+        writer.writerow(header)
+        writer.writerows([u] + [x for data in arrays for x in data[3 * i:3 * i + 3]] for (i, u) in enumerate(elements))
+
+
 # restituisce True se il valore è una stringa che rappresenta un dizionario esteso (con :, -> o |->)
 def NSisExtDict(obj):
     """
@@ -157,5 +326,36 @@ def isBB(text):
     returns True if the text of the label of a universe set is already expressed in blackboard style
     by checking if the text contains the unicode symbol for tilde ~
     """
-    ris = '\u0303' in text
-    return ris
\ No newline at end of file
+    ris = text is not None and '\u0303' in text
+    return ris
+
+#-------------
+
+# restituisce l'etichetta del risultato di un'operazione binaria tra insiemi neutrosofici etichettati
+def operationName(name1, name2, symbol):
+    """
+    Returns the label of the result of a binary operation (with symbol ∪, ∩ or ∖) between two neutrosophic sets
+    with given labels, e.g. "A ∪ B" or "(A ∩ B) ∖ C", enclosing the compound labels in parentheses
+    """
+    if name1 and any(op in name1 for op in ["∪", "∩", "∖"]):
+        name1 = f"({name1})"
+    if name2 and any(op in name2 for op in ["∪", "∩", "∖"]):
+        name2 = f"({name2})"
+    return f"{name1} {symbol} {name2}" if name1 and name2 else name1 or name2
+
+#-------------
+
+# restituisce l'etichetta del complementare di un insieme neutrosofico etichettato
+def complementName(name):
+    """
+    Returns the label of the complement of a neutrosophic set with a given label, e.g. "~A" or "~(A ∪ B)",
+    or None if the set has no label
+    """
+    if not name:
+        return None
+    # aggiunge il complemento con parentesi se l'etichetta è composta
+    complement_name = f"~{name}" if not any(op in name for op in ["∪", "∩", "∖"]) else f"~({name})"
+    # rimuove eventuali doppi complementi
+    while complement_name.startswith("~~"):
+        complement_name = complement_name[2:]  # rimuove i tildi doppi iniziali
+    return complement_name
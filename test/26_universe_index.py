@@ -0,0 +1,18 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+position of the elements of a universe set and membership test
+"""
+from NS.pyns.ns_universe import NSuniverse
+
+U = NSuniverse("a,b,c,d")
+print(f"U = {U}")
+print(f"position of c = {U.indexOf('c')}")
+print(f"b in U ? {'b' in U}")
+print(f"z in U ? {'z' in U}")
+
+V = NSuniverse(1,2,3)
+print(f"position of 2 = {V.indexOf(2)}")    # gli elementi vengono convertiti in stringhe
@@ -0,0 +1,31 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+closure of a neutrosophic family checked on pairs of sets or on all the combinations
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A3 = NSset(U, "(0.7,0.3,0.1), (0.8,0.4,0.0), (0.1,0.1,0.9)")
+
+T = NSfamily(A1, A2, A3).getNSTopologyBySubBase()
+print(f"la topologia ha cardinalità {T.cardinality()}")
+
+# verifica sulle coppie di insiemi (modalità predefinita)
+print(f"E' chiusa rispetto all'unione => {T.NSunionClosed(timereport=True)}")
+print(f"E' chiusa rispetto all'intersezione => {T.NSintersectionClosed(timereport=True)}")
+
+# verifica su tutte le combinazioni di insiemi di una topologia più piccola
+S = NSfamily(A1, A2).getNSTopologyBySubBase()
+print(f"E' chiusa rispetto all'unione => {S.NSunionClosed(timereport=True, exhaustive=True)}")
+
+L = NSfamily(A1, A2, A3)
+print(f"E' una topologia neutrosofica => {L.isNeutrosophicTopology()}")
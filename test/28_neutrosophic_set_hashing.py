@@ -0,0 +1,40 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+canonical form of neutrosophic sets used for equality, hashing and membership in families
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+A = NSset(U, "(0.3,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+B = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+
+# il rumore dei numeri in virgola mobile non altera l'uguaglianza
+C = NSset(U, [(0.1 + 0.2, 0.4, 0.3), (0.1, 0.1, 0.1), (0.2, 0.2, 0.2)])
+print(f"A = C ?  {A == C}")
+print(f"hash(A) = hash(C) ?  {hash(A) == hash(C)}")
+print(f"numero di insiemi distinti in {{A, B, C}} = {len({A, B, C})}")
+
+F = NSfamily(A, B, C)
+print(f"la famiglia ha cardinalità {F.cardinality()}")
+print(f"A ∪ B appartiene alla famiglia ?  {(A + B) in F}")
+print(f"A ∩ A appartiene alla famiglia ?  {(A & A) in F}")
+
+NSset.precisionequality = 1    # le uguaglianze vengono valutate alla prima cifra decimale
+D = NSset(U, "(0.32,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+print(f"A = D con una cifra decimale ?  {A == D}")
+print(f"A e D appartengono alla famiglia con una cifra decimale ?  {A in F} {D in F}")
+NSset.precisionequality = 9
+
+V = NSuniverse("x,y,z")
+E = NSset(V, "(0.3,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+try:
+    print(f"A = E su universi diversi ?  {A == E}")
+except ValueError as error:
+    print(f"A ed E non sono confrontabili: {error}")
+print(f"numero di insiemi distinti in {{A, E}} = {len({A, E})}")
@@ -0,0 +1,32 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+images and counterimages of all the sets of a neutrosophic family by a mapping
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from NS.pyns.ns_mapping import NSmapping
+
+U = NSuniverse("a,b,c,d,e")
+V = NSuniverse(1,2,3,4)
+
+f = NSmapping(U, V, (1,3,1,2,1))
+print("f =", f)
+
+A1 = NSset(U, "(0.7,0.3,0.1), (0.4,0.6,0.9), (0,0,1), (0.1,0.4,0.5), (0.2,0.2,0.3)")
+A2 = NSset(U, "(0.1,0.2,0.8), (0.5,0.5,0.5), (0.3,0.1,0.2), (0.9,0.1,0.1), (0.6,0.4,0.2)")
+F = NSfamily(A1, A2)
+print("F =", F)
+
+G = f.NSimageFamily(F)
+print("f(F) =", G)
+print(f"f(F) coincide con le immagini dei singoli insiemi ?  {G == NSfamily(f.NSimage(A1), f.NSimage(A2))}")
+
+H = f.NScounterimageFamily(G)
+print("f^-1(f(F)) =", H)
+print(f"ogni insieme di F è contenuto nella sua controimmagine dell'immagine ?  "
+      f"{all(A.isNSsubset(f.NScounterimage(f.NSimage(A))) for A in F)}")
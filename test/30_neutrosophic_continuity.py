@@ -0,0 +1,44 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic continuity and openness of a mapping between two neutrosophic topological spaces
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from NS.pyns.ns_mapping import NSmapping
+
+U = NSuniverse("a,b,c,d")
+V = NSuniverse("x,y,z")
+
+f = NSmapping(U, V, ("x","y","x","z"))
+print("f =", f)
+print(f"f è iniettiva ? {f.isInjective()}   suriettiva ? {f.isSurjective()}   biettiva ? {f.isBijective()}")
+
+B1 = NSset(V, "(0.6,0.3,0.2), (0.1,0.2,0.7), (0.4,0.4,0.5)")
+B2 = NSset(V, "(0.2,0.5,0.4), (0.3,0.3,0.3), (0.8,0.1,0.1)")
+T2 = NSfamily(B1, B2).getNSTopologyBySubBase()
+print(f"T2 è una topologia neutrosofica su V con {T2.cardinality()} aperti ? {T2.isNeutrosophicTopology()}")
+
+# la topologia delle controimmagini rende f continua
+T1 = f.NScounterimageFamily(T2)
+print(f"T1 è una topologia neutrosofica su U con {T1.cardinality()} aperti ? {T1.isNeutrosophicTopology()}")
+print(f"f: (U,T1) -> (V,T2) è continua ? {f.isNScontinuous(T1, T2)}")
+
+# la topologia indiscreta del dominio non rende f continua
+E = NSset(U)
+A = NSset(U)
+A.setAbsolute()
+T0 = NSfamily(E, A)
+print(f"f: (U,T0) -> (V,T2) è continua ? {f.isNScontinuous(T0, T2)}")
+print("controesempio:", f.NScontinuityCounterexample(T0, T2))
+print(f"f: (U,T0) -> (V,T2) è aperta ? {f.isNSopen(T0, T2)}")
+
+# l'identità è un omeomorfismo di ogni spazio topologico neutrosofico in sé
+i = NSmapping(U, U, ("a","b","c","d"))
+print(f"l'identità di (U,T1) è un omeomorfismo ? {i.isNShomeomorphism(T1, T1)}")
+print(f"l'identità: (U,T1) -> (U,T0) è un omeomorfismo ? {i.isNShomeomorphism(T1, T0)}")
+print("controesempio all'apertura:", i.NSopennessCounterexample(T1, T0))
@@ -0,0 +1,34 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+packed representation of a neutrosophic family as a single array of degrees
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+A3 = A1 & A2
+F = NSfamily(A1, A2, A3)
+print("F =", F)
+
+P = F.pack()
+print(f"la famiglia impacchettata contiene {P.cardinality()} insiemi in {P.nbytes()} byte")
+print("secondo insieme:", P[1])
+
+print("complementari:", NSfamily(P.complement()))
+print(f"coincidono con quelli della famiglia ?  {NSfamily(P.complement()) == F.complement()}")
+print("unioni a due a due:", NSfamily(P.pairwiseUnions()))
+print("intersezioni a due a due:", NSfamily(P.pairwiseIntersections()))
+
+print("matrice delle inclusioni:")
+for (A, row) in zip(P, P.subsetMatrix()):
+    print(f"  {A.getName():>8} ⊆ ", ["1" if inclusion else "0" for inclusion in row])
+print(f"A1 ∩ A2 ⊆ A2 ?  {P.isSubset(2, 1)}")
@@ -0,0 +1,33 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+inclusion order of a neutrosophic family: Hasse diagram, minimal and maximal elements and maximal chains
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+T = NSfamily(A1, A2).getNSTopologyBySubBase()
+print("T =", T)
+
+print("diagramma di Hasse (B ricopre A):")
+for (A, B) in T.getNSHasseDiagram():
+    print(f"  {A.getName()}  ⋖  {B.getName()}")
+
+print("elementi minimali:", [A.getName() for A in T.getNSMinimalElements()])
+print("elementi massimali:", [A.getName() for A in T.getNSMaximalElements()])
+print("ricoprimenti superiori di A1:", [A.getName() for A in T.getNSUpperCovers(A1)])
+print("ricoprimenti inferiori di A1:", [A.getName() for A in T.getNSLowerCovers(A1)])
+
+print("catene massimali:")
+for chain in T.NSmaximalChains():
+    print("  " + " ⊆ ".join(A.getName() for A in chain))
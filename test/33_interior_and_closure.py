@@ -0,0 +1,34 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic interior and closure of neutrosophic sets in a neutrosophic topological space
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+T = NSfamily(A1, A2).getNSTopologyBySubBase()
+print("T =", T)
+
+S = NSset(U, "(0.5,0.4,0.2), (0.9,0.5,0.3), (0.5,0.5,0.2)")
+S.storeName()
+print("S =", S)
+I = T.NSinterior(S)
+print(f"interno di S = {I.getName()} = {I}")
+C = T.NSclosure(S)
+print(f"chiusura di S = {C.getName()} = {C}")
+print(f"int(S) ⊆ S ⊆ cl(S) ?  {I.isNSsubset(S) and S.isNSsubset(C)}")
+
+# gli aperti coincidono con il proprio interno
+print(f"ogni aperto coincide con il suo interno ?  {all(T.NSinterior(G) == G for G in T)}")
+# la chiusura di un chiuso coincide con il chiuso stesso
+print(f"ogni chiuso coincide con la sua chiusura ?  {all(T.NSclosure(~G) == ~G for G in T)}")
@@ -0,0 +1,26 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+minimal base of a neutrosophic topology formed by its join-irreducible open sets
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+A3 = NSset(U, "(0.3,0.5,0.5), (0.2,0.6,0.4), (0.4,0.1,0.6)")
+A3.storeName()
+T = NSfamily(A1, A2, A3).getNSTopologyBySubBase()
+print(f"la topologia generata da A1, A2, A3 ha {T.cardinality()} aperti")
+
+B = T.getNSMinimalBase()
+print(f"la base minima ha {B.cardinality()} aperti:", [G.getName() for G in B])
+print(f"la base minima genera la topologia ?  {B.getNSTopologyByBase() == T}")
@@ -0,0 +1,28 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+incremental extension of a neutrosophic topology by adding a set to its subbase
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+A3 = NSset(U, "(0.3,0.5,0.5), (0.2,0.6,0.4), (0.4,0.1,0.6)")
+A3.storeName()
+
+T = NSfamily(A1, A2).getNSTopologyBySubBase()
+print(f"la topologia generata da A1, A2 ha {T.cardinality()} aperti")
+T3 = T.extendWith(A3)
+print(f"aggiungendo A3 si ottengono {T3.cardinality()} aperti:", [G.getName() for G in T3])
+print(f"coincide con la topologia generata da A1, A2, A3 ?  {T3 == NSfamily(A1, A2, A3).getNSTopologyBySubBase()}")
+print(f"è una topologia neutrosofica ?  {T3.isNeutrosophicTopology()}")
+print(f"aggiungendo un aperto la topologia non cambia ?  {T3.extendWith(A1 & A3) == T3}")
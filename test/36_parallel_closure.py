@@ -0,0 +1,39 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+verification of the axioms of a neutrosophic topology by a pool of parallel processes
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from concurrent.futures import ProcessPoolExecutor
+
+# i processi di lavoro possono reimportare lo script, per cui il codice va protetto
+if __name__ == "__main__":
+    # le famiglie piccole vengono verificate in un unico processo: qui si forza la verifica parallela
+    NSfamily.parallelthreshold = 0
+    U = NSuniverse("a,b,c")
+    U.storeName()
+    A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+    A1.storeName()
+    A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+    A2.storeName()
+    A3 = NSset(U, "(0.3,0.5,0.5), (0.2,0.6,0.4), (0.4,0.1,0.6)")
+    A3.storeName()
+    T = NSfamily(A1, A2, A3).getNSTopologyBySubBase()
+    print(f"T ha {T.cardinality()} aperti")
+    print(f"T è una topologia neutrosofica (4 processi) ?  {T.isNeutrosophicTopology(workers=4)}")
+
+    # famiglia non chiusa rispetto all'unione: viene restituito il primo controesempio trovato da un processo
+    F = NSfamily([G for G in T if G.getName() != "A1 ∪ A2"])
+    counterexample = F.NSunionCounterexample(workers=4)
+    print(f"è stato trovato un controesempio ?  {counterexample is not None}")
+    print(f"l'unione dei suoi insiemi non appartiene alla famiglia ?  {(counterexample[0] + counterexample[1]) not in F}")
+
+    # un esecutore già esistente può essere riutilizzato per più verifiche
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        print(f"F è chiusa rispetto all'intersezione ?  {F.NSintersectionClosed(executor=executor)}")
+        print(f"F è chiusa rispetto all'unione ?  {F.NSunionClosed(executor=executor)}")
@@ -0,0 +1,39 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+structured report of the verification of the closure of a neutrosophic family
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+T = NSfamily(A1, A2).getNSTopologyBySubBase()
+
+# resoconto di una verifica positiva
+report = T.isNeutrosophicTopology(report=True)
+print(f"T è una topologia neutrosofica ?  {bool(report)}")
+print(f"operazione: {report.getOperation()},  combinazioni esaminate: {report.getExamined()} / {report.getTotal()}")
+print(f"controesempio: {report.getCombination()}")
+
+# famiglia non chiusa rispetto all'unione: il resoconto contiene la combinazione e l'insieme mancante
+F = NSfamily([G for G in T if G.getName() != "A1 ∪ A2"])
+report = F.NSunionClosed(report=True)
+print(f"\nF è chiusa rispetto all'unione ?  {report.isClosed()}")
+print(f"insiemi del controesempio: {[A.getName() for A in report.getCombination()]}")
+print(f"unione mancante: {report.getResult()}")
+print(f"combinazioni esaminate: {report.getExamined()} / {report.getTotal()}")
+
+# senza l'insieme vuoto manca l'unione della combinazione vuota
+E = NSfamily([G for G in T if G != NSset.EMPTY(U)])
+report = E.isNeutrosophicTopology(report=True)
+print(f"\nE è una topologia neutrosofica ?  {report.isClosed()}")
+print(f"operazione: {report.getOperation()},  controesempio: {report.getCombination()},  insieme mancante: {report.getResult()}")
@@ -0,0 +1,32 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+progress and timing events of the verification of a neutrosophic topology sent to user hooks
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from NS.pyns.ns_progress import NSprogress
+
+U = NSuniverse("a,b,c")
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A3 = NSset(U, "(0.3,0.5,0.5), (0.2,0.6,0.4), (0.4,0.1,0.6)")
+T = NSfamily(A1, A2, A3).getNSTopologyBySubBase()
+print(f"T ha {T.cardinality()} aperti")
+
+# le funzioni di notifica ricevono eventi strutturati: qui vengono solo raccolti
+events = list()
+progress = NSprogress(events.append, events.append, every=50)
+print(f"T è una topologia neutrosofica ?  {T.isNeutrosophicTopology(progress=progress)}")
+for event in events:
+    print(f"{event.kind:>8} {event.operation:>12}: {event.step:3} / {event.total}   esito: {event.success}"
+          f"   velocità non negativa: {event.rate >= 0}")
+
+# un evento di avanzamento al più ogni secondo e un evento di tempo alla fine
+events.clear()
+T.NSunionClosed(progress=NSprogress(events.append, events.append, every=10, interval=1.0))
+print(f"\neventi ricevuti: {[event.kind for event in events]}, ultimo passo: {events[-1].step}")
@@ -0,0 +1,32 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+deferred labels of the neutrosophic sets of generated bases and topologies
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+A3 = NSset(U, "(0.3,0.5,0.5), (0.2,0.6,0.4), (0.4,0.1,0.6)")
+A3.storeName()
+B = NSfamily(A1, A2, A3).getNSBase()
+T = B.getNSTopologyByBase()
+
+# le etichette degli insiemi generati vengono costruite solo quando sono richieste
+G = list(T)[-2]
+print(f"etichetta memorizzata: {type(G.getLabel()).__name__}")
+print(f"nome: {G.getName()}")
+print(f"etichetta dopo la richiesta del nome: {type(G.getLabel()).__name__}")
+
+# la stampa costruisce le etichette di tutti gli insiemi
+print(f"\nbase:\n{B}")
+print(f"\ntopologia:\n{T}")
@@ -0,0 +1,27 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+conversion of strings of triples into neutrosophic sets and errors reported with their offset
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_util import NSstringToDegrees
+
+U = NSuniverse("a,b,c")
+
+# le triple possono essere racchiuse tra parentesi tonde o quadre e separate da virgole o punti e virgola
+A = NSset(U, "(0.4,0.4,0.3); [0.1, 0.1, 0.1]; (0.2,0.2,0.2)")
+print(f"A = {A}")
+print(f"gradi: {NSstringToDegrees('(0.4,0.4,0.3), [0.1,0.1,0.1]').tolist()}")
+
+# le triple non corrette vengono segnalate con la loro posizione nella stringa
+for text in ["(0.4,0.4,0.3), (0.1,zero,0.1), (0.2,0.2,0.2)",
+             "(0.4,0.4,0.3), (0.1,0.1), (0.2,0.2,0.2)",
+             "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2"]:
+    try:
+        NSset(U, text)
+    except (ValueError, IndexError) as error:
+        print(f"{type(error).__name__}: {error}")
@@ -0,0 +1,41 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+reading and writing neutrosophic sets and families from and to CSV/TSV files
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from tempfile import TemporaryDirectory
+from os.path import join
+
+U = NSuniverse("a,b,c")
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+
+with TemporaryDirectory() as folder:
+    # un insieme neutrosofico per file, una riga (elemento, mu, sigma, omega) per ogni elemento
+    path = join(folder, "A1.csv")
+    A1.toCSV(path)
+    with open(path, encoding="utf-8") as file:
+        print(file.read())
+    B = NSset.fromCSV(path)
+    print(f"insieme letto: {B}")
+    print(f"coincide con A1 ?  {B == A1}")
+
+    # più insiemi neutrosofici nelle colonne dello stesso file TSV
+    path = join(folder, "family.tsv")
+    NSfamily(A1, A2).toCSV(path)
+    F = NSfamily.fromCSV(path)
+    print(f"\nfamiglia letta:\n{F}")
+
+    # un file senza intestazione
+    path = join(folder, "plain.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("x,0.5,0.5,0.5\ny,1,0,0\n")
+    print(f"\ninsieme senza intestazione: {NSset.fromCSV(path)}")
@@ -0,0 +1,62 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+saving and loading neutrosophic sets, families and mappings in the binary format
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from NS.pyns.ns_mapping import NSmapping
+from NS.pyns.ns_io import NSsave, NSload
+from tempfile import TemporaryDirectory
+from os.path import join
+import gc
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+V = NSuniverse("x,y")
+f = NSmapping(U, V, "x y x")
+f.storeName()
+
+with TemporaryDirectory() as folder:
+    # insieme neutrosofico: i gradi vengono conservati senza perdita di precisione
+    A = NSset(U, [(1 / 3, 2 / 3, 0.1), (0, 0, 1), (1, 1, 0)])
+    NSsave(A, join(folder, "A.pyns"))
+    B = NSload(join(folder, "A.pyns"))
+    print(f"insieme caricato: {B}")
+    print(f"gradi identici ?  {B.getStorage().get() == A.getStorage().get()}")
+
+    # famiglia neutrosofica, caricata anche impacchettata o aperta sulla mappatura in memoria del file
+    NSsave(NSfamily(A1, A2), join(folder, "F.pyns"))
+    F = NSload(join(folder, "F.pyns"))
+    print(f"\nfamiglia caricata sull'universo {F.getUniverse().getName()}:\n{F}")
+    M = NSload(join(folder, "F.pyns"), mmap=True)
+    print(f"famiglia aperta sul file di {M.cardinality()} insiemi: {M.getNames()}, A1 vi appartiene ?  {A1 in M}")
+    M.close()
+    P = NSload(join(folder, "F.pyns"), packed=True)
+    print(f"famiglia impacchettata di {P.cardinality()} insiemi: {P.getNames()}")
+
+    # funzione tra universi, memorizzata come array di posizioni nel codominio
+    NSsave(f, join(folder, "f.pyns"))
+    g = NSload(join(folder, "f.pyns"))
+    print(f"\nfunzione caricata: {g.getName()} = {g}")
+    print(f"coincide con f ?  {g == f}")
+
+    # una famiglia grande aperta sul file non crea un oggetto NSset per ogni insieme
+    X = NSuniverse([f"x{i}" for i in range(100)])
+    NSsave(NSfamily([NSset(X, [(i / 5000, 0, 1 - i / 5000)] * 100) for i in range(5000)]), join(folder, "G.pyns"))
+    gc.collect()
+    before = sum(type(obj) == NSset for obj in gc.get_objects())
+    G = NSload(join(folder, "G.pyns"), mmap=True)
+    created = sum(type(obj) == NSset for obj in gc.get_objects()) - before
+    print(f"\nfamiglia di {G.cardinality()} insiemi aperta creando {created} oggetti NSset")
+    print(f"l'ultimo insieme ha grado di appartenenza {G[-1].getMembership('x0')} in x0")
+    print(f"l'insieme di gradi (0.5,0,0.5) appartiene alla famiglia ?  {NSset(X, [(0.5, 0, 0.5)] * 100) in G}")
+    G.close()
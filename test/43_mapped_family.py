@@ -0,0 +1,59 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+out-of-core family of neutrosophic sets whose degrees are kept in a memory-mapped file
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from NS.pyns.ns_mappedfamily import NSmappedfamily
+from NS.pyns.ns_io import NSsave, NSload
+from tempfile import TemporaryDirectory
+from os.path import join, exists
+
+U = NSuniverse("a,b,c")
+U.storeName()
+A1 = NSset(U, "(0.4,0.4,0.3), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+A1.storeName()
+A2 = NSset(U, "(0.1,0.2,0.9), (0.9,0.1,0.3), (0.5,0.3,0.4)")
+A2.storeName()
+A3 = NSset(U, "(0.3,0.5,0.5), (0.2,0.6,0.4), (0.4,0.1,0.6)")
+A3.storeName()
+B = NSfamily(A1, A2, A3).getNSBase()
+
+# gli aperti vengono scritti nel file man mano che sono prodotti
+with NSmappedfamily(U) as T:
+    B.getNSTopologyByBase(target=T)
+    print(f"la topologia ha {T.cardinality()} aperti che occupano {T.nbytes()} byte nel file")
+    print(f"primi aperti: {T.getNames()[:5]}")
+    print(f"A1 ∪ A2 è un aperto ?  {(A1 + A2) in T}")
+    print(f"~A1 è un aperto ?  {~A1 in T}")
+    print(f"T è una topologia neutrosofica ?  {T.isNeutrosophicTopology()}")
+
+    # l'indice viene ricostruito quando cambia la precisione delle uguaglianze
+    D = NSset(U, "(0.41,0.42,0.29), (0.1,0.1,0.1), (0.2,0.2,0.2)")
+    NSset.precisionequality = 1
+    print(f"D è un aperto con una cifra decimale ?  {D in T}")
+    NSset.precisionequality = 9
+    print(f"D è un aperto con nove cifre decimali ?  {D in T}")
+
+    # un insieme già presente non viene aggiunto di nuovo
+    print(f"\nA1 aggiunto di nuovo ?  {T.append(A1)}")
+    print(f"~A1 aggiunto ?  {T.append(~A1)}")
+    report = T.NSintersectionClosed(report=True)
+    print(f"T è chiusa rispetto all'intersezione ?  {report.isClosed()}")
+    print(f"controesempio: {[A.getName() for A in report.getCombination()]}")
+
+# il file indicato esplicitamente contiene solo i gradi e viene eliminato alla chiusura:
+# la famiglia si conserva salvandola in formato binario
+with TemporaryDirectory() as folder:
+    path = join(folder, "scratch.bin")
+    with NSmappedfamily(U, path=path) as M:
+        M.extend(B)
+        NSsave(M, join(folder, "B.pyns"))
+    print(f"\nil file di appoggio esiste ancora ?  {exists(path)}")
+    S = NSload(join(folder, "B.pyns"))
+    print(f"la base salvata ha {S.cardinality()} insiemi e coincide con B ?  {S == B}")
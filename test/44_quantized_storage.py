@@ -0,0 +1,53 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+quantized storage of the degrees as fixed-point unsigned integers (uint16 or uint8)
+"""
+import os
+import tempfile
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_family import NSfamily
+from NS.pyns.ns_io import NSsave, NSload
+
+U = NSuniverse("a,b,c")
+A = NSset(U, "(0.4,0.25,0.3), (0.1,0.7,0.125), (0.2,0.2,0.9)")
+print(f"A = {A} occupa {A.getStorage().nbytes()} byte con gradi float64")
+key = A.key()
+
+# gradi a virgola fissa con 4 cifre decimali (uint16)
+A = NSset(U, "(0.4,0.25,0.3), (0.1,0.7,0.125), (0.2,0.2,0.9)", typecode="H")
+A.storeName()
+B = NSset(U, [(0.5, 0.1, 0.2), (0.05, 0.9, 0.6), (0.3, 0.1, 0.35)], typecode="H")
+B.storeName()
+print(f"A = {A} occupa {A.getStorage().nbytes()} byte con gradi uint16")
+print("gradi memorizzati:", A.getStorage().get().tolist())
+print(f"la chiave coincide con quella dei gradi float64 ?  {A.key() == key}")
+print("A ∪ B =", A + B)
+print("A ∩ B =", A & B)
+print("complementare di A =", ~A)
+print("A \\ B =", A - B)
+print(f"il complementare del complementare è A ?  {~~A == A}")
+print("grado di appartenenza di b in A:", A.getMembership("b"))
+A.setMembership("b", 0.35)
+print("dopo la modifica A =", A)
+
+F = NSfamily(A, B, A + B, NSset(A))
+print(f"la famiglia ha {F.cardinality()} insiemi distinti:", F)
+T = F.getNSTopologyBySubBase()
+print(f"la topologia generata ha {T.cardinality()} aperti ed è una topologia ?  {T.isNeutrosophicTopology()}")
+
+path = os.path.join(tempfile.mkdtemp(), "topology.pyns")
+NSsave(T, path)
+S = NSload(path)   # i gradi riletti conservano il tipo con cui sono stati salvati
+print(f"riletta coincide ?  {S == T}  tipo dei gradi: {S.pack().get().typecode}")
+E = NSset(U, "(0.4,0.25,0.3), (0.35,0.7,0.125), (0.2,0.2,0.9)")   # gradi float64
+print(f"l'insieme con gradi float64 appartiene alla topologia riletta ?  {E in S}")
+
+# gradi a virgola fissa con 2 cifre decimali (uint8)
+C = NSset(U, "(0.4,0.25,0.3), (0.1,0.7,0.125), (0.2,0.2,0.9)", typecode="B")
+print(f"C = {C} occupa {C.getStorage().nbytes()} byte con gradi uint8 (arrotondati a 2 cifre decimali)")
+print(f"C convertito in float64 occupa {NSset(C, typecode='d').getStorage().nbytes()} byte")